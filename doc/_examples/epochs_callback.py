@@ -0,0 +1,15 @@
+def callback(
+    data: NDArray[...], events: NDArray[np.int64], timestamps: NDArray[np.float64]
+) -> None:
+    """A callback function called on new epochs.
+
+    Parameters
+    ----------
+    data : NDArray[...]
+        Data array of shape (n_epochs, n_channels, n_samples).
+    events : NDArray[np.int64]
+        Event code array of shape (n_epochs,).
+    timestamps : NDArray[np.float64]
+        Timestamp array of shape (n_epochs,) of the events.
+    """
+    # implement your callback function here, e.g. run a classifier on the new epochs
@@ -1,4 +1,5 @@
 from . import datasets, lsl, player, stream, utils
 from ._version import __version__
+from .utils._time import set_sleep_strategy
 from .utils.config import sys_info
 from .utils.logs import add_file_handler, set_log_level
@@ -4,6 +4,7 @@ from . import player as player
 from . import stream as stream
 from . import utils as utils
 from ._version import __version__ as __version__
+from .utils._time import set_sleep_strategy as set_sleep_strategy
 from .utils.config import sys_info as sys_info
 from .utils.logs import add_file_handler as add_file_handler
 from .utils.logs import set_log_level as set_log_level
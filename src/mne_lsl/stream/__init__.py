@@ -1,4 +1,6 @@
-from . import base, epochs, stream_lsl
+from . import base, epochs, reader, scheduler, stream_lsl
 from .base import BaseStream
 from .epochs import EpochsStream
+from .reader import StreamReader
+from .scheduler import AcquisitionScheduler
 from .stream_lsl import StreamLSL
@@ -1,6 +1,10 @@
 from . import base as base
 from . import epochs as epochs
+from . import reader as reader
+from . import scheduler as scheduler
 from . import stream_lsl as stream_lsl
 from .base import BaseStream as BaseStream
 from .epochs import EpochsStream as EpochsStream
+from .reader import StreamReader as StreamReader
+from .scheduler import AcquisitionScheduler as AcquisitionScheduler
 from .stream_lsl import StreamLSL as StreamLSL
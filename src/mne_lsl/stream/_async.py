@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Event
+
+
+class AsyncNotifier:
+    """Wake up the asyncio iterators waiting for new data from the acquisition thread.
+
+    Each iterator registers an :class:`asyncio.Event` with its running event loop. The
+    acquisition thread sets the events with
+    :meth:`asyncio.loop.call_soon_threadsafe`, thus the event loops never poll the
+    buffers and the acquisition thread never blocks on an event loop. Without
+    registered iterators, a notification is a single check of an empty container.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._waiters: dict[Event, AbstractEventLoop] = dict()
+
+    def add(self, loop: AbstractEventLoop, event: Event) -> None:
+        """Register an event set on new data from the thread running ``loop``."""
+        with self._lock:
+            self._waiters[event] = loop
+
+    def notify(self) -> None:
+        """Set the registered events, called from the acquisition thread."""
+        if len(self._waiters) == 0:
+            return
+        with self._lock:
+            waiters = list(self._waiters.items())
+        for event, loop in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # pragma: no cover
+                pass  # the event loop is closed
+
+    def remove(self, event: Event) -> None:
+        """Unregister an event."""
+        with self._lock:
+            self._waiters.pop(event, None)
@@ -0,0 +1,26 @@
+from asyncio import AbstractEventLoop, Event
+
+from _typeshed import Incomplete
+
+class AsyncNotifier:
+    """Wake up the asyncio iterators waiting for new data from the acquisition thread.
+
+    Each iterator registers an :class:`asyncio.Event` with its running event loop. The
+    acquisition thread sets the events with
+    :meth:`asyncio.loop.call_soon_threadsafe`, thus the event loops never poll the
+    buffers and the acquisition thread never blocks on an event loop. Without
+    registered iterators, a notification is a single check of an empty container.
+    """
+
+    _lock: Incomplete
+    _waiters: dict[Event, AbstractEventLoop]
+
+    def __init__(self) -> None: ...
+    def add(self, loop: AbstractEventLoop, event: Event) -> None:
+        """Register an event set on new data from the thread running ``loop``."""
+
+    def notify(self) -> None:
+        """Set the registered events, called from the acquisition thread."""
+
+    def remove(self, event: Event) -> None:
+        """Unregister an event."""
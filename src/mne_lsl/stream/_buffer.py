@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..utils._checks import check_type
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+    from .._typing import ScalarIntArray
+
+
+def check_out_array(
+    out: NDArray, shape: tuple[int, ...], dtype: DTypeLike, name: str
+) -> None:
+    """Check that a pre-allocated output array matches the requested data.
+
+    Parameters
+    ----------
+    out : array
+        The pre-allocated array provided by the user.
+    shape : tuple of int
+        The expected shape.
+    dtype : dtype
+        The expected dtype.
+    name : str
+        Name of the argument, used in the error messages.
+    """
+    check_type(out, (np.ndarray,), name)
+    if out.shape != shape:
+        raise ValueError(
+            f"The argument '{name}' must be an array of shape {shape}. "
+            f"The provided array has a shape {out.shape}."
+        )
+    if out.dtype != dtype:
+        raise ValueError(
+            f"The argument '{name}' must be an array of dtype {np.dtype(dtype)}. "
+            f"The provided array has a dtype {out.dtype}."
+        )
+    if not out.flags.writeable:
+        raise ValueError(f"The argument '{name}' must be a writeable array.")
+
+
+def write_ring_buffer(buffer: NDArray, data: NDArray, start: int) -> None:
+    """Write samples in-place in a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, ...)
+        Circular buffer, written along the first axis.
+    data : array of shape (n_samples, ...)
+        Samples to write. ``n_samples`` must not exceed ``n_buffer``.
+    start : int
+        Absolute position of the first sample of ``data``, i.e. the number of samples
+        written to the buffer before this call. The position in the buffer is
+        ``start % n_buffer``.
+
+    Notes
+    -----
+    The samples are written with at most 2 slice assignments, thus the cost of a write
+    scales with the number of samples written instead of with the buffer size.
+    """
+    n_buffer = buffer.shape[0]
+    n_samples = data.shape[0]
+    assert n_samples <= n_buffer  # sanity-check
+    idx = start % n_buffer
+    stop = idx + n_samples
+    if stop <= n_buffer:
+        buffer[idx:stop] = data
+    else:
+        n_end = n_buffer - idx
+        buffer[idx:] = data[:n_end]
+        buffer[: n_samples - n_end] = data[n_end:]
+
+
+def read_ring_buffer(
+    buffer: NDArray,
+    stop: int,
+    n_samples: int,
+    picks: ScalarIntArray | None = None,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Read consecutive samples from a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, ...)
+        Circular buffer, read along the first axis.
+    stop : int
+        Absolute position following the last sample to read. To read the most recent
+        samples, ``stop`` is the number of samples written to the buffer.
+    n_samples : int
+        Number of samples to read, ending at ``stop``. If larger than the buffer size,
+        the entire buffer is read.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+    out : array of shape (n_samples, ...) | None
+        If provided, the samples are written in this array instead of a new array. The
+        array can be a non-contiguous view, e.g. the transpose of a C-contiguous
+        array.
+
+    Returns
+    -------
+    data : array of shape (n_samples, ...)
+        Copy of the selected samples, in chronological order. If ``out`` is provided,
+        ``out`` is returned.
+    """
+    n_buffer = buffer.shape[0]
+    n_samples = min(n_samples, n_buffer)
+    idx = stop % n_buffer
+    start = idx - n_samples  # negative if the window wraps around the buffer end
+    if out is not None:
+        if 0 <= start:
+            take_picks(buffer[start:idx], picks, out)
+        else:
+            take_picks(buffer[start:], picks, out[:-start])
+            take_picks(buffer[:idx], picks, out[-start:])
+        return out
+    if picks is not None and _is_contiguous(picks):
+        picks = slice(picks[0], picks[-1] + 1)  # basic indexing is faster
+    if 0 <= start:
+        data = buffer[start:idx]
+        if picks is None:
+            return data.copy()
+        elif isinstance(picks, slice):
+            # basic indexing returns a view on the buffer, which is written in-place
+            return data[..., picks].copy()
+        return data[..., picks]
+    if picks is None:
+        return np.concatenate((buffer[start:], buffer[:idx]))
+    return np.concatenate((buffer[start:, ..., picks], buffer[:idx, ..., picks]))
+
+
+def read_ring_buffer_windows(
+    buffer: NDArray,
+    stops: ScalarIntArray,
+    n_samples: int,
+    picks: ScalarIntArray | None = None,
+) -> NDArray:
+    """Read windows of consecutive samples from a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, n_elements)
+        Circular buffer, read along the first axis.
+    stops : array of int of shape (n_windows,)
+        Absolute position following the last sample of each window.
+    n_samples : int
+        Number of samples in each window. ``n_samples`` must not exceed ``n_buffer``.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+
+    Returns
+    -------
+    data : array of shape (n_windows, n_samples, n_picks)
+        Copy of the selected samples of each window, in chronological order.
+
+    Notes
+    -----
+    The windows are gathered at once with the positions of their samples in the
+    buffer, which handles the windows wrapping around the end of the buffer without
+    concatenation. A contiguous selection is applied with a slice in the same gather.
+    """
+    assert n_samples <= buffer.shape[0]  # sanity-check
+    if stops.size == 1:  # a single window is read with at most 2 slices
+        return read_ring_buffer(buffer, stops[0], n_samples, picks)[np.newaxis]
+    idx = stops[:, np.newaxis] - n_samples + np.arange(n_samples)
+    idx %= buffer.shape[0]
+    if picks is None:
+        return np.take(buffer, idx, axis=0)
+    if _is_contiguous(picks):
+        return buffer[idx, picks[0] : picks[-1] + 1]
+    return np.take(buffer, idx, axis=0)[..., picks]
+
+
+def take_picks(data: NDArray, picks: ScalarIntArray | None, out: NDArray) -> None:
+    """Copy a selection of elements along the last axis without intermediate array.
+
+    Parameters
+    ----------
+    data : array of shape (..., n_elements)
+        Array from which elements are selected along the last axis.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+    out : array of shape (..., n_picks)
+        Array in which the selected elements are written.
+
+    Notes
+    -----
+    Fancy indexing allocates a new array, thus the selection is split in runs of
+    consecutive elements, each copied with a basic slice. Contiguous selections, e.g.
+    all the channels of a given type, are copied in a single operation.
+    """
+    if picks is None:
+        np.copyto(out, data)
+        return
+    if picks.size == 0:
+        return
+    breaks = np.flatnonzero(np.diff(picks) != 1) + 1
+    for start, stop in zip(
+        np.concatenate(([0], breaks)),
+        np.concatenate((breaks, [picks.size])),
+        strict=True,
+    ):
+        out[..., start:stop] = data[..., picks[start] : picks[stop - 1] + 1]
+
+
+def _is_contiguous(picks: ScalarIntArray) -> bool:
+    """Check if a selection is made of consecutive elements."""
+    return picks.size != 0 and bool(np.all(np.diff(picks) == 1))
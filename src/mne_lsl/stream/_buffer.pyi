@@ -0,0 +1,130 @@
+from numpy.typing import DTypeLike, NDArray
+
+from .._typing import ScalarIntArray as ScalarIntArray
+from ..utils._checks import check_type as check_type
+
+def check_out_array(
+    out: NDArray, shape: tuple[int, ...], dtype: DTypeLike, name: str
+) -> None:
+    """Check that a pre-allocated output array matches the requested data.
+
+    Parameters
+    ----------
+    out : array
+        The pre-allocated array provided by the user.
+    shape : tuple of int
+        The expected shape.
+    dtype : dtype
+        The expected dtype.
+    name : str
+        Name of the argument, used in the error messages.
+    """
+
+def write_ring_buffer(buffer: NDArray, data: NDArray, start: int) -> None:
+    """Write samples in-place in a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, ...)
+        Circular buffer, written along the first axis.
+    data : array of shape (n_samples, ...)
+        Samples to write. ``n_samples`` must not exceed ``n_buffer``.
+    start : int
+        Absolute position of the first sample of ``data``, i.e. the number of samples
+        written to the buffer before this call. The position in the buffer is
+        ``start % n_buffer``.
+
+    Notes
+    -----
+    The samples are written with at most 2 slice assignments, thus the cost of a write
+    scales with the number of samples written instead of with the buffer size.
+    """
+
+def read_ring_buffer(
+    buffer: NDArray,
+    stop: int,
+    n_samples: int,
+    picks: ScalarIntArray | None = None,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Read consecutive samples from a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, ...)
+        Circular buffer, read along the first axis.
+    stop : int
+        Absolute position following the last sample to read. To read the most recent
+        samples, ``stop`` is the number of samples written to the buffer.
+    n_samples : int
+        Number of samples to read, ending at ``stop``. If larger than the buffer size,
+        the entire buffer is read.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+    out : array of shape (n_samples, ...) | None
+        If provided, the samples are written in this array instead of a new array. The
+        array can be a non-contiguous view, e.g. the transpose of a C-contiguous
+        array.
+
+    Returns
+    -------
+    data : array of shape (n_samples, ...)
+        Copy of the selected samples, in chronological order. If ``out`` is provided,
+        ``out`` is returned.
+    """
+
+def read_ring_buffer_windows(
+    buffer: NDArray,
+    stops: ScalarIntArray,
+    n_samples: int,
+    picks: ScalarIntArray | None = None,
+) -> NDArray:
+    """Read windows of consecutive samples from a circular buffer.
+
+    Parameters
+    ----------
+    buffer : array of shape (n_buffer, n_elements)
+        Circular buffer, read along the first axis.
+    stops : array of int of shape (n_windows,)
+        Absolute position following the last sample of each window.
+    n_samples : int
+        Number of samples in each window. ``n_samples`` must not exceed ``n_buffer``.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+
+    Returns
+    -------
+    data : array of shape (n_windows, n_samples, n_picks)
+        Copy of the selected samples of each window, in chronological order.
+
+    Notes
+    -----
+    The windows are gathered at once with the positions of their samples in the
+    buffer, which handles the windows wrapping around the end of the buffer without
+    concatenation. A contiguous selection is applied with a slice in the same gather.
+    """
+
+def take_picks(data: NDArray, picks: ScalarIntArray | None, out: NDArray) -> None:
+    """Copy a selection of elements along the last axis without intermediate array.
+
+    Parameters
+    ----------
+    data : array of shape (..., n_elements)
+        Array from which elements are selected along the last axis.
+    picks : array of int | None
+        Selection of elements along the last axis. If ``None``, all elements are
+        selected.
+    out : array of shape (..., n_picks)
+        Array in which the selected elements are written.
+
+    Notes
+    -----
+    Fancy indexing allocates a new array, thus the selection is split in runs of
+    consecutive elements, each copied with a basic slice. Contiguous selections, e.g.
+    all the channels of a given type, are copied in a single operation.
+    """
+
+def _is_contiguous(picks: ScalarIntArray) -> bool:
+    """Check if a selection is made of consecutive elements."""
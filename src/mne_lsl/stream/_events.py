@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from mne.event import _find_unique_events
+
+from ..utils.logs import warn
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .._typing import ScalarArray
+
+
+class StimChannelDetector:
+    """Incremental detection of the event onsets in stim channels.
+
+    The detector keeps the last value of each stim channel between 2 calls, thus each
+    sample is scanned once and an onset on the first new sample is detected. The onsets
+    are the steps to a higher value, as in :func:`mne.find_events` with
+    ``output='onset'`` and ``consecutive='increasing'``. A non-zero value on the first
+    sample scanned is not an onset.
+
+    Parameters
+    ----------
+    ch_names : list of str
+        Name of the stim channels.
+    shortest_event : int
+        Number of samples between 2 onsets of a stim channel below which the events are
+        considered spurious and a warning is issued.
+    """
+
+    def __init__(self, ch_names: list[str], shortest_event: int = 2) -> None:
+        self._ch_names = ch_names
+        self._shortest_event = shortest_event
+        self._last_onsets = np.full(len(ch_names), -shortest_event, dtype=np.int64)
+        self._last_values = None
+
+    def detect(self, data: ScalarArray, start: int) -> NDArray[np.int64]:
+        """Detect the event onsets in new samples.
+
+        Parameters
+        ----------
+        data : array of shape (n_channels, n_samples)
+            New samples of the stim channels.
+        start : int
+            Absolute position of the first new sample in the stream.
+
+        Returns
+        -------
+        events : array of shape (n_events, 3)
+            The events, sorted by onset, with the absolute position of the onset, the
+            value of the stim channel before the onset and the event code.
+        """
+        if data.shape[1] == 0:
+            return np.empty((0, 3), dtype=np.int64)
+        data = np.abs(data.astype(np.int64))
+        if self._last_values is None:
+            previous = data[:, :1]
+        else:
+            previous = self._last_values[:, np.newaxis]
+        values = np.concatenate((previous, data), axis=1)
+        self._last_values = values[:, -1].copy()
+        events_list = []
+        n_short_events = 0
+        for k, ch_values in enumerate(values):
+            idx = np.flatnonzero(ch_values[:-1] < ch_values[1:])
+            if idx.size == 0:
+                continue
+            onsets = idx + start
+            n_short_events += np.count_nonzero(
+                np.diff(onsets, prepend=self._last_onsets[k]) < self._shortest_event
+            )
+            self._last_onsets[k] = onsets[-1]
+            events_list.append(
+                np.vstack((onsets, ch_values[idx], ch_values[idx + 1])).T
+            )
+        if n_short_events > 0:
+            warn(
+                f"You have {n_short_events} events shorter than the shortest_event. "
+                "These are very unusual and you may want to set min_duration to a "
+                "larger value e.g. x / raw.info['sfreq']. Where x = 1 sample shorter "
+                "than the shortest event length."
+            )
+        if len(events_list) == 0:
+            return np.empty((0, 3), dtype=np.int64)
+        events = _find_unique_events(np.concatenate(events_list, axis=0))
+        return events[np.argsort(events[:, 0], kind="stable")]
+
+
+class EventQueue:
+    """Queue of the events waiting for the end of their epoch to be acquired.
+
+    The events are positioned on the samples of the stream by the absolute position of
+    their onset. The events received by timestamp, e.g. from a separate event stream,
+    are held until the stream acquires a sample at or after the event, on which the
+    event is positioned.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples in an epoch.
+    tmin_shift : int
+        Offset in samples between the onset of an event and the first sample of its
+        epoch.
+    """
+
+    def __init__(self, n_samples: int, tmin_shift: int) -> None:
+        self._n_samples = n_samples
+        self._tmin_shift = tmin_shift
+        self._events = np.empty((0, 3), dtype=np.int64)
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._codes = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of events in the queue."""
+        return self._events.shape[0] + self._timestamps.size
+
+    def locate(self, ts: NDArray[np.float64], start: int) -> None:
+        """Position the events received by timestamp on the samples of the stream.
+
+        Parameters
+        ----------
+        ts : array of shape (n_samples,)
+            Timestamps of the latest samples of the stream.
+        start : int
+            Absolute position of the first sample in the stream.
+
+        Notes
+        -----
+        An event is positioned on the first sample at or after its timestamp. The
+        events older than the first sample are dropped.
+        """
+        if self._timestamps.size == 0 or ts.size == 0:
+            return
+        located = self._timestamps <= ts[-1]
+        timestamps = self._timestamps[located]
+        codes = self._codes[located]
+        self._timestamps = self._timestamps[~located]
+        self._codes = self._codes[~located]
+        sel = np.where(ts[0] <= timestamps)[0]
+        idx = np.searchsorted(ts, timestamps[sel], side="left")
+        self.put(
+            np.vstack((start + idx, np.zeros(sel.size, dtype=np.int64), codes[sel])).T
+        )
+
+    def pop(self, n_acquired: int) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Retrieve the events which epoch is acquired.
+
+        Parameters
+        ----------
+        n_acquired : int
+            Number of samples acquired by the stream.
+
+        Returns
+        -------
+        events : array of shape (n_events, 3)
+            The events which epoch is acquired, sorted by onset. The events which epoch
+            starts before the first sample of the stream are dropped.
+        stops : array of shape (n_events,)
+            Absolute position following the last sample of each epoch.
+        """
+        stops = self._events[:, 0] + self._tmin_shift + self._n_samples
+        acquired = stops <= n_acquired
+        events, stops = self._events[acquired], stops[acquired]
+        self._events = self._events[~acquired]
+        sel = np.where(0 <= events[:, 0] + self._tmin_shift)[0]
+        return events[sel], stops[sel]
+
+    def put(self, events: NDArray[np.int64]) -> None:
+        """Add events positioned on the samples of the stream.
+
+        Parameters
+        ----------
+        events : array of shape (n_events, 3)
+            The events, with the absolute position of the onset in the first column.
+        """
+        if events.shape[0] == 0:
+            return
+        events = np.concatenate((self._events, events.astype(np.int64)))
+        self._events = events[np.argsort(events[:, 0], kind="stable")]
+
+    def put_timestamps(
+        self, timestamps: NDArray[np.float64], codes: NDArray[np.int64]
+    ) -> None:
+        """Add events received by timestamp.
+
+        Parameters
+        ----------
+        timestamps : array of shape (n_events,)
+            Timestamps of the events.
+        codes : array of shape (n_events,)
+            Codes of the events.
+        """
+        self._timestamps = np.concatenate((self._timestamps, timestamps))
+        self._codes = np.concatenate((self._codes, codes.astype(np.int64)))
+
+    @property
+    def n_unlocated(self) -> int:
+        """Number of events received by timestamp not yet positioned on a sample."""
+        return self._timestamps.size
@@ -0,0 +1,133 @@
+import numpy as np
+from _typeshed import Incomplete
+from numpy.typing import NDArray
+
+from .._typing import ScalarArray as ScalarArray
+from ..utils.logs import warn as warn
+
+class StimChannelDetector:
+    """Incremental detection of the event onsets in stim channels.
+
+    The detector keeps the last value of each stim channel between 2 calls, thus each
+    sample is scanned once and an onset on the first new sample is detected. The onsets
+    are the steps to a higher value, as in :func:`mne.find_events` with
+    ``output='onset'`` and ``consecutive='increasing'``. A non-zero value on the first
+    sample scanned is not an onset.
+
+    Parameters
+    ----------
+    ch_names : list of str
+        Name of the stim channels.
+    shortest_event : int
+        Number of samples between 2 onsets of a stim channel below which the events are
+        considered spurious and a warning is issued.
+    """
+
+    _ch_names: Incomplete
+    _shortest_event: Incomplete
+    _last_onsets: Incomplete
+    _last_values: Incomplete
+
+    def __init__(self, ch_names: list[str], shortest_event: int = 2) -> None: ...
+    def detect(self, data: ScalarArray, start: int) -> NDArray[np.int64]:
+        """Detect the event onsets in new samples.
+
+        Parameters
+        ----------
+        data : array of shape (n_channels, n_samples)
+            New samples of the stim channels.
+        start : int
+            Absolute position of the first new sample in the stream.
+
+        Returns
+        -------
+        events : array of shape (n_events, 3)
+            The events, sorted by onset, with the absolute position of the onset, the
+            value of the stim channel before the onset and the event code.
+        """
+
+class EventQueue:
+    """Queue of the events waiting for the end of their epoch to be acquired.
+
+    The events are positioned on the samples of the stream by the absolute position of
+    their onset. The events received by timestamp, e.g. from a separate event stream,
+    are held until the stream acquires a sample at or after the event, on which the
+    event is positioned.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples in an epoch.
+    tmin_shift : int
+        Offset in samples between the onset of an event and the first sample of its
+        epoch.
+    """
+
+    _n_samples: Incomplete
+    _tmin_shift: Incomplete
+    _events: Incomplete
+    _timestamps: Incomplete
+    _codes: Incomplete
+
+    def __init__(self, n_samples: int, tmin_shift: int) -> None: ...
+    def __len__(self) -> int:
+        """Return the number of events in the queue."""
+
+    def locate(self, ts: NDArray[np.float64], start: int) -> None:
+        """Position the events received by timestamp on the samples of the stream.
+
+        Parameters
+        ----------
+        ts : array of shape (n_samples,)
+            Timestamps of the latest samples of the stream.
+        start : int
+            Absolute position of the first sample in the stream.
+
+        Notes
+        -----
+        An event is positioned on the first sample at or after its timestamp. The
+        events older than the first sample are dropped.
+        """
+
+    def pop(self, n_acquired: int) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Retrieve the events which epoch is acquired.
+
+        Parameters
+        ----------
+        n_acquired : int
+            Number of samples acquired by the stream.
+
+        Returns
+        -------
+        events : array of shape (n_events, 3)
+            The events which epoch is acquired, sorted by onset. The events which epoch
+            starts before the first sample of the stream are dropped.
+        stops : array of shape (n_events,)
+            Absolute position following the last sample of each epoch.
+        """
+
+    def put(self, events: NDArray[np.int64]) -> None:
+        """Add events positioned on the samples of the stream.
+
+        Parameters
+        ----------
+        events : array of shape (n_events, 3)
+            The events, with the absolute position of the onset in the first column.
+        """
+
+    def put_timestamps(
+        self, timestamps: NDArray[np.float64], codes: NDArray[np.int64]
+    ) -> None:
+        """Add events received by timestamp.
+
+        Parameters
+        ----------
+        timestamps : array of shape (n_events,)
+            Timestamps of the events.
+        codes : array of shape (n_events,)
+            Codes of the events.
+        """
+
+    @property
+    def n_unlocated(self) -> int:
+        """Number of events received by timestamp not yet positioned on a sample."""
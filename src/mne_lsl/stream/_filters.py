@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from threading import Lock
 from typing import TYPE_CHECKING
 
 import numpy as np
 from mne.filter import create_filter as create_filter_mne
-from scipy.signal import sosfilt_zi
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import irfft, next_fast_len, rfft
+from scipy.signal import cheby1, sosfilt, sosfilt_zi
 
 from ..utils._checks import check_type
 from ..utils.logs import logger, warn
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
     from typing import Any
 
+    from numpy.typing import NDArray
+
+    from .._typing import ScalarArray, ScalarIntArray
+
 
 class StreamFilter(dict):
     """Class defining a filter."""
@@ -20,7 +29,7 @@ class StreamFilter(dict):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        if "iir_params" not in self:
+        if "iir_params" not in self and self.get("method", "iir") == "iir":
             warn("The 'iir_params' key is missing, which is unexpected.")
             self["iir_params"] = dict()
         for key in ("ftype", "order"):
@@ -38,10 +47,24 @@ class StreamFilter(dict):
             del self[key]
 
     def __repr__(self):  # noqa: D105
+        if self.get("method", "iir") == "fir":
+            return (
+                f"<FIR causal filter @ ({self['l_freq']}, {self['h_freq']}) Hz "
+                f"({self['h'].size} taps)>"
+            )
         order = self._ORDER_STR.get(
             self["iir_params"]["order"], f"{self['iir_params']['order']}th"
         )
-        if (
+        if isinstance(self["l_freq"], tuple):  # combined notch filters
+            avg = ", ".join(
+                str((lfq + hfq) / 2)
+                for lfq, hfq in zip(self["l_freq"], self["h_freq"], strict=True)
+            )
+            representation = (
+                f"<IIR {order} causal notch filter @ {avg} Hz "
+                f"({self['iir_params']['ftype']})>"
+            )
+        elif (
             any(elt is None for elt in (self["l_freq"], self["h_freq"]))
             or self["l_freq"] < self["h_freq"]
         ):
@@ -89,6 +112,232 @@ class StreamFilter(dict):
         return not self.__eq__(other)
 
 
+class FilterChain:
+    """Cascade of filters applied on the same channels, fused in few stages.
+
+    The second-order sections of consecutive IIR filters are stacked in application
+    order, thus they are applied with a single call to :func:`scipy.signal.sosfilt`.
+    FIR filters are applied one at a time with an overlap-save FFT convolution. The
+    channels are gathered and scattered once for the entire cascade.
+
+    Parameters
+    ----------
+    filters : list of StreamFilter
+        The filters applied on the channels, in application order.
+    picks : array of int
+        The channels on which the filters are applied. All the filters must include
+        those channels.
+    """
+
+    def __init__(self, filters: list[StreamFilter], picks: ScalarIntArray) -> None:
+        self._filters = filters
+        self._picks = picks
+        # group consecutive IIR filters in a single stage and store for each filter the
+        # position of the channels within the channels of the filter, the position of
+        # its states within the states of the stage and the DC gain of the cascade at
+        # the input of the filter.
+        self._stages = list()
+        self._idx = list()
+        self._slots = list()
+        self._gains = list()
+        gain = 1.0
+        for filt in filters:
+            pos = {ch: k for k, ch in enumerate(filt["picks"])}
+            self._idx.append(np.array([pos[ch] for ch in picks], dtype=np.intp))
+            self._gains.append(gain)
+            if filt.get("method", "iir") == "fir":
+                self._stages.append(_FIRStage(filt["h"]))
+                self._slots.append((len(self._stages) - 1, slice(None)))
+                gain *= np.sum(filt["h"])
+                continue
+            if len(self._stages) == 0 or not isinstance(self._stages[-1], list):
+                self._stages.append(list())
+            start = sum(elt.shape[0] for elt in self._stages[-1])
+            self._stages[-1].append(filt["sos"])
+            self._slots.append(
+                (len(self._stages) - 1, slice(start, start + filt["sos"].shape[0]))
+            )
+            gain *= np.prod(
+                np.sum(filt["sos"][:, :3], axis=1) / np.sum(filt["sos"][:, 3:], axis=1)
+            )
+        self._stages = [
+            _SOSStage(np.vstack(stage)) if isinstance(stage, list) else stage
+            for stage in self._stages
+        ]
+        self._zi = None
+
+    def __call__(self, data: ScalarArray) -> None:
+        """Filter in-place the channels of an array of shape (n_times, n_channels)."""
+        zi = self._initial_conditions(data) if self._zi is None else self._zi
+        data_filtered = data[:, self._picks]
+        zf = list()
+        for stage, zi_stage in zip(self._stages, zi, strict=True):
+            data_filtered, zi_stage = stage(data_filtered, zi_stage)
+            zf.append(zi_stage)
+        data[:, self._picks] = data_filtered  # operate in-place
+        self._zi = zf
+
+    def _initial_conditions(self, data: ScalarArray) -> list[ScalarArray]:
+        """Retrieve or set the initial conditions of the cascade.
+
+        Filters with initial conditions continue from their states. Filters without
+        initial conditions are set to a step response steady-state on the mean of the
+        acquisition window (e.g. DC offset for EEGs), propagated through the DC gain of
+        the preceding filters.
+        """
+        zi = [list() for _ in self._stages]
+        mean = None
+        for filt, idx, (stage, _), gain in zip(
+            self._filters, self._idx, self._slots, self._gains, strict=True
+        ):
+            if filt["zi"] is None:
+                if mean is None:
+                    mean = np.mean(data[:, self._picks], axis=0)
+                zi[stage].append(filt["zi_unit"] * gain * mean)
+            else:
+                shape = filt["zi_unit"].shape[:-1] + (filt["picks"].size,)
+                zi[stage].append(np.broadcast_to(filt["zi"], shape)[..., idx])
+        return [np.concatenate(elt, axis=0) for elt in zi]
+
+    def store_initial_conditions(self) -> None:
+        """Store the states of the cascade in the initial conditions of the filters."""
+        zi = self._zi
+        if zi is None:
+            return  # the cascade was not applied yet
+        for filt, idx, (stage, slot) in zip(
+            self._filters, self._idx, self._slots, strict=True
+        ):
+            shape = filt["zi_unit"].shape[:-1] + (filt["picks"].size,)
+            if filt["zi"] is None or filt["zi"].shape != shape:
+                filt["zi"] = (
+                    np.zeros(shape, dtype=zi[stage].dtype)
+                    if filt["zi"] is None
+                    else np.broadcast_to(filt["zi"], shape).copy()
+                )
+            filt["zi"][..., idx] = zi[stage][slot]
+
+    @property
+    def filters(self) -> list[StreamFilter]:
+        """Filters fused in the cascade, in application order."""
+        return self._filters
+
+    @property
+    def picks(self) -> ScalarIntArray:
+        """Channels on which the cascade is applied."""
+        return self._picks
+
+
+class _SOSStage:
+    """Cascade of second-order sections applied with :func:`scipy.signal.sosfilt`."""
+
+    def __init__(self, sos: ScalarArray) -> None:
+        self._sos = sos
+
+    def __call__(
+        self, data: ScalarArray, zi: ScalarArray
+    ) -> tuple[ScalarArray, ScalarArray]:
+        return sosfilt(self._sos, data, zi=zi, axis=0)
+
+
+class _FIRStage:
+    """FIR filter applied with an overlap-save FFT convolution.
+
+    The state of the filter is the last ``n_taps - 1`` input samples. The input is cut
+    in blocks of ``n_fft - n_taps + 1`` samples, each extended with the
+    ``n_taps - 1`` preceding samples and convolved with the kernel in the frequency
+    domain.
+    """
+
+    def __init__(self, h: ScalarArray) -> None:
+        self._n_overlap = h.size - 1
+        self._n_fft = next_fast_len(4 * h.size, real=True)
+        self._n_block = self._n_fft - self._n_overlap
+        self._h_fft = rfft(h, self._n_fft)
+
+    def __call__(
+        self, data: ScalarArray, zi: ScalarArray
+    ) -> tuple[ScalarArray, ScalarArray]:
+        n_times, n_channels = data.shape
+        n_blocks = -(-n_times // self._n_block)
+        # extend the input with the states and pad it to an integer number of blocks
+        ext = np.zeros((self._n_overlap + n_blocks * self._n_block, n_channels))
+        ext[: self._n_overlap] = zi
+        ext[self._n_overlap : self._n_overlap + n_times] = data
+        # (n_blocks, n_channels, n_fft) overlapping views of the extended input
+        frames = sliding_window_view(ext, self._n_fft, axis=0)[:: self._n_block]
+        data_filtered = irfft(rfft(frames, axis=-1) * self._h_fft, self._n_fft, axis=-1)
+        data_filtered = data_filtered[..., self._n_overlap :].transpose(0, 2, 1)
+        data_filtered = data_filtered.reshape(-1, n_channels)[:n_times]
+        return data_filtered, ext[n_times : n_times + self._n_overlap].copy()
+
+
+class Decimator:
+    """Stateful decimation by an integer factor.
+
+    The samples are filtered with a causal anti-aliasing filter before retaining one
+    sample every ``factor`` samples. The anti-aliasing filter is the 8th order Chebyshev
+    type I low-pass filter used by :func:`scipy.signal.decimate`, with a cutoff at 80%
+    of the new Nyquist frequency. The state of the filter and the position of the next
+    retained sample are carried from one chunk to the next.
+
+    Parameters
+    ----------
+    factor : int
+        The decimation factor.
+    """
+
+    def __init__(self, factor: int) -> None:
+        self._factor = factor
+        self._sos = cheby1(8, 0.05, 0.8 / factor, output="sos")
+        self._zi_unit = sosfilt_zi(self._sos)[..., np.newaxis]
+        self._zi = None
+        self._offset = 0  # position of the next retained sample in the next chunk
+
+    def __call__(
+        self, data: ScalarArray, timestamps: NDArray[np.float64]
+    ) -> tuple[ScalarArray, NDArray[np.float64]]:
+        """Decimate an array of shape (n_times, n_channels) and its timestamps."""
+        if self._zi is None:
+            # initial conditions are set to a step response steady-state set on the
+            # mean on the acquisition window (e.g. DC offset for EEGs)
+            self._zi = self._zi_unit * np.mean(data, axis=0)
+        data, self._zi = sosfilt(self._sos, data, zi=self._zi, axis=0)
+        idx = slice(self._offset, None, self._factor)
+        self._offset = (self._offset - timestamps.size) % self._factor
+        return data[idx], timestamps[idx]
+
+    @property
+    def factor(self) -> int:
+        """Decimation factor."""
+        return self._factor
+
+
+def compile_filters(filters: list[StreamFilter]) -> list[FilterChain]:
+    """Fuse filters into one cascade per group of channels sharing the same filters.
+
+    Parameters
+    ----------
+    filters : list of StreamFilter
+        The filters applied to the stream, in application order.
+
+    Returns
+    -------
+    chains : list of FilterChain
+        The fused cascades. Each channel is part of at most one cascade.
+    """
+    groups = dict()
+    for k, filt in enumerate(filters):
+        for ch in filt["picks"]:
+            groups.setdefault(int(ch), []).append(k)
+    chains = dict()
+    for ch, idx in sorted(groups.items()):
+        chains.setdefault(tuple(idx), []).append(ch)
+    return [
+        FilterChain([filters[k] for k in idx], np.array(picks, dtype=np.intp))
+        for idx, picks in chains.items()
+    ]
+
+
 def create_filter(
     sfreq: float,
     l_freq: float | None,
@@ -109,26 +358,129 @@ def create_filter(
     -------
     filt : dict
         The filter parameters and initial conditions.
+
+    Notes
+    -----
+    The designs are cached process-wide in a bounded least-recently-used cache keyed on
+    the sampling frequency, the cutoff frequencies and the IIR parameters, thus
+    re-creating the same filter skips its design.
     """
-    filt = create_filter_mne(
-        data=None,
-        sfreq=sfreq,
+
+    def design() -> dict[str, Any]:
+        filt = create_filter_mne(
+            data=None,
+            sfreq=sfreq,
+            l_freq=l_freq,
+            h_freq=h_freq,
+            method="iir",
+            iir_params=iir_params,
+            phase="forward",
+            verbose=logger.level,
+        )
+        filt["zi_unit"] = sosfilt_zi(filt["sos"])[..., np.newaxis]
+        return filt
+
+    key = _freeze((float(sfreq), l_freq, h_freq, iir_params))
+    design = _get_design(key, design, f"({l_freq}, {h_freq}) Hz")
+    # store filter parameters and initial conditions
+    filt = dict(design)
+    filt.update(
+        sos=design["sos"].copy(),
+        zi_unit=design["zi_unit"].copy(),
+        zi=None,
         l_freq=l_freq,
         h_freq=h_freq,
-        method="iir",
         iir_params=iir_params,
-        phase="forward",
-        verbose=logger.level,
+        sfreq=sfreq,
     )
-    # store filter parameters and initial conditions
-    filt.update(
-        zi_unit=sosfilt_zi(filt["sos"])[..., np.newaxis],
+    return filt
+
+
+def create_fir_filter(
+    sfreq: float,
+    l_freq: float | None,
+    h_freq: float | None,
+) -> dict[str, Any]:
+    """Create a linear-phase FIR filter, applied causally.
+
+    Parameters
+    ----------
+    sfreq : float
+        The sampling frequency in Hz.
+    %(l_freq)s
+    %(h_freq)s
+
+    Returns
+    -------
+    filt : dict
+        The filter parameters and initial conditions.
+
+    Notes
+    -----
+    The kernel is designed with the default parameters of
+    :func:`mne.filter.create_filter` for the ``'fir'`` method, i.e. a Hamming-windowed
+    ``firwin`` design with automatic filter length and transition bandwidths. Since the
+    filter is applied causally, it delays the signal by ``(n_taps - 1) / 2`` samples.
+    The designs are cached along the IIR designs, see :func:`create_filter`.
+    """
+
+    def design() -> dict[str, Any]:
+        h = create_filter_mne(
+            data=None,
+            sfreq=sfreq,
+            l_freq=l_freq,
+            h_freq=h_freq,
+            method="fir",
+            phase="zero",
+            verbose=logger.level,
+        )
+        return dict(h=h, zi_unit=np.ones((h.size - 1, 1)))
+
+    design = _get_design(
+        _freeze(("fir", float(sfreq), l_freq, h_freq)),
+        design,
+        f"({l_freq}, {h_freq}) Hz FIR",
+    )
+    return dict(
+        method="fir",
+        h=design["h"].copy(),
+        zi_unit=design["zi_unit"].copy(),
         zi=None,
         l_freq=l_freq,
         h_freq=h_freq,
-        iir_params=iir_params,
         sfreq=sfreq,
     )
+
+
+def combine_filters(filters: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine IIR causal filters into a single filter.
+
+    The second-order sections of the filters are stacked, thus the combined filter is
+    applied with a single call to :func:`scipy.signal.sosfilt` and a single state.
+
+    Parameters
+    ----------
+    filters : list of dict
+        The filter parameters, as returned by :func:`create_filter`, designed with the
+        same sampling frequency and IIR parameters.
+
+    Returns
+    -------
+    filt : dict
+        The combined filter parameters and initial conditions. The cutoff frequencies
+        ``l_freq`` and ``h_freq`` are tuples with one element per combined filter.
+    """
+    filt = dict(filters[0])
+    sos = np.vstack([elt["sos"] for elt in filters])
+    filt.update(
+        sos=sos,
+        zi_unit=sosfilt_zi(sos)[..., np.newaxis],
+        zi=None,
+        l_freq=tuple(elt["l_freq"] for elt in filters),
+        h_freq=tuple(elt["h_freq"] for elt in filters),
+    )
+    if "padlen" in filt:
+        filt["padlen"] = sum(elt["padlen"] for elt in filters)
     return filt
 
 
@@ -152,3 +504,51 @@ def ensure_sos_iir_params(
                 del iir_params[key]
     iir_params["output"] = "sos"
     return iir_params
+
+
+_FILTER_CACHE: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+_FILTER_CACHE_LOCK = Lock()
+_FILTER_CACHE_MAXSIZE: int = 128
+
+
+def _get_design(
+    key: Hashable | None, design: Callable[[], dict[str, Any]], name: str
+) -> dict[str, Any]:
+    """Retrieve a filter design from the cache, or design it and cache it."""
+    with _FILTER_CACHE_LOCK:
+        filt = None if key is None else _FILTER_CACHE.get(key)
+        if filt is not None:
+            _FILTER_CACHE.move_to_end(key)
+    if filt is not None:
+        logger.debug("Using the cached design of the filter %s.", name)
+        return filt
+    filt = design()
+    if key is not None:
+        with _FILTER_CACHE_LOCK:
+            _FILTER_CACHE[key] = filt
+            while _FILTER_CACHE_MAXSIZE < len(_FILTER_CACHE):
+                _FILTER_CACHE.popitem(last=False)
+    return filt
+
+
+def clear_filter_cache() -> None:
+    """Remove all the filter designs cached by :func:`create_filter`."""
+    with _FILTER_CACHE_LOCK:
+        _FILTER_CACHE.clear()
+
+
+def _freeze(obj) -> Hashable | None:
+    """Convert filter parameters to a hashable key, or None if not possible."""
+    if obj is None or isinstance(obj, str | bool | int | float | np.number):
+        return (type(obj).__name__, obj)
+    if isinstance(obj, np.ndarray):
+        return ("ndarray", obj.dtype.str, obj.shape, obj.tobytes())
+    if isinstance(obj, list | tuple):
+        key = tuple(_freeze(elt) for elt in obj)
+        return None if any(elt is None for elt in key) else (type(obj).__name__, key)
+    if isinstance(obj, dict):
+        if not all(isinstance(k, str) for k in obj):
+            return None
+        key = tuple((k, _freeze(v)) for k, v in sorted(obj.items()))
+        return None if any(elt is None for _, elt in key) else ("dict", key)
+    return None
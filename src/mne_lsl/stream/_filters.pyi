@@ -1,5 +1,13 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from typing import Any
 
+import numpy as np
+from _typeshed import Incomplete
+from numpy.typing import NDArray
+
+from .._typing import ScalarArray as ScalarArray
+from .._typing import ScalarIntArray as ScalarIntArray
 from ..utils._checks import check_type as check_type
 from ..utils.logs import logger as logger
 from ..utils.logs import warn as warn
@@ -17,6 +25,129 @@ class StreamFilter(dict):
     def __ne__(self, other: Any):
         """Inequality operator."""
 
+class FilterChain:
+    """Cascade of filters applied on the same channels, fused in few stages.
+
+    The second-order sections of consecutive IIR filters are stacked in application
+    order, thus they are applied with a single call to :func:`scipy.signal.sosfilt`.
+    FIR filters are applied one at a time with an overlap-save FFT convolution. The
+    channels are gathered and scattered once for the entire cascade.
+
+    Parameters
+    ----------
+    filters : list of StreamFilter
+        The filters applied on the channels, in application order.
+    picks : array of int
+        The channels on which the filters are applied. All the filters must include
+        those channels.
+    """
+
+    _filters: Incomplete
+    _picks: Incomplete
+    _stages: Incomplete
+    _idx: Incomplete
+    _slots: Incomplete
+    _gains: Incomplete
+    _zi: Incomplete
+
+    def __init__(self, filters: list[StreamFilter], picks: ScalarIntArray) -> None: ...
+    def __call__(self, data: ScalarArray) -> None:
+        """Filter in-place the channels of an array of shape (n_times, n_channels)."""
+
+    def _initial_conditions(self, data: ScalarArray) -> list[ScalarArray]:
+        """Retrieve or set the initial conditions of the cascade.
+
+        Filters with initial conditions continue from their states. Filters without
+        initial conditions are set to a step response steady-state on the mean of the
+        acquisition window (e.g. DC offset for EEGs), propagated through the DC gain of
+        the preceding filters.
+        """
+
+    def store_initial_conditions(self) -> None:
+        """Store the states of the cascade in the initial conditions of the filters."""
+
+    @property
+    def filters(self) -> list[StreamFilter]:
+        """Filters fused in the cascade, in application order."""
+
+    @property
+    def picks(self) -> ScalarIntArray:
+        """Channels on which the cascade is applied."""
+
+class _SOSStage:
+    """Cascade of second-order sections applied with :func:`scipy.signal.sosfilt`."""
+
+    _sos: Incomplete
+
+    def __init__(self, sos: ScalarArray) -> None: ...
+    def __call__(
+        self, data: ScalarArray, zi: ScalarArray
+    ) -> tuple[ScalarArray, ScalarArray]: ...
+
+class _FIRStage:
+    """FIR filter applied with an overlap-save FFT convolution.
+
+    The state of the filter is the last ``n_taps - 1`` input samples. The input is cut
+    in blocks of ``n_fft - n_taps + 1`` samples, each extended with the
+    ``n_taps - 1`` preceding samples and convolved with the kernel in the frequency
+    domain.
+    """
+
+    _n_overlap: Incomplete
+    _n_fft: Incomplete
+    _n_block: Incomplete
+    _h_fft: Incomplete
+
+    def __init__(self, h: ScalarArray) -> None: ...
+    def __call__(
+        self, data: ScalarArray, zi: ScalarArray
+    ) -> tuple[ScalarArray, ScalarArray]: ...
+
+class Decimator:
+    """Stateful decimation by an integer factor.
+
+    The samples are filtered with a causal anti-aliasing filter before retaining one
+    sample every ``factor`` samples. The anti-aliasing filter is the 8th order Chebyshev
+    type I low-pass filter used by :func:`scipy.signal.decimate`, with a cutoff at 80%
+    of the new Nyquist frequency. The state of the filter and the position of the next
+    retained sample are carried from one chunk to the next.
+
+    Parameters
+    ----------
+    factor : int
+        The decimation factor.
+    """
+
+    _factor: Incomplete
+    _sos: Incomplete
+    _zi_unit: Incomplete
+    _zi: Incomplete
+    _offset: int
+
+    def __init__(self, factor: int) -> None: ...
+    def __call__(
+        self, data: ScalarArray, timestamps: NDArray[np.float64]
+    ) -> tuple[ScalarArray, NDArray[np.float64]]:
+        """Decimate an array of shape (n_times, n_channels) and its timestamps."""
+
+    @property
+    def factor(self) -> int:
+        """Decimation factor."""
+
+def compile_filters(filters: list[StreamFilter]) -> list[FilterChain]:
+    """Fuse filters into one cascade per group of channels sharing the same filters.
+
+    Parameters
+    ----------
+    filters : list of StreamFilter
+        The filters applied to the stream, in application order.
+
+    Returns
+    -------
+    chains : list of FilterChain
+        The fused cascades. Each channel is part of at most one cascade.
+    """
+
 def create_filter(
     sfreq: float, l_freq: float | None, h_freq: float | None, iir_params: dict[str, Any]
 ) -> dict[str, Any]:
@@ -34,7 +165,73 @@ def create_filter(
     -------
     filt : dict
         The filter parameters and initial conditions.
+
+    Notes
+    -----
+    The designs are cached process-wide in a bounded least-recently-used cache keyed on
+    the sampling frequency, the cutoff frequencies and the IIR parameters, thus
+    re-creating the same filter skips its design.
+    """
+
+def create_fir_filter(
+    sfreq: float, l_freq: float | None, h_freq: float | None
+) -> dict[str, Any]:
+    """Create a linear-phase FIR filter, applied causally.
+
+    Parameters
+    ----------
+    sfreq : float
+        The sampling frequency in Hz.
+    %(l_freq)s
+    %(h_freq)s
+
+    Returns
+    -------
+    filt : dict
+        The filter parameters and initial conditions.
+
+    Notes
+    -----
+    The kernel is designed with the default parameters of
+    :func:`mne.filter.create_filter` for the ``'fir'`` method, i.e. a Hamming-windowed
+    ``firwin`` design with automatic filter length and transition bandwidths. Since the
+    filter is applied causally, it delays the signal by ``(n_taps - 1) / 2`` samples.
+    The designs are cached along the IIR designs, see :func:`create_filter`.
+    """
+
+def combine_filters(filters: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine IIR causal filters into a single filter.
+
+    The second-order sections of the filters are stacked, thus the combined filter is
+    applied with a single call to :func:`scipy.signal.sosfilt` and a single state.
+
+    Parameters
+    ----------
+    filters : list of dict
+        The filter parameters, as returned by :func:`create_filter`, designed with the
+        same sampling frequency and IIR parameters.
+
+    Returns
+    -------
+    filt : dict
+        The combined filter parameters and initial conditions. The cutoff frequencies
+        ``l_freq`` and ``h_freq`` are tuples with one element per combined filter.
     """
 
 def ensure_sos_iir_params(iir_params: dict[str, Any] | None = None) -> dict[str, Any]:
     """Ensure that the filter parameters include SOS output."""
+
+_FILTER_CACHE: OrderedDict[Hashable, dict[str, Any]]
+_FILTER_CACHE_LOCK: Incomplete
+_FILTER_CACHE_MAXSIZE: int
+
+def _get_design(
+    key: Hashable | None, design: Callable[[], dict[str, Any]], name: str
+) -> dict[str, Any]:
+    """Retrieve a filter design from the cache, or design it and cache it."""
+
+def clear_filter_cache() -> None:
+    """Remove all the filter designs cached by :func:`create_filter`."""
+
+def _freeze(obj) -> Hashable | None:
+    """Convert filter parameters to a hashable key, or None if not possible."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from threading import Lock
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -50,16 +51,143 @@ def check_hpi_ch_names(ch_names: list[str], format: str) -> None:  # noqa: A002
         )
 
 
-def create_hpi_callback_megin(main_stream: BaseStream) -> Callable:
+class HeadPositions:
+    """Timestamped history of the device to head transformations.
+
+    The transformations received are stored in a bounded circular history. The most
+    recent transformation applied to the stream is stored in a slot replaced by a
+    single attribute assignment, thus the slot is read without interrupting the
+    acquisition of the stream. The slot is only replaced if the transformation
+    changed enough since the last replacement.
+
+    Parameters
+    ----------
+    maxlen : int
+        Number of transformations retained in the history.
+    min_interval : float | None
+        Minimum time in seconds between 2 replacements of the slot.
+    min_translation : float | None
+        Minimum translation in meters of the head to replace the slot.
+    min_rotation : float | None
+        Minimum rotation in degrees of the head to replace the slot.
+    """
+
+    def __init__(
+        self,
+        maxlen: int = 1024,
+        min_interval: float | None = None,
+        min_translation: float | None = None,
+        min_rotation: float | None = None,
+    ) -> None:
+        self._timestamps = np.full(maxlen, np.nan)
+        self._trans = np.zeros((maxlen, 4, 4))
+        self._n_trans = 0
+        self._lock = Lock()  # protects the history, not the slot
+        self._min_interval = min_interval
+        self._min_translation = min_translation
+        self._min_rotation = (
+            None if min_rotation is None else np.cos(np.deg2rad(min_rotation))
+        )
+        self._latest = None  # tuple (timestamp, Transform), replaced atomically
+
+    def add(self, timestamps: NDArray[np.float64], trans: NDArray[np.float64]) -> None:
+        """Add transformations to the history and update the slot.
+
+        Parameters
+        ----------
+        timestamps : array of shape (n_trans,)
+            Timestamps of the transformations.
+        trans : array of shape (n_trans, 4, 4)
+            Device to head transformations.
+        """
+        maxlen = self._timestamps.size
+        with self._lock:
+            # only the last maxlen transformations are written
+            start = max(timestamps.size - maxlen, 0)
+            idx = (self._n_trans + np.arange(start, timestamps.size)) % maxlen
+            self._timestamps[idx] = timestamps[start:]
+            self._trans[idx] = trans[start:]
+            self._n_trans += timestamps.size
+        if self._changed(timestamps[-1], trans[-1]):
+            self._latest = (timestamps[-1], Transform("meg", "head", trans[-1]))
+
+    def get(self, timestamp: float | None = None) -> Transform | None:
+        """Get the transformation at a given time.
+
+        Parameters
+        ----------
+        timestamp : float | None
+            Time at which the transformation is retrieved. If ``None``, the most recent
+            transformation of the history is returned.
+
+        Returns
+        -------
+        trans : Transform | None
+            The most recent transformation received before or at ``timestamp``, or
+            ``None`` if the history does not contain such transformation.
+        """
+        with self._lock:
+            if self._n_trans == 0:
+                return None
+            if timestamp is None:
+                idx = (self._n_trans - 1) % self._timestamps.size
+            else:
+                mask = self._timestamps <= timestamp
+                if not mask.any():
+                    return None
+                idx = np.flatnonzero(mask)[np.argmax(self._timestamps[mask])]
+            trans = self._trans[idx].copy()
+        return Transform("meg", "head", trans)
+
+    def _changed(self, timestamp: float, trans: NDArray[np.float64]) -> bool:
+        """Check if a transformation should replace the slot."""
+        if self._latest is None:
+            return True
+        last_timestamp, last_trans = self._latest
+        if self._min_interval is not None and (
+            timestamp - last_timestamp < self._min_interval
+        ):
+            return False
+        if self._min_translation is None and self._min_rotation is None:
+            return True
+        last_trans = last_trans["trans"]
+        if (
+            self._min_translation is not None
+            and self._min_translation
+            <= np.linalg.norm(trans[:3, 3] - last_trans[:3, 3])
+        ):
+            return True
+        if self._min_rotation is not None:
+            # cosine of the angle of the rotation between both transformations
+            cos = (np.trace(last_trans[:3, :3].T @ trans[:3, :3]) - 1) / 2
+            return cos <= self._min_rotation
+        return False
+
+    @property
+    def latest(self) -> tuple[float, Transform] | None:
+        """Timestamp and transformation of the slot.
+
+        :type: :class:`tuple` | None
+        """
+        return self._latest
+
+
+def create_hpi_callback_megin(
+    main_stream: BaseStream, positions: HeadPositions
+) -> Callable:
     """Create a callback function for processing MEGIN HPI data.
 
-    The callback processes HPI data from a ``neuromag2lsl`` HPI stream and updates
-    the main stream's ``dev_head_t`` transformation matrix in real-time.
+    The callback processes HPI data from a ``neuromag2lsl`` HPI stream and stores the
+    head positions of the main stream, without interrupting its acquisition. The main
+    stream's ``dev_head_t`` is updated from the most recent head position when its
+    measurement information is accessed.
 
     Parameters
     ----------
     main_stream : BaseStream
         The main MEG stream whose ``dev_head_t`` will be updated.
+    positions : HeadPositions
+        The head positions of the main stream.
 
     Returns
     -------
@@ -81,7 +209,7 @@ def create_hpi_callback_megin(main_stream: BaseStream) -> Callable:
     def hpi_callback(
         data: NDArray[np.floating], timestamps: NDArray[np.float64], info: Info
     ) -> tuple[NDArray[np.floating], NDArray[np.float64]]:
-        """Process HPI data and update main stream's dev_head_t.
+        """Process HPI data and store the head positions of the main stream.
 
         Parameters
         ----------
@@ -101,45 +229,27 @@ def create_hpi_callback_megin(main_stream: BaseStream) -> Callable:
         """
         assert data.size != 0  # sanity-check
 
-        # Get the latest HPI measurement (most recent sample)
-        hpi_data = data[-1, :].squeeze()  # Shape: (12,)
-
-        if hpi_data.shape[0] != 12:
+        if data.shape[1] != 12:
             warn(
-                f"Expected 12 HPI values for MEGIN format, got {hpi_data.shape[0]}. "
+                f"Expected 12 HPI values for MEGIN format, got {data.shape[1]}. "
                 "Skipping dev_head_t update."
             )
             return data, timestamps
 
-        # Reconstruct 4x4 transformation matrix from 12-element vector
+        # Reconstruct 4x4 transformation matrices from 12-element vectors
         # Format: R11, R12, R13, R21, R22, R23, R31, R32, R33, T1, T2, T3
-        r11, r12, r13, r21, r22, r23, r31, r32, r33, tx, ty, tz = hpi_data
-
-        trans_matrix = np.array(
-            [
-                [r11, r12, r13, tx],
-                [r21, r22, r23, ty],
-                [r31, r32, r33, tz],
-                [0.0, 0.0, 0.0, 1.0],
-            ],
-            dtype=np.float64,
-        )
+        trans = np.zeros((data.shape[0], 4, 4), dtype=np.float64)
+        trans[:, :3, :3] = data[:, :9].reshape(-1, 3, 3)
+        trans[:, :3, 3] = data[:, 9:12]
+        trans[:, 3, 3] = 1.0
 
-        # Create MNE Transform object (MEG device to head coordinate transformation)
-        transform = Transform("meg", "head", trans_matrix)
-
-        # Update main stream's dev_head_t safely
         try:
-            with main_stream._interrupt_acquisition():
-                with main_stream._info._unlock(
-                    update_redundant=False, check_after=False
-                ):
-                    main_stream._info["dev_head_t"] = transform
-
+            positions.add(timestamps, trans)
             logger.debug(
-                "Updated dev_head_t from HPI stream at timestamp %.3f", timestamps[-1]
+                "Stored the head position of %s from HPI stream at timestamp %.3f",
+                main_stream,
+                timestamps[-1],
             )
-
         except Exception as exc:
             logger.error("Failed to update dev_head_t from HPI data: %s.", exc)
 
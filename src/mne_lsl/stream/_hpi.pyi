@@ -1,5 +1,10 @@
 from collections.abc import Callable
 
+import numpy as np
+from _typeshed import Incomplete
+from mne import Transform
+from numpy.typing import NDArray
+
 from ..utils.logs import logger as logger
 from ..utils.logs import warn as warn
 from .base import BaseStream as BaseStream
@@ -17,16 +22,96 @@ def check_hpi_ch_names(ch_names: list[str], format: str) -> None:
         The format of the HPI data, e.g., "megin".
     """
 
-def create_hpi_callback_megin(main_stream: BaseStream) -> Callable:
+class HeadPositions:
+    """Timestamped history of the device to head transformations.
+
+    The transformations received are stored in a bounded circular history. The most
+    recent transformation applied to the stream is stored in a slot replaced by a
+    single attribute assignment, thus the slot is read without interrupting the
+    acquisition of the stream. The slot is only replaced if the transformation
+    changed enough since the last replacement.
+
+    Parameters
+    ----------
+    maxlen : int
+        Number of transformations retained in the history.
+    min_interval : float | None
+        Minimum time in seconds between 2 replacements of the slot.
+    min_translation : float | None
+        Minimum translation in meters of the head to replace the slot.
+    min_rotation : float | None
+        Minimum rotation in degrees of the head to replace the slot.
+    """
+
+    _timestamps: Incomplete
+    _trans: Incomplete
+    _n_trans: int
+    _lock: Incomplete
+    _min_interval: Incomplete
+    _min_translation: Incomplete
+    _min_rotation: Incomplete
+    _latest: Incomplete
+
+    def __init__(
+        self,
+        maxlen: int = 1024,
+        min_interval: float | None = None,
+        min_translation: float | None = None,
+        min_rotation: float | None = None,
+    ) -> None: ...
+    def add(self, timestamps: NDArray[np.float64], trans: NDArray[np.float64]) -> None:
+        """Add transformations to the history and update the slot.
+
+        Parameters
+        ----------
+        timestamps : array of shape (n_trans,)
+            Timestamps of the transformations.
+        trans : array of shape (n_trans, 4, 4)
+            Device to head transformations.
+        """
+
+    def get(self, timestamp: float | None = None) -> Transform | None:
+        """Get the transformation at a given time.
+
+        Parameters
+        ----------
+        timestamp : float | None
+            Time at which the transformation is retrieved. If ``None``, the most recent
+            transformation of the history is returned.
+
+        Returns
+        -------
+        trans : Transform | None
+            The most recent transformation received before or at ``timestamp``, or
+            ``None`` if the history does not contain such transformation.
+        """
+
+    def _changed(self, timestamp: float, trans: NDArray[np.float64]) -> bool:
+        """Check if a transformation should replace the slot."""
+
+    @property
+    def latest(self) -> tuple[float, Transform] | None:
+        """Timestamp and transformation of the slot.
+
+        :type: :class:`tuple` | None
+        """
+
+def create_hpi_callback_megin(
+    main_stream: BaseStream, positions: HeadPositions
+) -> Callable:
     """Create a callback function for processing MEGIN HPI data.
 
-    The callback processes HPI data from a ``neuromag2lsl`` HPI stream and updates
-    the main stream's ``dev_head_t`` transformation matrix in real-time.
+    The callback processes HPI data from a ``neuromag2lsl`` HPI stream and stores the
+    head positions of the main stream, without interrupting its acquisition. The main
+    stream's ``dev_head_t`` is updated from the most recent head position when its
+    measurement information is accessed.
 
     Parameters
     ----------
     main_stream : BaseStream
         The main MEG stream whose ``dev_head_t`` will be updated.
+    positions : HeadPositions
+        The head positions of the main stream.
 
     Returns
     -------
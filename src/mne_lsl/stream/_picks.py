@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from mne._fiff.pick import _picks_to_idx
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from mne import Info
+
+    from .._typing import ScalarIntArray
+
+
+class PicksCache:
+    """Bounded cache of the channel selections resolved on a measurement info.
+
+    Resolving a channel selection with ``_picks_to_idx`` costs up to a few hundred
+    microseconds for selections by channel type, which dominates the cost of retrieving
+    a small window of data. The resolved selections are cached, keyed on the arguments
+    ``picks`` and ``exclude`` and on the bad channels. The cache must be cleared
+    whenever the channels of the measurement info are modified.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of selections cached. The oldest selection is evicted first.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = maxsize
+        self._cache = dict()
+
+    def __len__(self) -> int:
+        """Return the number of selections cached."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Remove all the selections cached."""
+        self._cache.clear()
+
+    def get(
+        self,
+        info: Info,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None,
+        exclude: str | list[str] | tuple[str, ...],
+        **kwargs,
+    ) -> ScalarIntArray:
+        """Resolve a channel selection, from the cache if possible.
+
+        Parameters
+        ----------
+        info : Info
+            The measurement information on which the selection is resolved.
+        picks : str | array-like | slice | None
+            The channel selection, as provided to ``_picks_to_idx``.
+        exclude : str | list of str | tuple of str
+            The channels to exclude, as provided to ``_picks_to_idx``.
+        **kwargs
+            Additional keyword arguments provided to ``_picks_to_idx``.
+
+        Returns
+        -------
+        picks : array of int
+            The resolved selection, read-only.
+        """
+        key = _hashable(picks), _hashable(exclude), _hashable(kwargs)
+        if any(elt is _UNHASHABLE for elt in key):
+            return _picks_to_idx(info, picks, exclude=exclude, **kwargs)
+        key += (tuple(info["bads"]),)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        picks = _picks_to_idx(info, picks, exclude=exclude, **kwargs)
+        picks.flags.writeable = False  # shared between calls
+        if self._maxsize <= len(self._cache):
+            self._cache.pop(next(iter(self._cache)), None)
+        self._cache[key] = picks
+        return picks
+
+
+_UNHASHABLE = object()
+
+
+def _hashable(obj) -> Hashable:
+    """Convert a selection argument to a hashable key, tagged by its type."""
+    if obj is None or isinstance(obj, str | int | np.integer):
+        return (type(obj).__name__, obj)
+    if isinstance(obj, np.ndarray):
+        return ("ndarray", obj.dtype.str, obj.shape, obj.tobytes())
+    if isinstance(obj, list | tuple):
+        key = tuple(_hashable(elt) for elt in obj)
+        if any(elt is _UNHASHABLE for elt in key):
+            return _UNHASHABLE
+        return (type(obj).__name__, key)
+    if isinstance(obj, dict):
+        key = tuple((k, _hashable(v)) for k, v in sorted(obj.items()))
+        if any(elt is _UNHASHABLE for _, elt in key):
+            return _UNHASHABLE
+        return ("dict", key)
+    return _UNHASHABLE
@@ -0,0 +1,62 @@
+from collections.abc import Hashable
+
+from _typeshed import Incomplete
+from mne import Info
+
+from .._typing import ScalarIntArray as ScalarIntArray
+
+class PicksCache:
+    """Bounded cache of the channel selections resolved on a measurement info.
+
+    Resolving a channel selection with ``_picks_to_idx`` costs up to a few hundred
+    microseconds for selections by channel type, which dominates the cost of retrieving
+    a small window of data. The resolved selections are cached, keyed on the arguments
+    ``picks`` and ``exclude`` and on the bad channels. The cache must be cleared
+    whenever the channels of the measurement info are modified.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of selections cached. The oldest selection is evicted first.
+    """
+
+    _maxsize: Incomplete
+    _cache: Incomplete
+
+    def __init__(self, maxsize: int = 32) -> None: ...
+    def __len__(self) -> int:
+        """Return the number of selections cached."""
+
+    def clear(self) -> None:
+        """Remove all the selections cached."""
+
+    def get(
+        self,
+        info: Info,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None,
+        exclude: str | list[str] | tuple[str, ...],
+        **kwargs,
+    ) -> ScalarIntArray:
+        """Resolve a channel selection, from the cache if possible.
+
+        Parameters
+        ----------
+        info : Info
+            The measurement information on which the selection is resolved.
+        picks : str | array-like | slice | None
+            The channel selection, as provided to ``_picks_to_idx``.
+        exclude : str | list of str | tuple of str
+            The channels to exclude, as provided to ``_picks_to_idx``.
+        **kwargs
+            Additional keyword arguments provided to ``_picks_to_idx``.
+
+        Returns
+        -------
+        picks : array of int
+            The resolved selection, read-only.
+        """
+
+_UNHASHABLE: Incomplete
+
+def _hashable(obj) -> Hashable:
+    """Convert a selection argument to a hashable key, tagged by its type."""
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class AcquisitionStats:
+    """Rolling statistics of the stages of an acquisition loop.
+
+    Each metric stores its last ``window`` values in a circular buffer, from which the
+    median, the 99th percentile and the maximum are computed on demand. Recording a
+    value is a constant-time write in the buffer.
+
+    Parameters
+    ----------
+    window : int
+        Number of values retained per metric.
+    """
+
+    def __init__(self, window: int) -> None:
+        self._window = window
+        self._values: dict[str, np.ndarray] = dict()
+        self._counts: dict[str, int] = dict()
+        self._last_start = None
+
+    def add(self, metric: str, value: float) -> None:
+        """Add a value to a metric."""
+        try:
+            values = self._values[metric]
+        except KeyError:
+            values = self._values[metric] = np.zeros(self._window)
+            self._counts[metric] = 0
+        values[self._counts[metric] % self._window] = value
+        self._counts[metric] += 1
+
+    def lap(self, stage: str, start: float) -> float:
+        """Record the duration of a stage started at ``start`` and return the time.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        start : float
+            Start time of the stage, as returned by :func:`time.perf_counter`.
+
+        Returns
+        -------
+        stop : float
+            End time of the stage, i.e. the start time of the next stage.
+        """
+        stop = perf_counter()
+        self.add(stage, stop - start)
+        return stop
+
+    def start(self) -> float:
+        """Record the start of an acquisition and the period since the previous one."""
+        start = perf_counter()
+        if self._last_start is not None:
+            self.add("period", start - self._last_start)
+        self._last_start = start
+        return start
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Summarize the metrics.
+
+        Returns
+        -------
+        summary : dict
+            For each metric, a dictionary with the keys ``'n'`` (number of values
+            recorded since the statistics are enabled), ``'p50'``, ``'p99'`` and
+            ``'max'`` (computed on the last ``window`` values).
+        """
+        summary = dict()
+        for metric in list(self._values):
+            n = self._counts[metric]
+            values = self._values[metric][: min(n, self._window)].copy()
+            p50, p99 = np.percentile(values, (50, 99))
+            summary[metric] = dict(
+                n=n, p50=float(p50), p99=float(p99), max=float(values.max())
+            )
+        return summary
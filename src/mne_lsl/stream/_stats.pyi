@@ -0,0 +1,56 @@
+from typing import Any
+
+import numpy as np
+from _typeshed import Incomplete
+
+class AcquisitionStats:
+    """Rolling statistics of the stages of an acquisition loop.
+
+    Each metric stores its last ``window`` values in a circular buffer, from which the
+    median, the 99th percentile and the maximum are computed on demand. Recording a
+    value is a constant-time write in the buffer.
+
+    Parameters
+    ----------
+    window : int
+        Number of values retained per metric.
+    """
+
+    _window: Incomplete
+    _values: dict[str, np.ndarray]
+    _counts: dict[str, int]
+    _last_start: Incomplete
+
+    def __init__(self, window: int) -> None: ...
+    def add(self, metric: str, value: float) -> None:
+        """Add a value to a metric."""
+
+    def lap(self, stage: str, start: float) -> float:
+        """Record the duration of a stage started at ``start`` and return the time.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        start : float
+            Start time of the stage, as returned by :func:`time.perf_counter`.
+
+        Returns
+        -------
+        stop : float
+            End time of the stage, i.e. the start time of the next stage.
+        """
+
+    def start(self) -> float:
+        """Record the start of an acquisition and the period since the previous one."""
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Summarize the metrics.
+
+        Returns
+        -------
+        summary : dict
+            For each metric, a dictionary with the keys ``'n'`` (number of values
+            recorded since the statistics are enabled), ``'p50'``, ``'p99'`` and
+            ``'max'`` (computed on the last ``window`` values).
+        """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
@@ -12,26 +13,42 @@ from mne import pick_info, pick_types
 from mne._fiff.constants import FIFF, _ch_unit_mul_named
 from mne._fiff.meas_info import ContainsMixin, SetChannelsMixin
 from mne._fiff.pick import _picks_to_idx
+from mne._fiff.proj import make_projector
 from mne.channels import rename_channels
 
 from ..utils._checks import check_type, check_value, ensure_int
 from ..utils._docs import copy_doc, fill_doc
-from ..utils._time import high_precision_sleep
+from ..utils._time import SleepStrategy, get_sleep_strategy
 from ..utils.logs import logger, verbose, warn
 from ..utils.meas_info import _HUMAN_UNITS, _set_channel_units
-from ._filters import StreamFilter, create_filter, ensure_sos_iir_params
-from ._hpi import check_hpi_ch_names, create_hpi_callback_megin
+from ._async import AsyncNotifier
+from ._buffer import check_out_array, read_ring_buffer, write_ring_buffer
+from ._filters import (
+    Decimator,
+    StreamFilter,
+    combine_filters,
+    compile_filters,
+    create_filter,
+    create_fir_filter,
+    ensure_sos_iir_params,
+)
+from ._hpi import HeadPositions, check_hpi_ch_names, create_hpi_callback_megin
+from ._picks import PicksCache
+from ._stats import AcquisitionStats
+from .reader import StreamReader
+from .scheduler import AcquisitionScheduler
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
     from datetime import datetime
     from typing import Any
 
-    from mne import Info
+    from mne import Info, Transform
     from mne.channels import DigMontage
     from numpy.typing import DTypeLike, NDArray
 
     from .._typing import ScalarArray, ScalarIntArray
+    from .scheduler import _ScheduledExecutor
 
 
 @fill_doc
@@ -56,7 +73,11 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             )
         self._bufsize = bufsize
         self._lock = threading.Lock()
+        # held by the acquisition job, re-entrant so that a callback running in the
+        # acquisition job can modify its own stream
+        self._acquisition_lock = threading.RLock()
         self._callbacks = []
+        self._notifier = AsyncNotifier()
 
     @copy_doc(ContainsMixin.__contains__)
     def __contains__(self, ch_type: str) -> bool:
@@ -271,13 +292,90 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                     "loc": ref_dig_array,
                 }
                 self._info["chs"].append(chan_info)
+        self._picks_cache.clear()
         # create the associated numpy array and edit buffer
         refs = np.zeros((self._timestamps.size, len(ref_channels)), dtype=self.dtype)
         with self._interrupt_acquisition():
             self._added_channels.extend(ref_channels)  # save reference channels
             self._buffer = np.hstack((self._buffer, refs), dtype=self.dtype)
+            if self._spatial_operator is not None:
+                self._spatial_operator = np.hstack(
+                    (
+                        self._spatial_operator,
+                        np.zeros((self._picks_inlet.size, len(ref_channels))),
+                    )
+                )
         return self
 
+    @fill_doc
+    async def aiter_chunks(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> AsyncIterator[tuple[ScalarArray, NDArray[np.float64]]]:
+        """Iterate asynchronously over the new samples.
+
+        The iterator awaits the new samples without polling: the acquisition thread
+        wakes up the event loop running the iterator every time new samples are added
+        to the buffer.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Yields
+        ------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the previous iteration.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+
+        Notes
+        -----
+        Each iterator retrieves the new samples with its own
+        :class:`~mne_lsl.stream.StreamReader`, thus multiple iterators, e.g. one per
+        client of a service, can iterate over the same stream independently of each
+        other and of :meth:`~mne_lsl.stream.BaseStream.get_new_data`. The reader is
+        closed when the iterator is closed, e.g. with :func:`contextlib.aclosing`.
+
+        The first iteration yields the samples acquired after the iterator started and
+        the iteration stops when the stream is disconnected. If the iterator does not
+        keep up with the acquisition, the oldest samples are overwritten in the buffer
+        and counted in the property ``n_overrun`` of the reader.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            async for data, ts in stream.aiter_chunks(picks="eeg"):
+                await websocket.send(data.tobytes())
+        """
+        self._check_connected("aiter_chunks()")
+        self._picks_cache.get(self._info, picks, exclude, none="all")  # validate
+        event = asyncio.Event()
+        self._notifier.add(asyncio.get_running_loop(), event)
+        reader = self.create_reader()
+        try:
+            while True:
+                event.clear()  # cleared before the check to not miss a notification
+                try:
+                    n_new = reader.n_new_samples
+                    if n_new != 0:
+                        data, ts, _ = reader.get_new_data(picks, exclude)
+                except Exception:
+                    if reader in self._readers:  # pragma: no cover
+                        raise
+                    break  # the reader was detached by a disconnection
+                if n_new == 0:
+                    await event.wait()
+                else:
+                    yield data, ts
+        finally:
+            self._notifier.remove(event)
+            if reader in self._readers:
+                reader.close()
+
     @verbose
     @fill_doc
     def anonymize(
@@ -312,10 +410,113 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         )
         return self
 
+    @verbose
+    @fill_doc
+    def apply_proj(self, *, verbose: bool | str | int | None = None) -> BaseStream:
+        """Apply the signal-space projectors in real-time.
+
+        The inactive projectors in ``info["projs"]`` are folded in the spatial operator
+        applied to the new samples, see
+        :meth:`~mne_lsl.stream.StreamLSL.apply_spatial_filter`, and are marked as
+        active.
+
+        Parameters
+        ----------
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+        self._check_connected_and_regular_sampling("apply_proj()")
+        self._check_not_epoched("apply_proj()")
+        projector, n_proj, _ = make_projector(
+            self._info["projs"],
+            self.ch_names,
+            bads=self._info["bads"],
+            include_active=False,
+        )
+        if n_proj == 0:
+            logger.info("There are no inactive projectors to apply.")
+            return self
+        with self._interrupt_acquisition():
+            self._compose_spatial_operator(projector.T)
+            with self._info._unlock():
+                for proj in self._info["projs"]:
+                    proj["active"] = True
+        return self
+
+    @verbose
+    @fill_doc
+    def apply_spatial_filter(
+        self, matrix: ScalarArray, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Apply a linear spatial filter in real-time.
+
+        The new samples ``x`` of shape ``(n_channels,)`` are replaced by ``matrix @ x``
+        before being filtered and written in the buffer. The samples already in the
+        buffer are replaced as well.
+
+        .. code-block:: python
+
+            stream = Stream(2.0).connect()
+            # common average reference
+            n_channels = len(stream.ch_names)
+            matrix = np.eye(n_channels) - np.full(
+                (n_channels, n_channels), 1 / n_channels
+            )
+            stream.apply_spatial_filter(matrix)
+
+        Parameters
+        ----------
+        matrix : array of shape (n_channels, n_channels)
+            The spatial filter, applied on all the channels of the stream in the order
+            of ``Stream.ch_names``. The channels are not renamed, e.g. the bipolar
+            derivation ``F3-F7`` can replace the channel ``F3`` with the row
+            ``matrix[F3]`` set to ``+1`` on ``F3`` and ``-1`` on ``F7``.
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        The channels added with
+        :meth:`~mne_lsl.stream.StreamLSL.add_reference_channels`, the reference set with
+        :meth:`~mne_lsl.stream.StreamLSL.set_eeg_reference`, the projectors applied
+        with :meth:`~mne_lsl.stream.StreamLSL.apply_proj` and the spatial filters are
+        folded in a single precomputed operator of shape
+        ``(n_channels_inlet, n_channels)``, applied with a single matrix product per
+        acquisition window. Successive spatial filters are composed in the order they
+        are applied. The channel selection must be done before applying a spatial
+        filter.
+        """
+        self._check_connected_and_regular_sampling("apply_spatial_filter()")
+        self._check_not_epoched("apply_spatial_filter()")
+        check_type(matrix, (np.ndarray,), "matrix")
+        n_channels = len(self.ch_names)
+        if matrix.shape != (n_channels, n_channels):
+            raise ValueError(
+                "The spatial filter must be an array of shape (n_channels, "
+                f"n_channels), i.e. ({n_channels}, {n_channels}). The provided array "
+                f"of shape {matrix.shape} is invalid."
+            )
+        if not np.all(np.isfinite(matrix)):
+            raise ValueError("The spatial filter must contain only finite values.")
+        with self._interrupt_acquisition():
+            self._compose_spatial_operator(matrix.T.astype(np.float64))
+        return self
+
     @abstractmethod
+    @fill_doc
     def connect(
         self,
         acquisition_delay: float | None,
+        *,
+        scheduler: AcquisitionScheduler | None = None,
     ) -> BaseStream:
         """Connect to the stream and initiate data collection in the buffer.
 
@@ -323,9 +524,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         ----------
         acquisition_delay : float | None
             Delay in seconds between 2 acquisition during which chunks of data are
-            pulled from the connected device. If ``None``, the automatic acquisition in
-            a background thread is disabled and the user must manually call the
-            acquisition method ``Stream.acquire()`` to pull new samples.
+            pulled from the connected device. If ``0``, the acquisition in a background
+            thread waits for new samples and pulls them as soon as they arrive. If
+            ``None``, the automatic acquisition in a background thread is disabled and
+            the user must manually call the acquisition method ``Stream.acquire()`` to
+            pull new samples.
+        %(scheduler)s
 
         Returns
         -------
@@ -337,23 +541,31 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             return self
         if acquisition_delay is not None:
             check_type(acquisition_delay, ("numeric",), "acquisition_delay")
-            if acquisition_delay <= 0:
+            if acquisition_delay < 0:
                 raise ValueError(
-                    "The acquisition delay must be a strictly positive number defining "
-                    "the delay at which new samples are acquired in seconds. For "
-                    "instance, 0.2 corresponds to a pull every 200 ms. None "
-                    "corresponds to manual acquisition. The provided "
-                    f"{acquisition_delay} is invalid."
+                    "The acquisition delay must be a positive number defining the "
+                    "delay at which new samples are acquired in seconds. For instance, "
+                    "0.2 corresponds to a pull every 200 ms. 0 corresponds to a pull "
+                    "on arrival of new samples and None corresponds to manual "
+                    f"acquisition. The provided {acquisition_delay} is invalid."
                 )
+        check_type(scheduler, (AcquisitionScheduler, None), "scheduler")
         self._acquisition_delay = acquisition_delay
+        self._latency = None
         self._n_new_samples = 0
+        self._n_overrun = 0
+        self._n_samples_acquired = 0
+        self._n_samples_read = 0
+        self._n_truncated = 0
+        self._time_correction = 0.0
+        self._time_correction_connect = 0.0
+        self._readers = []
+        self._scheduler = scheduler
         self._executor = (
-            None
-            if self._acquisition_delay is None
-            else ThreadPoolExecutor(max_workers=1)
+            None if self._acquisition_delay is None else self._create_executor()
         )
         if self._executor is not None:
-            logger.debug("%s: ThreadPoolExecutor started.", self)
+            logger.debug("%s: executor started.", self)
         # This method needs to connect to a stream, retrieve the stream information and
         # create the ringbuffer. By the end of this method, the following variables
         # must exist:
@@ -361,6 +573,9 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         # - self._buffer: array of shape (n_samples, n_channels)
         # - self._timestamps: array of shape (n_samples,) with n_samples which differs
         #   between regularly and irregularly sampled streams.
+        # The buffers are circular buffers, written in-place with
+        # self._write_buffer(), and the sample following the most recent one is located
+        # at the position self._n_samples_acquired % n_samples.
         # - self._picks_inlet: array of shape (n_channels,)
         # plus any additional variables needed by the source and the stream-specific
         # methods.
@@ -369,6 +584,10 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         self,
         hpi_stream: BaseStream,
         format: str = "megin",  # noqa: A002
+        *,
+        min_interval: float | None = None,
+        min_translation: float | None = None,
+        min_rotation: float | None = None,
     ) -> BaseStream:
         """Connect to a stream that provides HPI data.
 
@@ -380,6 +599,17 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             The stream to connect to containing the HPI data in the right format.
         format : str
             The format of the HPI data. Currently, only ``"megin"`` is supported.
+        min_interval : float | None
+            Minimum time in seconds between 2 updates of the ``dev_head_t``. If
+            ``None``, every head position received updates the ``dev_head_t``.
+        min_translation : float | None
+            Minimum translation in meters of the head since the last update of the
+            ``dev_head_t`` to update it.
+        min_rotation : float | None
+            Minimum rotation in degrees of the head since the last update of the
+            ``dev_head_t`` to update it. If both ``min_translation`` and
+            ``min_rotation`` are ``None``, the ``dev_head_t`` is updated regardless of
+            the head movement, else it is updated if either threshold is exceeded.
 
         Returns
         -------
@@ -396,11 +626,28 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
               R21 R22 R23 T2
               R31 R32 R33 T3
               0   0   0   1
+
+        The head positions are stored without interrupting the acquisition of the
+        stream, and the ``dev_head_t`` is updated from the most recent head position
+        when :attr:`~mne_lsl.stream.StreamLSL.info` is accessed. The history of the
+        last 1024 head positions received can be queried with
+        :meth:`~mne_lsl.stream.StreamLSL.get_dev_head_t`.
         """
         self._check_connected("connect_hpi_stream()")
         check_type(hpi_stream, (BaseStream,), "hpi_stream")
         check_type(format, (str,), "format")
         check_value(format, ("megin",), "format")
+        for value, name in (
+            (min_interval, "min_interval"),
+            (min_translation, "min_translation"),
+            (min_rotation, "min_rotation"),
+        ):
+            check_type(value, ("numeric", None), name)
+            if value is not None and value < 0:
+                raise ValueError(
+                    f"The argument '{name}' must be a positive number or None. {value} "
+                    "is invalid."
+                )
 
         if not hpi_stream.connected:
             raise RuntimeError(
@@ -410,11 +657,17 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
 
         check_hpi_ch_names(hpi_stream.info["ch_names"], format)
         # Create and add callback to HPI stream that updates this stream's dev_head_t
+        positions = HeadPositions(
+            min_interval=min_interval,
+            min_translation=min_translation,
+            min_rotation=min_rotation,
+        )
         if format == "megin":
-            hpi_callback = create_hpi_callback_megin(self)
+            hpi_callback = create_hpi_callback_megin(self, positions)
             hpi_stream.add_callback(hpi_callback)
 
         # Store references for cleanup
+        self._head_positions = positions
         self._hpi_stream = hpi_stream
         self._hpi_callback = hpi_callback
 
@@ -456,6 +709,123 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         # This method needs to close any inlet/network object and need to end with
         # self._reset_variables().
 
+    def create_reader(self, name: str | None = None) -> StreamReader:
+        """Create a reader retrieving the new samples with its own read position.
+
+        Each reader keeps track of the samples it already retrieved, thus multiple
+        consumers of the same stream, e.g. a decoder, a visualization and a recorder,
+        can each retrieve every new sample once without interfering with each other or
+        with :meth:`~mne_lsl.stream.BaseStream.get_new_data`.
+
+        Parameters
+        ----------
+        name : str | None
+            Name of the reader, unique among the readers attached to the stream. If
+            ``None``, a name ``'reader-{idx}'`` is generated.
+
+        Returns
+        -------
+        reader : StreamReader
+            The reader, retrieving the samples acquired after its creation with
+            :meth:`~mne_lsl.stream.StreamReader.get_new_data`.
+
+        Notes
+        -----
+        A reader is detached from the stream with
+        :meth:`~mne_lsl.stream.StreamReader.close` or when the stream is disconnected.
+        """
+        self._check_connected("create_reader()")
+        if name is not None:
+            check_type(name, (str,), "name")
+        with self._lock:
+            names = [reader.name for reader in self._readers]
+            if name is None:
+                idx = len(self._readers)
+                while f"reader-{idx}" in names:
+                    idx += 1
+                name = f"reader-{idx}"
+            if name in names:
+                raise ValueError(
+                    f"A reader named '{name}' is already attached to the stream. "
+                    "Please provide a unique name or close the existing reader."
+                )
+            reader = StreamReader(self, name)
+            self._readers.append(reader)
+        return reader
+
+    @verbose
+    @fill_doc
+    def decimate(
+        self, factor: int, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Decimate the stream by an integer factor.
+
+        The new samples are filtered with a causal anti-aliasing filter and one sample
+        every ``factor`` samples is retained before being written in the buffer, thus
+        the buffer holds ``bufsize`` seconds of data at the decimated sampling
+        frequency.
+
+        .. code-block:: python
+
+            stream = Stream(2.0).connect()
+            stream.decimate(4)  # e.g. from 1 kHz to 250 Hz
+
+        Parameters
+        ----------
+        factor : int
+            The decimation factor, i.e. the ratio between the current and the new
+            sampling frequency.
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        The anti-aliasing filter is the 8th order Chebyshev type I low-pass filter used
+        by :func:`scipy.signal.decimate`, with a cutoff at 80%% of the new Nyquist
+        frequency. The measurement information ``info["sfreq"]`` and
+        ``info["lowpass"]`` are updated. The decimation must be done before adding
+        filters to the stream and before creating an
+        :class:`~mne_lsl.stream.EpochsStream`. The buffer is emptied.
+        """
+        self._check_connected_and_regular_sampling("decimate()")
+        self._check_not_epoched("decimate()")
+        factor = ensure_int(factor, "factor")
+        if factor < 1:
+            raise ValueError(
+                "The decimation factor must be a strictly positive integer. The "
+                f"provided {factor} is invalid."
+            )
+        if len(self._filters) != 0:
+            raise RuntimeError(
+                "The decimation must be done before adding filters to the Stream."
+            )
+        if factor == 1:
+            return self
+        sfreq = self._info["sfreq"] / factor
+        if self._decimator is not None:  # decimate further the input samples
+            factor *= self._decimator.factor
+        n_buffer = ceil(self._bufsize * sfreq)
+        with self._interrupt_acquisition():
+            self._decimator = Decimator(factor)
+            with self._info._unlock():
+                self._info["sfreq"] = sfreq
+                lowpass = self._info.get("lowpass")
+                lowpass = np.inf if lowpass is None else lowpass
+                self._info["lowpass"] = min(lowpass, sfreq / 2.0)
+            self._buffer = np.zeros(
+                (n_buffer, self._buffer.shape[1]), dtype=self._buffer.dtype
+            )
+            self._timestamps = np.zeros(n_buffer, dtype=np.float64)
+            self._n_samples_acquired = 0
+            self._n_new_samples = 0
+            for reader in self._readers:
+                reader._n_samples_read = 0
+        return self
+
     def del_filter(self, idx: int | list[int] | tuple[int, ...] | str = "all") -> None:
         """Remove a filter from the list of applied filters.
 
@@ -530,10 +900,24 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             )
         # interrupt acquisition and apply changes
         with self._interrupt_acquisition():
+            self._store_filters_initial_conditions()
             for k in filters2reset:
                 self._filters[k]["zi"] = None
             for k in idx[::-1]:
                 del self._filters[k]
+            self._filter_chains = compile_filters(self._filters)
+
+    def disable_stats(self) -> BaseStream:
+        """Disable the statistics of the acquisition loop.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+        self._check_connected("disable_stats()")
+        self._stats = None
+        return self
 
     def drop_channels(self, ch_names: str | list[str] | tuple[str, ...]) -> BaseStream:
         """Drop channel(s).
@@ -568,6 +952,34 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         self._pick(picks)
         return self
 
+    def enable_stats(self, window: int = 1024) -> BaseStream:
+        """Enable the statistics of the acquisition loop.
+
+        The duration of each stage of the acquisition loop, the number of samples
+        pulled and the period of the loop are recorded and can be retrieved with
+        :attr:`~mne_lsl.stream.StreamLSL.stats`. When the statistics are disabled, the
+        acquisition loop skips the measurements.
+
+        Parameters
+        ----------
+        window : int
+            Number of acquisitions on which the statistics are computed.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+        self._check_connected("enable_stats()")
+        window = ensure_int(window, "window")
+        if window <= 0:
+            raise ValueError(
+                "The argument 'window' must be a strictly positive integer. "
+                f"{window} is invalid."
+            )
+        self._stats = AcquisitionStats(window)
+        return self
+
     @verbose
     @fill_doc
     def filter(
@@ -576,10 +988,11 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         h_freq: float | None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         iir_params: dict[str, Any] | None = None,
+        method: str = "iir",
         *,
         verbose: bool | str | int | None = None,
     ) -> BaseStream:  # noqa: A003
-        """Filter the stream with an IIR causal filter.
+        """Filter the stream with an IIR or FIR causal filter.
 
         Once a filter is applied, the buffer is updated in real-time with the filtered
         data. It is possible to apply more than one filter.
@@ -589,6 +1002,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             stream = Stream(2.0).connect()
             stream.filter(1.0, 40.0, picks="eeg")
             stream.filter(1.0, 15.0, picks="ecg").filter(0.1, 5, picks="EDA")
+            stream.filter(None, 30.0, picks="eeg", method="fir")
 
         Parameters
         ----------
@@ -596,6 +1010,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         %(h_freq)s
         %(picks_all)s
         %(iir_params)s
+        method : ``"iir"`` | ``"fir"``
+            ``"iir"`` applies a causal IIR filter with second-order sections. ``"fir"``
+            applies a linear-phase FIR filter designed with the default parameters of
+            :func:`mne.filter.create_filter`, with an overlap-save FFT convolution.
+            Since the FIR filter is causal, it delays the signal by half its length.
+            ``iir_params`` is ignored for FIR filters.
         %(verbose)s
 
         Returns
@@ -616,18 +1036,26 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             )
         # validate the arguments and ensure 'sos' output
         picks = _picks_to_idx(self._info, picks, "all", "bads", allow_empty=False)
-        iir_params = ensure_sos_iir_params(iir_params)
-        # construct an IIR filter
-        filt = create_filter(
-            sfreq=self._info["sfreq"],
-            l_freq=l_freq,
-            h_freq=h_freq,
-            iir_params=iir_params,
-        )
+        check_value(method, ("iir", "fir"), "method")
+        if method == "fir":
+            filt = create_fir_filter(
+                sfreq=self._info["sfreq"], l_freq=l_freq, h_freq=h_freq
+            )
+        else:
+            iir_params = ensure_sos_iir_params(iir_params)
+            # construct an IIR filter
+            filt = create_filter(
+                sfreq=self._info["sfreq"],
+                l_freq=l_freq,
+                h_freq=h_freq,
+                iir_params=iir_params,
+            )
         filt.update(picks=picks)  # channel selection
         # add filter to the list of applied filters
         with self._interrupt_acquisition():
+            self._store_filters_initial_conditions()
             self._filters.append(StreamFilter(filt))
+            self._filter_chains = compile_filters(self._filters)
         return self
 
     @copy_doc(ContainsMixin.get_channel_types)
@@ -681,6 +1109,8 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         winsize: float | None = None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         exclude: str | list[str] | tuple[str, ...] = "bads",
+        out: ScalarArray | None = None,
+        out_ts: NDArray[np.float64] | None = None,
     ) -> tuple[ScalarArray, NDArray[np.float64]]:
         """Retrieve the latest data from the buffer.
 
@@ -695,19 +1125,31 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             buffer is returned.
         %(picks_all)s
         %(exclude)s
+        out : array of shape (n_channels, n_samples) | None
+            If provided, the data is written in this pre-allocated array instead of a
+            new array. The array must have the same dtype as the stream and the number
+            of samples must match the window size, capped at the buffer size.
+        out_ts : array of shape (n_samples,) | None
+            If provided, the timestamps are written in this pre-allocated array of
+            ``float64`` instead of a new array.
 
         Returns
         -------
         data : array of shape (n_channels, n_samples)
-            Data in the given window.
+            Data in the given window. If ``out`` is provided, ``out`` is returned.
         timestamps : array of shape (n_samples,)
-            Timestamps in the given window.
+            Timestamps in the given window. If ``out_ts`` is provided, ``out_ts`` is
+            returned.
 
         Notes
         -----
         The number of newly available samples stored in the property ``n_new_samples``
         is reset at every function call, even if all channels were not selected with the
         argument ``picks``.
+
+        Retrieving the data in pre-allocated arrays avoids allocating new arrays at
+        every call, e.g. in a fast decoding loop. The copy is faster if the selected
+        channels are contiguous in the buffer, e.g. all the channels of a given type.
         """
         try:
             if winsize is None:
@@ -721,19 +1163,35 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                     if self._info["sfreq"] == 0
                     else ceil(winsize * self._info["sfreq"])
                 )
-            # Support channel selection since the performance impact is small.
+            # Support channel selection since the performance impact is small, the
+            # resolved selections are cached as _picks_to_idx can be slow:
             # >>> %timeit _picks_to_idx(raw.info, "eeg")
             # 256 µs ± 5.03 µs per loop
             # >>> %timeit _picks_to_idx(raw.info, ["F7", "vEOG"])
             # 8.68 µs ± 113 ns per loop
             # >>> %timeit _picks_to_idx(raw.info, None)
             # 253 µs ± 1.22 µs per loop
-            picks = _picks_to_idx(self._info, picks, none="all", exclude=exclude)
+            picks = self._picks_cache.get(self._info, picks, exclude, none="all")
+            n_samples = min(n_samples, self._buffer.shape[0])
+            if out is not None:
+                check_out_array(out, (picks.size, n_samples), self._buffer.dtype, "out")
+            if out_ts is not None:
+                check_out_array(out_ts, (n_samples,), np.float64, "out_ts")
+            # the buffer is written in-place, thus the window must be copied while the
+            # acquisition thread is locked out.
             with self._lock:
                 self._n_new_samples = 0  # reset the number of new samples
-                buffer_ref = self._buffer
-                ts_ref = self._timestamps
-            return buffer_ref[-n_samples:, picks].T, ts_ref[-n_samples:]
+                data = read_ring_buffer(
+                    self._buffer,
+                    self._n_samples_acquired,
+                    n_samples,
+                    picks,
+                    None if out is None else out.T,  # view with the buffer layout
+                )
+                ts = read_ring_buffer(
+                    self._timestamps, self._n_samples_acquired, n_samples, out=out_ts
+                )
+            return data.T if out is None else out, ts
         except Exception:
             if not self.connected:
                 raise RuntimeError(
@@ -748,18 +1206,111 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 )
             raise  # pragma: no cover
 
+    def get_dev_head_t(self, timestamp: float | None = None) -> Transform | None:
+        """Get the device to head transformation received from the HPI stream.
+
+        Parameters
+        ----------
+        timestamp : float | None
+            Time at which the transformation is retrieved, in the clock of the HPI
+            stream. If ``None``, the most recent transformation received is returned.
+
+        Returns
+        -------
+        trans : Transform | None
+            The most recent transformation received before or at ``timestamp``, or
+            ``None`` if no such transformation is retained in the history.
+
+        Notes
+        -----
+        The history retains the last 1024 transformations received from the HPI stream
+        connected with :meth:`~mne_lsl.stream.StreamLSL.connect_hpi_stream`, regardless
+        of the arguments ``min_interval``, ``min_translation`` and ``min_rotation``.
+        """
+        self._check_connected("get_dev_head_t()")
+        if self._head_positions is None:
+            raise RuntimeError(
+                "No HPI stream is connected. Please connect an HPI stream with "
+                "Stream.connect_hpi_stream() to retrieve the device to head "
+                "transformations."
+            )
+        check_type(timestamp, ("numeric", None), "timestamp")
+        return self._head_positions.get(timestamp)
+
     @copy_doc(SetChannelsMixin.get_montage)
     def get_montage(self) -> DigMontage | None:
         self._check_connected("get_montage()")
         return super().get_montage()
 
+    @fill_doc
+    def get_new_data(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> tuple[ScalarArray, NDArray[np.float64], bool]:
+        """Retrieve the samples added to the buffer since the last call.
+
+        Contrary to :meth:`~mne_lsl.stream.BaseStream.get_data`, which returns a window
+        of the latest samples, this method returns each sample only once, which is
+        convenient to process the stream incrementally.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Returns
+        -------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the last call.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        overrun : bool
+            True if more samples than the buffer can hold were acquired since the last
+            call, in which case the oldest samples were overwritten before being
+            retrieved and only the last ``n_buffer`` samples are returned.
+
+        Notes
+        -----
+        The first call returns all the samples acquired since the connection, within
+        the limit of the buffer size. To retrieve the new samples from several
+        independent consumers, use one reader per consumer, created with
+        :meth:`~mne_lsl.stream.BaseStream.create_reader`.
+
+        The read position of this method is independent of the property
+        ``n_new_samples``, which is not reset by this method.
+        """
+        try:
+            picks = self._picks_cache.get(self._info, picks, exclude, none="all")
+            with self._lock:
+                data, ts, n_lost = self._read_new_samples(self._n_samples_read, picks)
+                self._n_samples_read = self._n_samples_acquired
+            return data.T, ts, n_lost != 0
+        except Exception:
+            if not self.connected:
+                raise RuntimeError(
+                    "The Stream is not connected. Please connect to the stream before "
+                    "retrieving data from the buffer."
+                )
+            else:  # pragma: no cover
+                logger.error(
+                    "Something went wrong while retrieving data from a connected "
+                    "stream. Please open an issue on GitHub and provide the error "
+                    "traceback to the developers."
+                )
+            raise  # pragma: no cover
+
     @verbose
     @fill_doc
     def notch_filter(
         self,
-        freqs: float,
+        freqs: float | list[float] | tuple[float, ...] | ScalarArray,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
-        notch_widths: float | None = None,
+        notch_widths: float
+        | list[float]
+        | tuple[float, ...]
+        | ScalarArray
+        | None = None,
         trans_bandwidth=1,
         iir_params: dict[str, Any] | None = None,
         *,
@@ -775,15 +1326,19 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             stream = Stream(2.0).connect()
             stream.filter(1.0, 40.0, picks="eeg")
             stream.notch_filter(50, picks="ecg")
+            stream.notch_filter([50, 100, 150], picks="eeg")
 
         Parameters
         ----------
-        freqs : float
+        freqs : float | array-like of float
             Specific frequencies to filter out from data, e.g. ``60`` Hz in the US or
-            ``50`` Hz in Europe for line noise.
+            ``50`` Hz in Europe for line noise. If several frequencies are provided,
+            e.g. the line noise and its harmonics, the notch filters are combined in a
+            single filter with a single state.
         %(picks_all)s
-        notch_widths : float | None
-            Width of the stop band in Hz. If ``None``, ``freqs / 200`` is used.
+        notch_widths : float | array-like of float | None
+            Width of the stop band in Hz. If ``None``, ``freqs / 200`` is used. If an
+            array-like is provided, it must contain one width per frequency.
         trans_bandwidth : float
             Width of the transition band in Hz.
         %(iir_params)s
@@ -806,8 +1361,16 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "filters will alter the filters in the future epochs."
             )
         # validate the arguments and ensure 'sos' output
-        check_type(freqs, ("numeric",), "freqs")
-        if freqs < 0:
+        check_type(freqs, ("numeric", list, tuple, np.ndarray), "freqs")
+        freqs = np.atleast_1d(freqs)
+        for freq in freqs:
+            check_type(freq, ("numeric",), "freqs")
+        if freqs.ndim != 1 or freqs.size == 0:
+            raise ValueError(
+                "The notch frequencies must be provided as a number or as a non-empty "
+                f"1D array-like of numbers. The provided {freqs} is invalid."
+            )
+        if np.any(freqs < 0):
             raise ValueError(
                 "The notch frequency must be a positive number defining the frequency "
                 f"to filter out in Hz. The provided {freqs} is invalid."
@@ -815,8 +1378,19 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         picks = _picks_to_idx(self._info, picks, "all", "bads", allow_empty=False)
         if notch_widths is None:
             notch_widths = freqs / 200.0
-        check_type(notch_widths, ("numeric",), "notch_widths")
-        if notch_widths < 0:
+        check_type(notch_widths, ("numeric", list, tuple, np.ndarray), "notch_widths")
+        notch_widths = np.atleast_1d(notch_widths)
+        for notch_width in notch_widths:
+            check_type(notch_width, ("numeric",), "notch_widths")
+        if notch_widths.size == 1:
+            notch_widths = np.repeat(notch_widths, freqs.size)
+        if notch_widths.shape != freqs.shape:
+            raise ValueError(
+                "The notch widths must be provided as a number or as an array-like "
+                f"with one width per frequency. The provided {notch_widths} is invalid "
+                f"for {freqs.size} frequencies."
+            )
+        if np.any(notch_widths < 0):
             raise ValueError(
                 "The notch width must be a positive number defining the width of the "
                 f"stop band in Hz. The provided {notch_widths} is invalid."
@@ -829,20 +1403,26 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "invalid."
             )
         iir_params = ensure_sos_iir_params(iir_params)
-        # compute fourier coefficients
-        low = freqs - notch_widths / 2.0 - trans_bandwidth / 2.0
-        high = freqs + notch_widths / 2.0 + trans_bandwidth / 2.0
-        # construct an IIR filter
-        filt = create_filter(
-            sfreq=self._info["sfreq"],
-            l_freq=high,
-            h_freq=low,
-            iir_params=iir_params,
-        )
+        # compute fourier coefficients and construct one IIR filter per frequency
+        filts = list()
+        for freq, notch_width in zip(freqs, notch_widths, strict=True):
+            low = freq - notch_width / 2.0 - trans_bandwidth / 2.0
+            high = freq + notch_width / 2.0 + trans_bandwidth / 2.0
+            filts.append(
+                create_filter(
+                    sfreq=self._info["sfreq"],
+                    l_freq=high.item(),
+                    h_freq=low.item(),
+                    iir_params=iir_params,
+                )
+            )
+        filt = filts[0] if len(filts) == 1 else combine_filters(filts)
         filt.update(picks=picks)  # channel selection
         # add filter to the list of applied filters
         with self._interrupt_acquisition():
+            self._store_filters_initial_conditions()
             self._filters.append(StreamFilter(filt))
+            self._filter_chains = compile_filters(self._filters)
         return self
 
     def plot(self):  # pragma: no cover
@@ -927,8 +1507,47 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             allow_duplicates=allow_duplicates,
             verbose=logger.level if verbose is None else verbose,
         )
+        self._picks_cache.clear()
         return self
 
+    @verbose
+    @fill_doc
+    def resample(
+        self, sfreq: float, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Resample the stream to a lower sampling frequency.
+
+        Only resampling by an integer decimation factor is supported, see
+        :meth:`~mne_lsl.stream.StreamLSL.decimate`.
+
+        Parameters
+        ----------
+        sfreq : float
+            The new sampling frequency in Hz. The current sampling frequency must be an
+            integer multiple of ``sfreq``.
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+        self._check_connected_and_regular_sampling("resample()")
+        check_type(sfreq, ("numeric",), "sfreq")
+        if sfreq <= 0:
+            raise ValueError(
+                "The sampling frequency must be a strictly positive number. The "
+                f"provided {sfreq} is invalid."
+            )
+        factor = self._info["sfreq"] / sfreq
+        if not np.isclose(factor, round(factor)) or round(factor) < 1:
+            raise ValueError(
+                "Only resampling to a sampling frequency which divides the current "
+                f"sampling frequency {self._info['sfreq']} Hz by an integer factor is "
+                f"supported. The provided {sfreq} Hz is invalid."
+            )
+        return self.decimate(round(factor))
+
     def set_bipolar_reference(self) -> BaseStream:  # pragma: no cover
         """Set a bipolar reference. Not implemented.
 
@@ -981,6 +1600,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             on_unit_change=on_unit_change,
             verbose=logger.level if verbose is None else verbose,
         )
+        self._picks_cache.clear()
         return self
 
     def set_channel_units(self, mapping: dict[str, str | int]) -> BaseStream:
@@ -1078,11 +1698,13 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 f"The new reference channel(s) must be of the type(s) {ch_type} "
                 "provided in the argument 'ch_type'."
             )
+        # operator of shape (n_channels, n_channels) applied on the right of the data
+        operator = np.eye(len(self.ch_names))
+        operator[np.ix_(picks_ref, picks)] -= 1 / picks_ref.size
         with self._interrupt_acquisition():
             self._ref_channels = picks_ref
             self._ref_from = picks
-            data_ref = self._buffer[:, self._ref_channels].mean(axis=1, keepdims=True)
-            self._buffer[:, self._ref_from] -= data_ref
+            self._compose_spatial_operator(operator)
             with self._info._unlock():
                 self._info["custom_ref_applied"] = FIFF.FIFFV_MNE_CUSTOM_REF_ON
         return self
@@ -1167,10 +1789,51 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         )
         return self
 
+    def set_sleep_strategy(
+        self, method: str | None = "hybrid", spin: float = 0.0002
+    ) -> BaseStream:
+        """Set the strategy used to wait between 2 acquisitions.
+
+        Parameters
+        ----------
+        method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'`` | None
+            The waiting method, see :func:`mne_lsl.set_sleep_strategy`. If ``None``,
+            the default strategy set with :func:`mne_lsl.set_sleep_strategy` is used.
+        spin : float
+            Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+            ``'deadline'`` wait. ``0`` disables the busy-wait.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        When the statistics are enabled with
+        :meth:`~mne_lsl.stream.StreamLSL.enable_stats`, the delay between the end of
+        the wait requested and the wake-up is recorded as the metric ``'wakeup'``. The
+        strategy is not used if the stream is connected with an
+        :class:`~mne_lsl.stream.AcquisitionScheduler`, which wakes up at the deadline of
+        each acquisition.
+        """
+        self._check_connected("set_sleep_strategy()")
+        self._sleep_strategy = None if method is None else SleepStrategy(method, spin)
+        return self
+
     @abstractmethod
     def _acquire(self) -> None:  # pragma: no cover
         """Update function pulling new samples in the buffer at a regular interval."""
 
+    def _apply_dev_head_t(self) -> None:
+        """Update the dev_head_t from the most recent head position stored."""
+        latest = self._head_positions.latest  # read once, replaced atomically
+        if latest is None or latest is self._dev_head_t_applied:
+            return
+        with self._info._unlock(update_redundant=False, check_after=False):
+            self._info["dev_head_t"] = latest[1]
+        self._dev_head_t_applied = latest
+
     def _check_connected(self, name: str) -> None:
         """Check that the stream is connected before calling the function 'name'."""
         if not self.connected:
@@ -1196,27 +1859,47 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "being epoched by an EpochsStream."
             )
 
+    def _compose_spatial_operator(self, operator: ScalarArray) -> None:
+        """Compose a linear operator with the spatial operator of the stream.
+
+        This method must be called while the acquisition is interrupted. The operator is
+        also applied to the samples already in the buffer.
+
+        Parameters
+        ----------
+        operator : array of shape (n_channels, n_channels)
+            The linear operator, applied on the right of data arrays of shape
+            ``(n_samples, n_channels)``.
+        """
+        if self._spatial_operator is None:
+            # embed the channels of the inlet, the added channels are set to zeros
+            self._spatial_operator = np.eye(self._picks_inlet.size, len(self.ch_names))
+        self._spatial_operator = self._spatial_operator @ operator
+        self._buffer[:] = self._buffer @ operator
+
+    def _create_executor(self) -> ThreadPoolExecutor | _ScheduledExecutor:
+        """Create the executor running the acquisition jobs."""
+        if self._scheduler is None:
+            return ThreadPoolExecutor(max_workers=1)
+        return self._scheduler._create_executor()
+
     @contextmanager
     def _interrupt_acquisition(self):
-        """Context manager interrupting the acquisition thread."""
+        """Context manager pausing the acquisition.
+
+        The acquisition holds the lock ``_acquisition_lock`` while it processes new
+        samples, thus the context manager waits for the running acquisition to complete
+        and the following acquisitions wait until the context manager exits. The
+        acquisition thread is left running.
+        """
         if not self.connected:
             raise RuntimeError(
                 "Interruption of the acquisition thread was requested but the stream "
                 "is not connected. Please open an issue on GitHub and provide the "
                 "error traceback to the developers."
             )
-        # it's simpler to shutdown the executor entirely and create a new one
-        if self._executor is not None:
-            self._executor.shutdown(wait=True, cancel_futures=True)
-            with self._lock:
-                try:  # ensure "finally" is reached even when failures occur
-                    yield
-                finally:
-                    self._executor = ThreadPoolExecutor(max_workers=1)
-                    self._executor.submit(self._acquire)
-        else:
-            with self._lock:
-                yield
+        with self._acquisition_lock, self._lock:
+            yield
 
     def _pick(self, picks: ScalarIntArray) -> None:
         """Interrupt acquisition and apply the channel selection."""
@@ -1240,8 +1923,14 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "The channel selection must be done before adding filters to the "
                 "Stream."
             )
+        if self._spatial_operator is not None:
+            raise RuntimeError(
+                "The channel selection must be done before applying a spatial filter "
+                "to the Stream."
+            )
         with self._interrupt_acquisition():
             self._info = pick_info(self._info, picks, verbose=logger.level)
+            self._picks_cache.clear()
             self._picks_inlet = self._picks_inlet[picks_inlet]
             self._buffer = self._buffer[:, picks]
             # prune added channels which are not part of the inlet
@@ -1249,6 +1938,39 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 if ch not in self.ch_names:
                     self._added_channels.remove(ch)
 
+    def _read_new_samples(
+        self, start: int, picks: ScalarIntArray
+    ) -> tuple[ScalarArray, NDArray[np.float64], int]:
+        """Read the samples acquired since an absolute position in the buffer.
+
+        This method must be called while holding the lock of the stream.
+
+        Parameters
+        ----------
+        start : int
+            Absolute position of the first sample to read, e.g. the number of samples
+            acquired at the time of the previous read.
+        picks : array of int
+            Selection of channels to read.
+
+        Returns
+        -------
+        data : array of shape (n_samples, n_channels)
+            Samples acquired since ``start``, within the limit of the buffer size.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the samples.
+        n_lost : int
+            Number of samples acquired since ``start`` which were overwritten in the
+            buffer before being read.
+        """
+        n_samples = self._n_samples_acquired - start
+        n_lost = max(n_samples - self._timestamps.size, 0)
+        data = read_ring_buffer(
+            self._buffer, self._n_samples_acquired, n_samples, picks
+        )
+        ts = read_ring_buffer(self._timestamps, self._n_samples_acquired, n_samples)
+        return data, ts, n_lost
+
     @abstractmethod
     def _reset_variables(self) -> None:
         """Reset variables define after connection."""
@@ -1256,30 +1978,101 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         self._added_channels = []
         self._buffer = None
         self._callbacks = []
+        self._decimator = None
         self._epochs = []
         self._executor = None
+        self._filter_chains = []
+        self._dev_head_t_applied = None
         self._filters = []
+        self._head_positions = None
         self._hpi_stream = None
         self._hpi_callback = None
         self._info = None
+        self._latency = None
         self._n_new_samples = None
+        self._n_overrun = None
+        self._n_samples_acquired = None
+        self._n_samples_read = None
+        self._n_truncated = None
+        self._picks_cache = PicksCache()
         self._picks_inlet = None
+        self._readers = []
         self._ref_channels = None
         self._ref_from = None
+        self._scheduler = None
+        self._sleep_strategy = None
+        self._spatial_operator = None
+        self._stats = None
+        self._time_correction = None
+        self._time_correction_connect = None
         self._timestamps = None
+        # wake up the asynchronous iterators, which stop once disconnected
+        self._notifier.notify()
         # This method needs to reset any stream-system-specific variables, e.g. an inlet
         # or a StreamInfo for LSL streams.
 
+    def _store_filters_initial_conditions(self) -> None:
+        """Store the states of the fused filter cascades in the applied filters."""
+        for chain in self._filter_chains:
+            chain.store_initial_conditions()
+
     def _submit_acquisition_job(self) -> None:
         """Submit a new acquisition job, if applicable."""
         if self._executor is None:
             return  # either shutdown or manual acquisition
-        high_precision_sleep(self._acquisition_delay)
+        if self._scheduler is not None:
+            # the scheduler wakes up at the deadline, the worker is not blocked
+            try:
+                self._executor.schedule(self._acquisition_delay, self._acquire)
+            except RuntimeError:  # pragma: no cover
+                pass  # shutdown
+            return
+        if self._acquisition_delay != 0:  # else, the acquisition waits for new samples
+            strategy = (
+                get_sleep_strategy()
+                if self._sleep_strategy is None
+                else self._sleep_strategy
+            )
+            lateness = strategy(self._acquisition_delay)
+            if self._stats is not None:
+                self._stats.add("wakeup", lateness)
         try:
             self._executor.submit(self._acquire)
         except RuntimeError:  # pragma: no cover
             pass  # shutdown
 
+    def _write_buffer(self, data: ScalarArray, timestamps: NDArray[np.float64]) -> None:
+        """Write new samples in-place in the circular buffers.
+
+        Parameters
+        ----------
+        data : array of shape (n_samples, n_channels)
+            New samples, with ``n_samples`` smaller or equal to the buffer size.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        """
+        with self._lock:
+            write_ring_buffer(self._buffer, data, self._n_samples_acquired)
+            write_ring_buffer(self._timestamps, timestamps, self._n_samples_acquired)
+            self._n_samples_acquired += timestamps.size
+            # update the number of new samples available and count the samples
+            # overwritten before being retrieved with Stream.get_data()
+            self._n_new_samples += timestamps.size
+            n_overrun = min(
+                timestamps.size, self._n_new_samples - self._timestamps.size
+            )
+            first_overrun = 0 < n_overrun and self._n_overrun == 0
+            self._n_overrun += max(n_overrun, 0)
+        self._notifier.notify()
+        if first_overrun:
+            logger.info(
+                "The number of new samples exceeds the buffer size. Consider using "
+                "a larger buffer by creating a Stream with a larger 'bufsize' "
+                "argument or consider retrieving new samples more often with "
+                "Stream.get_data(). The number of samples overwritten is counted in "
+                "Stream.metrics."
+            )
+
     # ----------------------------------------------------------------------------------
     @property
     def callbacks(self) -> list[Callable]:
@@ -1338,6 +2131,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
 
         :type: :class:`list` of ```StreamFilter``
         """
+        self._store_filters_initial_conditions()
         return self._filters
 
     @property
@@ -1351,8 +2145,40 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "The stream information is parsed into an mne.Info object "
                 "upon connection. Please connect to the stream to create the mne.Info."
             )
+        if self._head_positions is not None:
+            self._apply_dev_head_t()
         return self._info
 
+    @property
+    def metrics(self) -> dict[str, int | float | None]:
+        """End-to-end metrics of the acquisition since the connection.
+
+        The metrics are:
+
+        * ``'n_overrun'``: number of samples overwritten in the buffer before being
+          retrieved with :meth:`~mne_lsl.stream.StreamLSL.get_data`.
+        * ``'n_truncated'``: number of samples pulled from the source but discarded
+          because an acquisition retrieved more samples than the buffer can hold.
+        * ``'time_correction'``: latest estimate of the offset in seconds between the
+          clock of the source and the local clock.
+        * ``'clock_drift'``: change in seconds of the clock offset since the
+          connection.
+        * ``'latency'``: delay in seconds between the acquisition of the most recent
+          sample by the source and its write in the buffer, measured on the local
+          clock. ``None`` until a sample is written in the buffer. The latency is
+          negative if the source timestamps the samples ahead of time.
+
+        :type: :class:`dict`
+        """
+        self._check_connected("metrics")
+        return dict(
+            n_overrun=self._n_overrun,
+            n_truncated=self._n_truncated,
+            time_correction=self._time_correction,
+            clock_drift=self._time_correction - self._time_correction_connect,
+            latency=self._latency,
+        )
+
     @property
     def n_buffer(self) -> int:
         """Number of samples that can be stored in the buffer.
@@ -1372,3 +2198,25 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         """
         self._check_connected("n_new_samples")
         return self._n_new_samples
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]] | None:
+        """Statistics of the acquisition loop, if enabled.
+
+        The statistics are enabled with :meth:`~mne_lsl.stream.StreamLSL.enable_stats`.
+        For each metric, a dictionary with the keys ``'n'`` (number of values recorded),
+        ``'p50'``, ``'p99'`` and ``'max'`` (computed on the last ``window`` values) is
+        provided. The metrics are the period of the acquisition loop ``'period'`` and
+        the number of samples pulled ``'n_samples'``, and the durations in seconds of
+        the stages ``'pull'`` (retrieval from the inlet), ``'spatial'`` (added
+        channels, reference, projectors and spatial filters), ``'decimate'``,
+        ``'filters'``, ``'callbacks'``, ``'write'`` (write in the buffer) and
+        ``'total'`` (acquisition of a non-empty chunk). The ``'latency'`` between the
+        acquisition of the most recent sample by the source and its write in the buffer
+        is also recorded, see :attr:`~mne_lsl.stream.StreamLSL.metrics`, and the delay
+        ``'wakeup'`` between the end of the wait requested between 2 acquisitions and
+        the wake-up, see :meth:`~mne_lsl.stream.StreamLSL.set_sleep_strategy`.
+
+        :type: :class:`dict` | None
+        """
+        return None if self._stats is None else self._stats.summary()
@@ -1,16 +1,16 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Generator
+from collections.abc import AsyncIterator, Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 from _typeshed import Incomplete
-from mne import Info
+from mne import Info, Transform
 from mne._fiff.meas_info import ContainsMixin, SetChannelsMixin
 from mne.channels import DigMontage
-from numpy.typing import DTypeLike
-from numpy.typing import NDArray as NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from .._typing import ScalarArray as ScalarArray
 from .._typing import ScalarIntArray as ScalarIntArray
@@ -19,17 +19,32 @@ from ..utils._checks import check_value as check_value
 from ..utils._checks import ensure_int as ensure_int
 from ..utils._docs import copy_doc as copy_doc
 from ..utils._docs import fill_doc as fill_doc
-from ..utils._time import high_precision_sleep as high_precision_sleep
+from ..utils._time import SleepStrategy as SleepStrategy
+from ..utils._time import get_sleep_strategy as get_sleep_strategy
 from ..utils.logs import logger as logger
 from ..utils.logs import verbose as verbose
 from ..utils.logs import warn as warn
 from ..utils.meas_info import _HUMAN_UNITS as _HUMAN_UNITS
 from ..utils.meas_info import _set_channel_units as _set_channel_units
+from ._async import AsyncNotifier as AsyncNotifier
+from ._buffer import check_out_array as check_out_array
+from ._buffer import read_ring_buffer as read_ring_buffer
+from ._buffer import write_ring_buffer as write_ring_buffer
+from ._filters import Decimator as Decimator
 from ._filters import StreamFilter as StreamFilter
+from ._filters import combine_filters as combine_filters
+from ._filters import compile_filters as compile_filters
 from ._filters import create_filter as create_filter
+from ._filters import create_fir_filter as create_fir_filter
 from ._filters import ensure_sos_iir_params as ensure_sos_iir_params
+from ._hpi import HeadPositions as HeadPositions
 from ._hpi import check_hpi_ch_names as check_hpi_ch_names
 from ._hpi import create_hpi_callback_megin as create_hpi_callback_megin
+from ._picks import PicksCache as PicksCache
+from ._stats import AcquisitionStats as AcquisitionStats
+from .reader import StreamReader as StreamReader
+from .scheduler import AcquisitionScheduler as AcquisitionScheduler
+from .scheduler import _ScheduledExecutor as _ScheduledExecutor
 
 class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
     """Stream object representing a single real-time stream.
@@ -46,7 +61,9 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
 
     _bufsize: Incomplete
     _lock: Incomplete
+    _acquisition_lock: Incomplete
     _callbacks: Incomplete
+    _notifier: Incomplete
 
     @abstractmethod
     def __init__(self, bufsize: float): ...
@@ -143,6 +160,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         Callback(s) are removed when the stream is disconnected.
         """
     _buffer: Incomplete
+    _spatial_operator: Incomplete
 
     @fill_doc
     def add_reference_channels(
@@ -181,6 +199,51 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         buffer <resources/implementations:StreamLSL>`.
         """
 
+    @fill_doc
+    async def aiter_chunks(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> AsyncIterator[tuple[ScalarArray, NDArray[np.float64]]]:
+        """Iterate asynchronously over the new samples.
+
+        The iterator awaits the new samples without polling: the acquisition thread
+        wakes up the event loop running the iterator every time new samples are added
+        to the buffer.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Yields
+        ------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the previous iteration.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+
+        Notes
+        -----
+        Each iterator retrieves the new samples with its own
+        :class:`~mne_lsl.stream.StreamReader`, thus multiple iterators, e.g. one per
+        client of a service, can iterate over the same stream independently of each
+        other and of :meth:`~mne_lsl.stream.BaseStream.get_new_data`. The reader is
+        closed when the iterator is closed, e.g. with :func:`contextlib.aclosing`.
+
+        The first iteration yields the samples acquired after the iterator started and
+        the iteration stops when the stream is disconnected. If the iterator does not
+        keep up with the acquisition, the oldest samples are overwritten in the buffer
+        and counted in the property ``n_overrun`` of the reader.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            async for data, ts in stream.aiter_chunks(picks="eeg"):
+                await websocket.send(data.tobytes())
+        """
+
     @verbose
     @fill_doc
     def anonymize(
@@ -243,32 +306,138 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
 
         Operates in place.
         """
+
+    @verbose
+    @fill_doc
+    def apply_proj(self, *, verbose: bool | str | int | None = None) -> BaseStream:
+        """Apply the signal-space projectors in real-time.
+
+        The inactive projectors in ``info["projs"]`` are folded in the spatial operator
+        applied to the new samples, see
+        :meth:`~mne_lsl.stream.StreamLSL.apply_spatial_filter`, and are marked as
+        active.
+
+        Parameters
+        ----------
+        verbose : int | str | bool | None
+            Sets the verbosity level. The verbosity increases gradually between
+            ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
+            If None is provided, the verbosity is set to the currently set logger's level.
+            If a bool is provided, the verbosity is set to ``"WARNING"`` for False and
+            to ``"INFO"`` for True.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+
+    @verbose
+    @fill_doc
+    def apply_spatial_filter(
+        self, matrix: ScalarArray, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Apply a linear spatial filter in real-time.
+
+        The new samples ``x`` of shape ``(n_channels,)`` are replaced by ``matrix @ x``
+        before being filtered and written in the buffer. The samples already in the
+        buffer are replaced as well.
+
+        .. code-block:: python
+
+            stream = Stream(2.0).connect()
+            # common average reference
+            n_channels = len(stream.ch_names)
+            matrix = np.eye(n_channels) - np.full(
+                (n_channels, n_channels), 1 / n_channels
+            )
+            stream.apply_spatial_filter(matrix)
+
+        Parameters
+        ----------
+        matrix : array of shape (n_channels, n_channels)
+            The spatial filter, applied on all the channels of the stream in the order
+            of ``Stream.ch_names``. The channels are not renamed, e.g. the bipolar
+            derivation ``F3-F7`` can replace the channel ``F3`` with the row
+            ``matrix[F3]`` set to ``+1`` on ``F3`` and ``-1`` on ``F7``.
+        verbose : int | str | bool | None
+            Sets the verbosity level. The verbosity increases gradually between
+            ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
+            If None is provided, the verbosity is set to the currently set logger's level.
+            If a bool is provided, the verbosity is set to ``"WARNING"`` for False and
+            to ``"INFO"`` for True.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        The channels added with
+        :meth:`~mne_lsl.stream.StreamLSL.add_reference_channels`, the reference set with
+        :meth:`~mne_lsl.stream.StreamLSL.set_eeg_reference`, the projectors applied
+        with :meth:`~mne_lsl.stream.StreamLSL.apply_proj` and the spatial filters are
+        folded in a single precomputed operator of shape
+        ``(n_channels_inlet, n_channels)``, applied with a single matrix product per
+        acquisition window. Successive spatial filters are composed in the order they
+        are applied. The channel selection must be done before applying a spatial
+        filter.
+        """
     _acquisition_delay: Incomplete
+    _latency: Incomplete
     _n_new_samples: int
+    _n_overrun: int
+    _n_samples_acquired: int
+    _n_samples_read: int
+    _n_truncated: int
+    _time_correction: float
+    _time_correction_connect: float
+    _readers: Incomplete
+    _scheduler: Incomplete
     _executor: Incomplete
 
     @abstractmethod
-    def connect(self, acquisition_delay: float | None) -> BaseStream:
+    @fill_doc
+    def connect(
+        self,
+        acquisition_delay: float | None,
+        *,
+        scheduler: AcquisitionScheduler | None = None,
+    ) -> BaseStream:
         """Connect to the stream and initiate data collection in the buffer.
 
         Parameters
         ----------
         acquisition_delay : float | None
             Delay in seconds between 2 acquisition during which chunks of data are
-            pulled from the connected device. If ``None``, the automatic acquisition in
-            a background thread is disabled and the user must manually call the
-            acquisition method ``Stream.acquire()`` to pull new samples.
+            pulled from the connected device. If ``0``, the acquisition in a background
+            thread waits for new samples and pulls them as soon as they arrive. If
+            ``None``, the automatic acquisition in a background thread is disabled and
+            the user must manually call the acquisition method ``Stream.acquire()`` to
+            pull new samples.
+        scheduler : AcquisitionScheduler | None
+            If provided, the acquisition runs on the shared worker threads of the
+            :class:`~mne_lsl.stream.AcquisitionScheduler` instead of a dedicated background
+            thread. Ignored if the acquisition is manual.
 
         Returns
         -------
         stream : instance of ``Stream``
             The stream instance modified in-place.
         """
+    _head_positions: Incomplete
     _hpi_stream: Incomplete
     _hpi_callback: Incomplete
 
     def connect_hpi_stream(
-        self, hpi_stream: BaseStream, format: str = "megin"
+        self,
+        hpi_stream: BaseStream,
+        format: str = "megin",
+        *,
+        min_interval: float | None = None,
+        min_translation: float | None = None,
+        min_rotation: float | None = None,
     ) -> BaseStream:
         """Connect to a stream that provides HPI data.
 
@@ -280,6 +449,17 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             The stream to connect to containing the HPI data in the right format.
         format : str
             The format of the HPI data. Currently, only ``"megin"`` is supported.
+        min_interval : float | None
+            Minimum time in seconds between 2 updates of the ``dev_head_t``. If
+            ``None``, every head position received updates the ``dev_head_t``.
+        min_translation : float | None
+            Minimum translation in meters of the head since the last update of the
+            ``dev_head_t`` to update it.
+        min_rotation : float | None
+            Minimum rotation in degrees of the head since the last update of the
+            ``dev_head_t`` to update it. If both ``min_translation`` and
+            ``min_rotation`` are ``None``, the ``dev_head_t`` is updated regardless of
+            the head movement, else it is updated if either threshold is exceeded.
 
         Returns
         -------
@@ -296,6 +476,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
               R21 R22 R23 T2
               R31 R32 R33 T3
               0   0   0   1
+
+        The head positions are stored without interrupting the acquisition of the
+        stream, and the ``dev_head_t`` is updated from the most recent head position
+        when :attr:`~mne_lsl.stream.StreamLSL.info` is accessed. The history of the
+        last 1024 head positions received can be queried with
+        :meth:`~mne_lsl.stream.StreamLSL.get_dev_head_t`.
         """
 
     @abstractmethod
@@ -308,6 +494,79 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             The stream instance modified in-place.
         """
 
+    def create_reader(self, name: str | None = None) -> StreamReader:
+        """Create a reader retrieving the new samples with its own read position.
+
+        Each reader keeps track of the samples it already retrieved, thus multiple
+        consumers of the same stream, e.g. a decoder, a visualization and a recorder,
+        can each retrieve every new sample once without interfering with each other or
+        with :meth:`~mne_lsl.stream.BaseStream.get_new_data`.
+
+        Parameters
+        ----------
+        name : str | None
+            Name of the reader, unique among the readers attached to the stream. If
+            ``None``, a name ``'reader-{idx}'`` is generated.
+
+        Returns
+        -------
+        reader : StreamReader
+            The reader, retrieving the samples acquired after its creation with
+            :meth:`~mne_lsl.stream.StreamReader.get_new_data`.
+
+        Notes
+        -----
+        A reader is detached from the stream with
+        :meth:`~mne_lsl.stream.StreamReader.close` or when the stream is disconnected.
+        """
+    _decimator: Incomplete
+    _timestamps: Incomplete
+
+    @verbose
+    @fill_doc
+    def decimate(
+        self, factor: int, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Decimate the stream by an integer factor.
+
+        The new samples are filtered with a causal anti-aliasing filter and one sample
+        every ``factor`` samples is retained before being written in the buffer, thus
+        the buffer holds ``bufsize`` seconds of data at the decimated sampling
+        frequency.
+
+        .. code-block:: python
+
+            stream = Stream(2.0).connect()
+            stream.decimate(4)  # e.g. from 1 kHz to 250 Hz
+
+        Parameters
+        ----------
+        factor : int
+            The decimation factor, i.e. the ratio between the current and the new
+            sampling frequency.
+        verbose : int | str | bool | None
+            Sets the verbosity level. The verbosity increases gradually between
+            ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
+            If None is provided, the verbosity is set to the currently set logger's level.
+            If a bool is provided, the verbosity is set to ``"WARNING"`` for False and
+            to ``"INFO"`` for True.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        The anti-aliasing filter is the 8th order Chebyshev type I low-pass filter used
+        by :func:`scipy.signal.decimate`, with a cutoff at 80% of the new Nyquist
+        frequency. The measurement information ``info["sfreq"]`` and
+        ``info["lowpass"]`` are updated. The decimation must be done before adding
+        filters to the stream and before creating an
+        :class:`~mne_lsl.stream.EpochsStream`. The buffer is emptied.
+        """
+    _filter_chains: Incomplete
+
     def del_filter(self, idx: int | list[int] | tuple[int, ...] | str = "all") -> None:
         """Remove a filter from the list of applied filters.
 
@@ -324,6 +583,16 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         overlapping channels are reset. The initial conditions will be re-estimated as
         a step response steady-state.
         """
+    _stats: Incomplete
+
+    def disable_stats(self) -> BaseStream:
+        """Disable the statistics of the acquisition loop.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
 
     def drop_channels(self, ch_names: str | list[str] | tuple[str, ...]) -> BaseStream:
         """Drop channel(s).
@@ -343,6 +612,25 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         pick
         """
 
+    def enable_stats(self, window: int = 1024) -> BaseStream:
+        """Enable the statistics of the acquisition loop.
+
+        The duration of each stage of the acquisition loop, the number of samples
+        pulled and the period of the loop are recorded and can be retrieved with
+        :attr:`~mne_lsl.stream.StreamLSL.stats`. When the statistics are disabled, the
+        acquisition loop skips the measurements.
+
+        Parameters
+        ----------
+        window : int
+            Number of acquisitions on which the statistics are computed.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+
     @verbose
     @fill_doc
     def filter(
@@ -351,10 +639,11 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         h_freq: float | None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         iir_params: dict[str, Any] | None = None,
+        method: str = "iir",
         *,
         verbose: bool | str | int | None = None,
     ) -> BaseStream:
-        """Filter the stream with an IIR causal filter.
+        """Filter the stream with an IIR or FIR causal filter.
 
         Once a filter is applied, the buffer is updated in real-time with the filtered
         data. It is possible to apply more than one filter.
@@ -364,6 +653,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             stream = Stream(2.0).connect()
             stream.filter(1.0, 40.0, picks="eeg")
             stream.filter(1.0, 15.0, picks="ecg").filter(0.1, 5, picks="EDA")
+            stream.filter(None, 30.0, picks="eeg", method="fir")
 
         Parameters
         ----------
@@ -388,6 +678,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             .. note::
 
                 The output ``sos`` must be used. The ``ba`` output is not supported.
+        method : ``"iir"`` | ``"fir"``
+            ``"iir"`` applies a causal IIR filter with second-order sections. ``"fir"``
+            applies a linear-phase FIR filter designed with the default parameters of
+            :func:`mne.filter.create_filter`, with an overlap-save FFT convolution.
+            Since the FIR filter is causal, it delays the signal by half its length.
+            ``iir_params`` is ignored for FIR filters.
         verbose : int | str | bool | None
             Sets the verbosity level. The verbosity increases gradually between
             ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
@@ -473,6 +769,8 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         winsize: float | None = None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         exclude: str | list[str] | tuple[str, ...] = "bads",
+        out: ScalarArray | None = None,
+        out_ts: NDArray[np.float64] | None = None,
     ) -> tuple[ScalarArray, NDArray[np.float64]]:
         """Retrieve the latest data from the buffer.
 
@@ -497,19 +795,53 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         exclude : str | list of str | tuple of str
             Set of channels to exclude, only used when picking based on types (e.g.,
             ``exclude="bads"`` when ``picks="meg"``) or when picking is set to ``None``.
+        out : array of shape (n_channels, n_samples) | None
+            If provided, the data is written in this pre-allocated array instead of a
+            new array. The array must have the same dtype as the stream and the number
+            of samples must match the window size, capped at the buffer size.
+        out_ts : array of shape (n_samples,) | None
+            If provided, the timestamps are written in this pre-allocated array of
+            ``float64`` instead of a new array.
 
         Returns
         -------
         data : array of shape (n_channels, n_samples)
-            Data in the given window.
+            Data in the given window. If ``out`` is provided, ``out`` is returned.
         timestamps : array of shape (n_samples,)
-            Timestamps in the given window.
+            Timestamps in the given window. If ``out_ts`` is provided, ``out_ts`` is
+            returned.
 
         Notes
         -----
         The number of newly available samples stored in the property ``n_new_samples``
         is reset at every function call, even if all channels were not selected with the
         argument ``picks``.
+
+        Retrieving the data in pre-allocated arrays avoids allocating new arrays at
+        every call, e.g. in a fast decoding loop. The copy is faster if the selected
+        channels are contiguous in the buffer, e.g. all the channels of a given type.
+        """
+
+    def get_dev_head_t(self, timestamp: float | None = None) -> Transform | None:
+        """Get the device to head transformation received from the HPI stream.
+
+        Parameters
+        ----------
+        timestamp : float | None
+            Time at which the transformation is retrieved, in the clock of the HPI
+            stream. If ``None``, the most recent transformation received is returned.
+
+        Returns
+        -------
+        trans : Transform | None
+            The most recent transformation received before or at ``timestamp``, or
+            ``None`` if no such transformation is retained in the history.
+
+        Notes
+        -----
+        The history retains the last 1024 transformations received from the HPI stream
+        connected with :meth:`~mne_lsl.stream.StreamLSL.connect_hpi_stream`, regardless
+        of the arguments ``min_interval``, ``min_translation`` and ``min_rotation``.
         """
 
     def get_montage(self) -> DigMontage | None:
@@ -521,13 +853,66 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             A copy of the channel positions, if available, otherwise ``None``.
         """
 
+    @fill_doc
+    def get_new_data(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> tuple[ScalarArray, NDArray[np.float64], bool]:
+        """Retrieve the samples added to the buffer since the last call.
+
+        Contrary to :meth:`~mne_lsl.stream.BaseStream.get_data`, which returns a window
+        of the latest samples, this method returns each sample only once, which is
+        convenient to process the stream incrementally.
+
+        Parameters
+        ----------
+        picks : str | array-like | slice | None
+            Channels to include. Slices and lists of integers will be interpreted as
+            channel indices. In lists, channel *type* strings (e.g., ``['meg',
+            'eeg']``) will pick channels of those types, channel *name* strings (e.g.,
+            ``['MEG0111', 'MEG2623']`` will pick the given channels. Can also be the
+            string values ``'all'`` to pick all channels, or ``'data'`` to pick
+            :term:`data channels`. None (default) will pick all channels. Note that
+            channels in ``info['bads']`` *will be included* if their names or indices
+            are explicitly provided.
+        exclude : str | list of str | tuple of str
+            Set of channels to exclude, only used when picking based on types (e.g.,
+            ``exclude="bads"`` when ``picks="meg"``) or when picking is set to ``None``.
+
+        Returns
+        -------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the last call.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        overrun : bool
+            True if more samples than the buffer can hold were acquired since the last
+            call, in which case the oldest samples were overwritten before being
+            retrieved and only the last ``n_buffer`` samples are returned.
+
+        Notes
+        -----
+        The first call returns all the samples acquired since the connection, within
+        the limit of the buffer size. To retrieve the new samples from several
+        independent consumers, use one reader per consumer, created with
+        :meth:`~mne_lsl.stream.BaseStream.create_reader`.
+
+        The read position of this method is independent of the property
+        ``n_new_samples``, which is not reset by this method.
+        """
+
     @verbose
     @fill_doc
     def notch_filter(
         self,
-        freqs: float,
+        freqs: float | list[float] | tuple[float, ...] | ScalarArray,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
-        notch_widths: float | None = None,
+        notch_widths: float
+        | list[float]
+        | tuple[float, ...]
+        | ScalarArray
+        | None = None,
         trans_bandwidth: int = 1,
         iir_params: dict[str, Any] | None = None,
         *,
@@ -543,23 +928,27 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             stream = Stream(2.0).connect()
             stream.filter(1.0, 40.0, picks="eeg")
             stream.notch_filter(50, picks="ecg")
+            stream.notch_filter([50, 100, 150], picks="eeg")
 
         Parameters
         ----------
-        freqs : float
+        freqs : float | array-like of float
             Specific frequencies to filter out from data, e.g. ``60`` Hz in the US or
-            ``50`` Hz in Europe for line noise.
+            ``50`` Hz in Europe for line noise. If several frequencies are provided,
+            e.g. the line noise and its harmonics, the notch filters are combined in a
+            single filter with a single state.
         picks : str | array-like | slice | None
             Channels to include. Slices and lists of integers will be interpreted as
             channel indices. In lists, channel *type* strings (e.g., ``['meg',
             'eeg']``) will pick channels of those types, channel *name* strings (e.g.,
             ``['MEG0111', 'MEG2623']`` will pick the given channels. Can also be the
             string values ``'all'`` to pick all channels, or ``'data'`` to pick
-            :term:`data channels`. None (default) will pick all channels. Note that
-            channels in ``info['bads']`` *will be included* if their names or indices
-            are explicitly provided.
-        notch_widths : float | None
-            Width of the stop band in Hz. If ``None``, ``freqs / 200`` is used.
+            :term:`data channels`. None (default) will pick all channels. Bad channels
+            are included by default. Note that channels in ``info['bads']`` *will be
+            included* if their names or indices are explicitly provided.
+        notch_widths : float | array-like of float | None
+            Width of the stop band in Hz. If ``None``, ``freqs / 200`` is used. If an
+            array-like is provided, it must contain one width per frequency.
         trans_bandwidth : float
             Width of the transition band in Hz.
         iir_params : dict | None
@@ -664,6 +1053,34 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             The stream instance modified in-place.
         """
 
+    @verbose
+    @fill_doc
+    def resample(
+        self, sfreq: float, *, verbose: bool | str | int | None = None
+    ) -> BaseStream:
+        """Resample the stream to a lower sampling frequency.
+
+        Only resampling by an integer decimation factor is supported, see
+        :meth:`~mne_lsl.stream.StreamLSL.decimate`.
+
+        Parameters
+        ----------
+        sfreq : float
+            The new sampling frequency in Hz. The current sampling frequency must be an
+            integer multiple of ``sfreq``.
+        verbose : int | str | bool | None
+            Sets the verbosity level. The verbosity increases gradually between
+            ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
+            If None is provided, the verbosity is set to the currently set logger's level.
+            If a bool is provided, the verbosity is set to ``"WARNING"`` for False and
+            to ``"INFO"`` for True.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+        """
+
     def set_bipolar_reference(self) -> BaseStream:
         """Set a bipolar reference. Not implemented.
 
@@ -864,10 +1281,44 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             montage. Other channel types (e.g., MEG channels) should have their
             positions defined properly using their data reading functions.
         """
+    _sleep_strategy: Incomplete
+
+    def set_sleep_strategy(
+        self, method: str | None = "hybrid", spin: float = 0.0002
+    ) -> BaseStream:
+        """Set the strategy used to wait between 2 acquisitions.
+
+        Parameters
+        ----------
+        method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'`` | None
+            The waiting method, see :func:`mne_lsl.set_sleep_strategy`. If ``None``,
+            the default strategy set with :func:`mne_lsl.set_sleep_strategy` is used.
+        spin : float
+            Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+            ``'deadline'`` wait. ``0`` disables the busy-wait.
+
+        Returns
+        -------
+        stream : instance of ``Stream``
+            The stream instance modified in-place.
+
+        Notes
+        -----
+        When the statistics are enabled with
+        :meth:`~mne_lsl.stream.StreamLSL.enable_stats`, the delay between the end of
+        the wait requested and the wake-up is recorded as the metric ``'wakeup'``. The
+        strategy is not used if the stream is connected with an
+        :class:`~mne_lsl.stream.AcquisitionScheduler`, which wakes up at the deadline of
+        each acquisition.
+        """
 
     @abstractmethod
     def _acquire(self) -> None:
         """Update function pulling new samples in the buffer at a regular interval."""
+    _dev_head_t_applied: Incomplete
+
+    def _apply_dev_head_t(self) -> None:
+        """Update the dev_head_t from the most recent head position stored."""
 
     def _check_connected(self, name: str) -> None:
         """Check that the stream is connected before calling the function 'name'."""
@@ -878,26 +1329,88 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
     def _check_not_epoched(self, name: str) -> None:
         """Check that the stream is not being epoched."""
 
+    def _compose_spatial_operator(self, operator: ScalarArray) -> None:
+        """Compose a linear operator with the spatial operator of the stream.
+
+        This method must be called while the acquisition is interrupted. The operator is
+        also applied to the samples already in the buffer.
+
+        Parameters
+        ----------
+        operator : array of shape (n_channels, n_channels)
+            The linear operator, applied on the right of data arrays of shape
+            ``(n_samples, n_channels)``.
+        """
+
+    def _create_executor(self) -> ThreadPoolExecutor | _ScheduledExecutor:
+        """Create the executor running the acquisition jobs."""
+
     @contextmanager
     def _interrupt_acquisition(self) -> Generator[None]:
-        """Context manager interrupting the acquisition thread."""
+        """Context manager pausing the acquisition.
+
+        The acquisition holds the lock ``_acquisition_lock`` while it processes new
+        samples, thus the context manager waits for the running acquisition to complete
+        and the following acquisitions wait until the context manager exits. The
+        acquisition thread is left running.
+        """
     _info: Incomplete
     _picks_inlet: Incomplete
 
     def _pick(self, picks: ScalarIntArray) -> None:
         """Interrupt acquisition and apply the channel selection."""
+
+    def _read_new_samples(
+        self, start: int, picks: ScalarIntArray
+    ) -> tuple[ScalarArray, NDArray[np.float64], int]:
+        """Read the samples acquired since an absolute position in the buffer.
+
+        This method must be called while holding the lock of the stream.
+
+        Parameters
+        ----------
+        start : int
+            Absolute position of the first sample to read, e.g. the number of samples
+            acquired at the time of the previous read.
+        picks : array of int
+            Selection of channels to read.
+
+        Returns
+        -------
+        data : array of shape (n_samples, n_channels)
+            Samples acquired since ``start``, within the limit of the buffer size.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the samples.
+        n_lost : int
+            Number of samples acquired since ``start`` which were overwritten in the
+            buffer before being read.
+        """
     _added_channels: Incomplete
     _epochs: Incomplete
     _filters: Incomplete
-    _timestamps: Incomplete
+    _picks_cache: Incomplete
 
     @abstractmethod
     def _reset_variables(self) -> None:
         """Reset variables define after connection."""
 
+    def _store_filters_initial_conditions(self) -> None:
+        """Store the states of the fused filter cascades in the applied filters."""
+
     def _submit_acquisition_job(self) -> None:
         """Submit a new acquisition job, if applicable."""
 
+    def _write_buffer(self, data: ScalarArray, timestamps: NDArray[np.float64]) -> None:
+        """Write new samples in-place in the circular buffers.
+
+        Parameters
+        ----------
+        data : array of shape (n_samples, n_channels)
+            New samples, with ``n_samples`` smaller or equal to the buffer size.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        """
+
     @property
     def callbacks(self) -> list[Callable]:
         """List of callbacks to be called when new data is available.
@@ -944,6 +1457,28 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         :type: :class:`~mne.Info`
         """
 
+    @property
+    def metrics(self) -> dict[str, int | float | None]:
+        """End-to-end metrics of the acquisition since the connection.
+
+        The metrics are:
+
+        * ``'n_overrun'``: number of samples overwritten in the buffer before being
+          retrieved with :meth:`~mne_lsl.stream.StreamLSL.get_data`.
+        * ``'n_truncated'``: number of samples pulled from the source but discarded
+          because an acquisition retrieved more samples than the buffer can hold.
+        * ``'time_correction'``: latest estimate of the offset in seconds between the
+          clock of the source and the local clock.
+        * ``'clock_drift'``: change in seconds of the clock offset since the
+          connection.
+        * ``'latency'``: delay in seconds between the acquisition of the most recent
+          sample by the source and its write in the buffer, measured on the local
+          clock. ``None`` until a sample is written in the buffer. The latency is
+          negative if the source timestamps the samples ahead of time.
+
+        :type: :class:`dict`
+        """
+
     @property
     def n_buffer(self) -> int:
         """Number of samples that can be stored in the buffer.
@@ -959,3 +1494,24 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
 
         :type: :class:`int`
         """
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]] | None:
+        """Statistics of the acquisition loop, if enabled.
+
+        The statistics are enabled with :meth:`~mne_lsl.stream.StreamLSL.enable_stats`.
+        For each metric, a dictionary with the keys ``'n'`` (number of values recorded),
+        ``'p50'``, ``'p99'`` and ``'max'`` (computed on the last ``window`` values) is
+        provided. The metrics are the period of the acquisition loop ``'period'`` and
+        the number of samples pulled ``'n_samples'``, and the durations in seconds of
+        the stages ``'pull'`` (retrieval from the inlet), ``'spatial'`` (added
+        channels, reference, projectors and spatial filters), ``'decimate'``,
+        ``'filters'``, ``'callbacks'``, ``'write'`` (write in the buffer) and
+        ``'total'`` (acquisition of a non-empty chunk). The ``'latency'`` between the
+        acquisition of the most recent sample by the source and its write in the buffer
+        is also recorded, see :attr:`~mne_lsl.stream.StreamLSL.metrics`, and the delay
+        ``'wakeup'`` between the end of the wait requested between 2 acquisitions and
+        the wake-up, see :meth:`~mne_lsl.stream.StreamLSL.set_sleep_strategy`.
+
+        :type: :class:`dict` | None
+        """
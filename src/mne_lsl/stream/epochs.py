@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -9,17 +10,27 @@ from typing import TYPE_CHECKING
 import numpy as np
 from mne import pick_info
 from mne._fiff.pick import _picks_to_idx, channel_indices_by_type
-from mne.event import _find_unique_events
 from scipy.signal import detrend
 
 from ..utils._checks import check_type, check_value, ensure_int
 from ..utils._docs import fill_doc
-from ..utils._fixes import find_events
-from ..utils._time import high_precision_sleep
+from ..utils._time import SleepStrategy, get_sleep_strategy
 from ..utils.logs import logger, warn
+from ._async import AsyncNotifier
+from ._buffer import (
+    check_out_array,
+    read_ring_buffer,
+    read_ring_buffer_windows,
+    write_ring_buffer,
+)
+from ._events import EventQueue, StimChannelDetector
+from ._picks import PicksCache
 from .base import BaseStream
+from .scheduler import AcquisitionScheduler
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
     from mne import Info
     from numpy.typing import NDArray
 
@@ -214,6 +225,7 @@ class EpochsStream:
         )
         # define acquisition variables which need to be reset on disconnect
         self._lock = threading.Lock()
+        self._notifier = AsyncNotifier()
         self._reset_variables()
 
     def __del__(self) -> None:
@@ -272,7 +284,120 @@ class EpochsStream:
             )
         self._acquire()
 
-    def connect(self, acquisition_delay: float | None = 0.001) -> EpochsStream:
+    def add_callback(self, callback: Callable) -> EpochsStream:
+        """Add a callback called on the new epochs.
+
+        Parameters
+        ----------
+        callback : Callable
+            A callable function called every time new epochs are added to the buffer,
+            with the new epochs only. The callback receives the processed epochs, i.e.
+            after rejection, baseline correction and detrending, thus the callback
+            signature should be:
+
+            .. literalinclude:: /_examples/epochs_callback.py
+                :language: python
+
+            With ``data`` the array of new epochs of shape
+            ``(n_epochs, n_channels, n_samples)``, ``events`` the array of event codes
+            of shape ``(n_epochs,)`` and ``timestamps`` the array of shape
+            ``(n_epochs,)`` of the timestamps of the events on the attached
+            ``Stream``. The value returned by the callback is ignored.
+
+        Returns
+        -------
+        epochs : instance of :class:`~mne_lsl.stream.EpochsStream`
+            The epochs instance modified in-place.
+
+        Notes
+        -----
+        Callback(s) are called in the same thread as the acquisition, in the order they
+        were added, after the new epochs are added to the buffer. Thus, they should be
+        fast and non-blocking. If the callback takes too long, the acquisition will be
+        delayed. The array ``data`` is not a view on the buffer, and it is shared
+        between the callbacks.
+
+        Callback(s) are removed when the :class:`~mne_lsl.stream.EpochsStream` is
+        disconnected.
+        """  # noqa: D214, D215, E501
+        self._check_connected("add_callback()")
+        check_type(callback, ("callable",), "callback")
+        self._callbacks.append(callback)
+        return self
+
+    @fill_doc
+    async def aiter(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> AsyncIterator[ScalarArray]:
+        """Iterate asynchronously over the new epochs.
+
+        The iterator awaits the new epochs without polling: the acquisition thread
+        wakes up the event loop running the iterator every time new epochs are added
+        to the buffer.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Yields
+        ------
+        data : array of shape (n_epochs, n_channels, n_samples)
+            New epochs acquired since the previous iteration, within the limit of the
+            buffer size.
+
+        Notes
+        -----
+        As :meth:`~mne_lsl.stream.EpochsStream.get_data`, the iterator resets the
+        number of new epochs stored in the property ``n_new_epochs``, thus a single
+        consumer should retrieve the new epochs. The iteration stops when the
+        :class:`~mne_lsl.stream.EpochsStream` is disconnected.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            async for data in epochs.aiter(picks="eeg"):
+                await websocket.send(data.tobytes())
+        """
+        self._check_connected("aiter()")
+        self._picks_cache.get(self._info, picks, exclude, none="all")  # validate
+        event = asyncio.Event()
+        self._notifier.add(asyncio.get_running_loop(), event)
+        try:
+            while True:
+                event.clear()  # cleared before the check to not miss a notification
+                try:
+                    picks_ = self._picks_cache.get(
+                        self._info, picks, exclude, none="all"
+                    )
+                    with self._lock:
+                        n_epochs = min(self._n_new_epochs, self._buffer.shape[0])
+                        self._n_new_epochs = 0
+                        if n_epochs != 0:
+                            data = read_ring_buffer(
+                                self._buffer, self._n_epochs_acquired, n_epochs, picks_
+                            )
+                except Exception:
+                    if self.connected:  # pragma: no cover
+                        raise
+                    break  # disconnected
+                if n_epochs == 0:
+                    await event.wait()
+                else:
+                    yield np.transpose(data, axes=(0, 2, 1))
+        finally:
+            self._notifier.remove(event)
+
+    @fill_doc
+    def connect(
+        self,
+        acquisition_delay: float | None = 0.001,
+        *,
+        scheduler: AcquisitionScheduler | None = None,
+    ) -> EpochsStream:
         """Start acquisition of epochs from the connected Stream.
 
         Parameters
@@ -288,7 +413,10 @@ class EpochsStream:
 
                 For a new epoch to be added to the buffer, the epoch must be fully
                 acquired, i.e. the last sample of the epoch must be received. Thus, an
-                epoch is acquired ``tmax`` seconds after the event onset.
+                epoch is added to the buffer by the first acquisition following the
+                reception of its last sample, between ``tmax`` and
+                ``tmax + acquisition_delay`` seconds after the event onset.
+        %(scheduler)s
 
         Returns
         -------
@@ -318,7 +446,9 @@ class EpochsStream:
                     "200 ms. None corresponds to manual acquisition. The provided "
                     f"{acquisition_delay} is invalid."
                 )
+        check_type(scheduler, (AcquisitionScheduler, None), "scheduler")
         self._acquisition_delay = acquisition_delay
+        self._scheduler = scheduler
         assert self._n_new_epochs == 0  # sanity-check
         # create the buffer and start acquisition in a separate thread
         self._picks = _picks_to_idx(
@@ -336,14 +466,26 @@ class EpochsStream:
             dtype=self._stream._buffer.dtype,
         )
         self._buffer_events = np.zeros(self._bufsize, dtype=np.int16)
-        self._executor = (
-            None
-            if self._acquisition_delay is None
-            else ThreadPoolExecutor(max_workers=1)
-        )
+        # the epochs buffers are circular buffers written in-place at the position
+        # given by the number of epochs acquired, thus adding an epoch does not move
+        # the epochs already in the buffer.
+        self._n_epochs_acquired = 0
+        # position of the stream at the last acquisition, tracked independently of the
+        # number of new samples of the stream which is reset by Stream.get_data().
+        self._n_samples_acquired = 0
+        self._n_events_acquired = 0
+        if self._event_stream is None or self._event_stream._info["sfreq"] != 0:
+            self._event_detector = StimChannelDetector(self._event_channels)
+        self._event_queue = EventQueue(self._buffer.shape[1], self._tmin_shift)
+        if self._acquisition_delay is None:
+            self._executor = None
+        elif self._scheduler is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self._executor = self._scheduler._create_executor()
         # submit the first acquisition job
         if self._executor is not None:
-            logger.debug("%s: ThreadPoolExecutor started.", self)
+            logger.debug("%s: executor started.", self)
             self._executor.submit(self._acquire)
         return self
 
@@ -382,6 +524,7 @@ class EpochsStream:
         n_epochs: int | None = None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         exclude: str | list[str] | tuple[str, ...] = "bads",
+        out: ScalarArray | None = None,
     ) -> ScalarArray:
         """Retrieve the latest epochs from the buffer.
 
@@ -392,20 +535,27 @@ class EpochsStream:
             returned.
         %(picks_all)s
         %(exclude)s
+        out : array of shape (n_epochs, n_channels, n_samples) | None
+            If provided, the data is written in this pre-allocated array instead of a
+            new array. The array must have the same dtype as the stream.
 
         Returns
         -------
         data : array of shape (n_epochs, n_channels, n_samples)
-            Data in the buffer.
+            Data in the buffer. If ``out`` is provided, ``out`` is returned.
 
         Notes
         -----
         The number of newly available epochs stored in the property ``n_new_epochs``
         is reset at every function call, even if all channels were not selected with the
         argument ``picks``.
+
+        Retrieving the data in a pre-allocated array avoids allocating a new array at
+        every call. The copy is faster if the selected channels are contiguous in the
+        buffer, e.g. all the channels of a given type.
         """
         try:
-            picks = _picks_to_idx(self._info, picks, none="all", exclude=exclude)
+            picks = self._picks_cache.get(self._info, picks, exclude, none="all")
             n_epochs = self._buffer.shape[0] if n_epochs is None else n_epochs
             if n_epochs <= 0:
                 raise ValueError(
@@ -418,10 +568,23 @@ class EpochsStream:
                     f"buffer size {self._buffer.shape[0]}. Selecting the entire buffer."
                 )
                 n_epochs = self._buffer.shape[0]
+            if out is not None:
+                check_out_array(
+                    out,
+                    (n_epochs, picks.size, self._buffer.shape[1]),
+                    self._buffer.dtype,
+                    "out",
+                )
             with self._lock:
                 self._n_new_epochs = 0  # reset the number of new epochs
-                buffer_ref = self._buffer
-            return np.transpose(buffer_ref[-n_epochs:, :, picks], axes=(0, 2, 1))
+                data = read_ring_buffer(
+                    self._buffer,
+                    self._n_epochs_acquired,
+                    n_epochs,
+                    picks,
+                    None if out is None else np.transpose(out, axes=(0, 2, 1)),
+                )
+            return np.transpose(data, axes=(0, 2, 1)) if out is None else out
         except Exception:
             if not self.connected:
                 raise RuntimeError(
@@ -436,135 +599,108 @@ class EpochsStream:
                 )
             raise  # pragma: no cover
 
+    def set_sleep_strategy(
+        self, method: str | None = "hybrid", spin: float = 0.0002
+    ) -> EpochsStream:
+        """Set the strategy used to wait between 2 acquisitions.
+
+        Parameters
+        ----------
+        method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'`` | None
+            The waiting method, see :func:`mne_lsl.set_sleep_strategy`. If ``None``,
+            the default strategy set with :func:`mne_lsl.set_sleep_strategy` is used.
+        spin : float
+            Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+            ``'deadline'`` wait. ``0`` disables the busy-wait.
+
+        Returns
+        -------
+        epochs : instance of :class:`~mne_lsl.stream.EpochsStream`
+            The epochs instance modified in-place.
+        """
+        self._check_connected("set_sleep_strategy()")
+        self._sleep_strategy = None if method is None else SleepStrategy(method, spin)
+        return self
+
     def _acquire(self) -> None:
         """Update function looking for new epochs."""
         try:
-            if self._stream._n_new_samples == 0 or (
-                self._event_stream is not None
-                and self._event_stream._n_new_samples == 0
-            ):
+            # new epochs can only be completed by new samples of the stream, an event
+            # received without new samples is processed at the next acquisition.
+            if self._stream._n_samples_acquired == self._n_samples_acquired:
                 self._submit_acquisition_job()
                 return
-            # split the different acquisition scenarios to retrieve new events to add to
-            # the buffer.
-            with self._stream._lock:
-                stream_buffer = self._stream._buffer
-                stream_ts = self._stream._timestamps
-            data, ts = _remove_empty_elements(stream_buffer.T, stream_ts)
+            # retrieve the new events and queue them until their epoch is acquired. The
+            # stream buffers are circular buffers written in-place, thus the samples
+            # are copied while the acquisition thread is locked out.
+            n_buffer = self._stream._timestamps.size
             if self._event_stream is None:
-                picks_events = _picks_to_idx(
-                    self._stream._info, self._event_channels, exclude="bads"
-                )
-                events = _find_events_in_stim_channels(
-                    data[picks_events, :], self._event_channels, self._info["sfreq"]
-                )
-                events = _prune_events(
-                    events,
-                    self._event_id,
-                    self._buffer.shape[1],
-                    ts,
-                    self._last_ts,
-                    None,
-                    self._tmin_shift,
+                picks_events = self._stream._picks_cache.get(
+                    self._stream._info, self._event_channels, "bads"
                 )
-            elif (
-                self._event_stream is not None
-                and self._event_stream._info["sfreq"] != 0
-            ):
-                picks = _picks_to_idx(
-                    self._event_stream._info,
-                    self._event_channels,
-                    none="all",
-                    exclude=(),
-                )
-                with self._event_stream._lock:
-                    evt_buffer = self._event_stream._buffer
-                    evt_ts = self._event_stream._timestamps
-                data_events, ts_events = _remove_empty_elements(
-                    evt_buffer[:, picks].T,
-                    evt_ts,
-                )
-                events = _find_events_in_stim_channels(
-                    data_events, self._event_channels, self._info["sfreq"]
-                )
-                events = _prune_events(
-                    events,
-                    self._event_id,
-                    self._buffer.shape[1],
-                    ts,
-                    self._last_ts,
-                    ts_events,
-                    self._tmin_shift,
-                )
-            elif (
-                self._event_stream is not None
-                and self._event_stream._info["sfreq"] == 0
-            ):
-                # don't select only the new events as they might all fall outside of
-                # the attached stream ts buffer, instead always look through all
-                # available events.
-                picks = _picks_to_idx(
-                    self._event_stream._info,
-                    self._event_channels,
-                    none="all",
-                    exclude=(),
+                with self._stream._lock:
+                    n_acquired = self._stream._n_samples_acquired
+                    # scan only the new samples, the detector keeps the last value of
+                    # the event channels to detect an onset on the first new sample.
+                    n_new = min(n_acquired - self._n_samples_acquired, n_buffer)
+                    self._n_samples_acquired = n_acquired
+                    data_events = read_ring_buffer(
+                        self._stream._buffer, n_acquired, n_new, picks_events
+                    )
+                events = self._event_detector.detect(data_events.T, n_acquired - n_new)
+                if self._event_id is not None:
+                    sel = np.isin(events[:, 2], list(self._event_id.values()))
+                    events = events[sel]
+                self._event_queue.put(events)
+            else:
+                picks = self._event_stream._picks_cache.get(
+                    self._event_stream._info, self._event_channels, (), none="all"
                 )
                 with self._event_stream._lock:
-                    evt_buffer = self._event_stream._buffer
-                    evt_ts = self._event_stream._timestamps
-                data_events, ts_events = _remove_empty_elements(
-                    evt_buffer[:, picks].T,
-                    evt_ts,
-                )
-                if self._event_id is None:
-                    events = np.vstack(
-                        [
-                            np.arange(ts_events.size, dtype=np.int64),
-                            np.zeros(ts_events.size, dtype=np.int64),
-                            np.argmax(data_events, axis=0),
-                        ],
-                        dtype=np.int64,
+                    n_acquired_events = self._event_stream._n_samples_acquired
+                    n_new = min(
+                        n_acquired_events - self._n_events_acquired,
+                        self._event_stream._timestamps.size,
+                    )
+                    self._n_events_acquired = n_acquired_events
+                    data_events = read_ring_buffer(
+                        self._event_stream._buffer, n_acquired_events, n_new, picks
                     ).T
+                    ts_events = read_ring_buffer(
+                        self._event_stream._timestamps, n_acquired_events, n_new
+                    )
+                if self._event_detector is not None:  # regularly sampled event stream
+                    events = self._event_detector.detect(
+                        data_events, n_acquired_events - n_new
+                    )
+                    codes = events[:, 2]
+                    ts_events = ts_events[events[:, 0] - n_acquired_events + n_new]
+                elif self._event_id is None:
+                    codes = np.argmax(data_events, axis=0)
                 else:
-                    events = np.vstack(
-                        [
-                            np.arange(ts_events.size, dtype=np.int64),
-                            np.zeros(ts_events.size, dtype=np.int64),
-                            data_events[
-                                np.argmax(data_events, axis=0),
-                                np.arange(data_events.shape[1]),
-                            ],
-                        ],
-                        dtype=np.int64,
-                    ).T
-                events = _prune_events(
-                    events,
-                    self._event_id,
-                    self._buffer.shape[1],
-                    ts,
-                    self._last_ts,
-                    ts_events,
-                    self._tmin_shift,
-                )
-            else:  # pragma: no cover
-                raise RuntimeError(
-                    "This acquisition scenario should not happen. Please contact the "
-                    "developers."
-                )
+                    codes = data_events[
+                        np.argmax(data_events, axis=0), np.arange(data_events.shape[1])
+                    ]
+                if self._event_id is not None:
+                    sel = np.isin(codes, list(self._event_id.values()))
+                    codes, ts_events = codes[sel], ts_events[sel]
+                self._event_queue.put_timestamps(ts_events, codes)
+                # position the events on the samples of the stream, once acquired
+                with self._stream._lock:
+                    n_acquired = self._stream._n_samples_acquired
+                    self._n_samples_acquired = n_acquired
+                    if self._event_queue.n_unlocated != 0:
+                        ts = read_ring_buffer(
+                            self._stream._timestamps,
+                            n_acquired,
+                            min(n_acquired, n_buffer),
+                        )
+                if self._event_queue.n_unlocated != 0:
+                    self._event_queue.locate(ts, n_acquired - ts.size)
+            events, stops = self._event_queue.pop(n_acquired)
             if events.shape[0] == 0:  # abort in case we don't have new events to add
                 self._submit_acquisition_job()
                 return
-            self._last_ts = ts[events[-1, 0]]
-            # select data, for loop is faster than the fancy indexing ideas tried and
-            # will anyway operate on a small number of events most of the time.
-            data_selection = np.empty(
-                (
-                    min(events.shape[0], self._bufsize),
-                    self._buffer.shape[1],
-                    self._picks.size,
-                ),
-                dtype=data.dtype,
-            )
             if self._bufsize < events.shape[0]:
                 warn(
                     "The number of new epochs to add to the buffer is greater "
@@ -572,13 +708,28 @@ class EpochsStream:
                     "not acquired."
                 )
                 events = events[-self._bufsize :, :]
-            for k, start in enumerate(events[:, 0][::-1]):
-                start += self._tmin_shift
-                data_selection[-(k + 1)] = data[
-                    self._picks, start : start + self._buffer.shape[1]
-                ].T
+                stops = stops[-self._bufsize :]
+            # select data, the epochs are gathered at once from the stream buffer
+            with self._stream._lock:
+                # discard the epochs overwritten since the timestamps were retrieved
+                n_lost = self._stream._n_samples_acquired - n_buffer
+                sel = np.where(n_lost <= stops - self._buffer.shape[1])[0]
+                if sel.size != events.shape[0]:
+                    warn(
+                        f"{events.shape[0] - sel.size} new epoch(s) were overwritten "
+                        "in the buffer of the attached Stream before being acquired. "
+                        "Please increase the buffer size of the Stream or decrease the "
+                        "acquisition delay of the EpochsStream."
+                    )
+                events, stops = events[sel], stops[sel]
+                events_ts = self._stream._timestamps[
+                    (stops - self._buffer.shape[1] - self._tmin_shift) % n_buffer
+                ]
+                data_selection = read_ring_buffer_windows(
+                    self._stream._buffer, stops, self._buffer.shape[1], self._picks
+                )
             # apply processing
-            data_selection = _process_data(
+            data_selection, sel = _process_data(
                 data_selection,
                 self._baseline,
                 self._reject,
@@ -592,14 +743,20 @@ class EpochsStream:
             if data_selection.shape[0] == 0:
                 self._submit_acquisition_job()
                 return
-            # roll buffer and add new epochs
+            events, events_ts = events[sel], events_ts[sel]
+            # add the new epochs in-place in the circular buffers
             with self._lock:
-                self._buffer = np.roll(self._buffer, -events.shape[0], axis=0)
-                self._buffer[-events.shape[0] :, :, :] = data_selection
-                self._buffer_events = np.roll(self._buffer_events, -events.shape[0])
-                self._buffer_events[-events.shape[0] :] = events[:, 2]
-                # update the last ts and the number of new epochs
+                write_ring_buffer(self._buffer, data_selection, self._n_epochs_acquired)
+                write_ring_buffer(
+                    self._buffer_events, events[:, 2], self._n_epochs_acquired
+                )
+                self._n_epochs_acquired += events.shape[0]
                 self._n_new_epochs += events.shape[0]
+            self._notifier.notify()
+            if len(self._callbacks) != 0:
+                data_selection = np.transpose(data_selection, axes=(0, 2, 1))
+                for callback in self._callbacks:
+                    callback(data_selection, events[:, 2], events_ts)
         except Exception as error:  # pragma: no cover
             logger.exception(error)
             self._reset_variables()
@@ -622,25 +779,56 @@ class EpochsStream:
         self._acquisition_delay = None
         self._buffer = None
         self._buffer_events = None
+        self._callbacks = []
         self._ch_idx_by_type = None
+        self._event_detector = None
+        self._event_queue = None
         self._executor = None
         self._info = None
-        self._last_ts = None
+        self._n_epochs_acquired = None
         self._n_new_epochs = 0
+        self._n_events_acquired = None
+        self._n_samples_acquired = None
         self._picks = None
+        self._picks_cache = PicksCache()
+        self._scheduler = None
+        self._sleep_strategy = None
         self._tmin_shift = None
+        # wake up the asynchronous iterators, which stop once disconnected
+        self._notifier.notify()
 
     def _submit_acquisition_job(self) -> None:
         """Submit a new acquisition job, if applicable."""
         if self._executor is None:
             return  # either shutdown or manual acquisition
-        high_precision_sleep(self._acquisition_delay)
+        if self._scheduler is not None:
+            # the scheduler wakes up at the deadline, the worker is not blocked
+            try:
+                self._executor.schedule(self._acquisition_delay, self._acquire)
+            except RuntimeError:  # pragma: no cover
+                pass  # shutdown
+            return
+        strategy = (
+            get_sleep_strategy()
+            if self._sleep_strategy is None
+            else self._sleep_strategy
+        )
+        strategy(self._acquisition_delay)
         try:
             self._executor.submit(self._acquire)
         except RuntimeError:  # pragma: no cover
             pass  # shutdown
 
     # ----------------------------------------------------------------------------------
+    @property
+    def callbacks(self) -> list[Callable]:
+        """List of callbacks called on the new epochs.
+
+        :type: :class:`list` of :class:`~collections.abc.Callable`
+        """
+        self._check_connected("callbacks")
+        return self._callbacks
+
     @property
     def connected(self) -> bool:
         """Connection status of the :class:`~mne_lsl.stream.EpochsStream`.
@@ -671,7 +859,9 @@ class EpochsStream:
         """
         self._check_connected("events")
         with self._lock:
-            return self._buffer_events.copy()
+            return read_ring_buffer(
+                self._buffer_events, self._n_epochs_acquired, self._bufsize
+            )
 
     @property
     def info(self) -> Info:
@@ -888,88 +1078,6 @@ def _ensure_detrend_str(detrend: int | str | None) -> str | None:
     return mapping[detrend]
 
 
-def _find_events_in_stim_channels(
-    data: ScalarArray,
-    event_channels: list[str],
-    sfreq: float,
-    *,
-    output: str = "onset",
-    consecutive: bool | str = "increasing",
-    min_duration: float = 0,
-    shortest_event: int = 2,
-    mask: int | None = None,
-    uint_cast: bool = False,
-    mask_type: str = "and",
-    initial_event: bool = False,
-) -> NDArray[np.int64]:
-    """Find events in stim channels."""
-    min_samples = min_duration * sfreq
-    events_list = []
-    for d, ch_name in zip(data, event_channels, strict=True):
-        events = find_events(
-            d[np.newaxis, :],
-            first_samp=0,
-            verbose="CRITICAL",  # disable MNE's logging
-            output=output,
-            consecutive=consecutive,
-            min_samples=min_samples,
-            mask=mask,
-            uint_cast=uint_cast,
-            mask_type=mask_type,
-            initial_event=initial_event,
-            ch_name=ch_name,
-        )
-        # add safety check for spurious events (for ex. from neuromag syst.) by
-        # checking the number of low sample events
-        n_short_events = np.sum(np.diff(events[:, 0]) < shortest_event)
-        if n_short_events > 0:
-            warn(
-                f"You have {n_short_events} events shorter than the shortest_event. "
-                "These are very unusual and you may want to set min_duration to a "
-                "larger value e.g. x / raw.info['sfreq']. Where x = 1 sample shorter "
-                "than the shortest event length."
-            )
-        events_list.append(events)
-    events = np.concatenate(events_list, axis=0)
-    events = _find_unique_events(events)
-    return events[np.argsort(events[:, 0])]
-
-
-def _prune_events(
-    events: NDArray[np.int64],
-    event_id: dict[str, int] | None,
-    buffer_size: int,
-    ts: NDArray[np.float64],
-    last_ts: float | None,
-    ts_events: NDArray[np.float64] | None,
-    tmin_shift: float,
-) -> NDArray[np.int64]:
-    """Prune events based on criteria and buffer size."""
-    # remove events outside of the event_id dictionary
-    if event_id is not None:
-        sel = np.isin(events[:, 2], list(event_id.values()))
-        events = events[sel]
-    # get the events position in the stream times after removing events outside of ts
-    if ts_events is not None:
-        sel = np.where(
-            (ts[0] <= ts_events[events[:, 0]]) & (ts_events[events[:, 0]] <= ts[-1])
-        )[0]
-        events = events[sel]
-        events[:, 0] = np.searchsorted(ts, ts_events[events[:, 0]], side="left")
-    sel = np.where(0 <= events[:, 0] + tmin_shift)[0]
-    # remove events which can't fit an entire epoch and/or are outside of the buffer
-    sel = np.where(
-        (0 <= events[:, 0] + tmin_shift)
-        & (events[:, 0] + tmin_shift + buffer_size <= ts.size)
-    )[0]
-    events = events[sel]
-    # remove events which have already been moved to the buffer
-    if last_ts is not None:
-        sel = np.where(ts[events[:, 0]] > last_ts)[0]
-        events = events[sel]
-    return events
-
-
 def _process_data(
     data: ScalarArray,  # array of shape (n_epochs, n_samples, n_channels)
     baseline: tuple[float | None, float | None] | None,
@@ -980,9 +1088,13 @@ def _process_data(
     detrend_type: str | None,
     times: NDArray[np.float64],
     ch_idx_by_type: dict[str, list[int]],
-) -> ScalarArray:
-    """Apply the requested processing to the new epochs."""
+) -> tuple[ScalarArray, NDArray[np.int64]]:
+    """Apply the requested processing to the new epochs.
+
+    Returns the processed epochs and the indices of the epochs kept after rejection.
+    """
     # start by PTP rejection to limit the number of epochs to baseline and detrend
+    sel = np.arange(data.shape[0])
     if reject is not None or flat is not None:
         # figure out the slice of indices to use for rejection
         if reject_tmin is None:
@@ -1025,7 +1137,7 @@ def _process_data(
                 "'reject_tmax' yields an empty segment. Skipping rejection."
             )
     if data.shape[0] == 0:
-        return data
+        return data, sel
     # next apply baseline correction
     if baseline is not None:
         if baseline[0] is None:
@@ -1050,14 +1162,4 @@ def _process_data(
     # finally detrend the data
     if detrend_type is not None:
         data = detrend(data, axis=1, type=detrend_type, overwrite_data=True)
-    return data
-
-
-def _remove_empty_elements(
-    data: ScalarArray, ts: NDArray[np.float64]
-) -> tuple[ScalarArray, NDArray[np.float64]]:
-    """Remove empty elements from the data and ts array."""
-    n_samples = np.count_nonzero(ts)
-    data = data[:, -n_samples:]
-    ts = ts[-n_samples:]
-    return data, ts
+    return data, sel
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator, Callable
+
 import numpy as np
 from _typeshed import Incomplete
 from mne import Info
@@ -9,11 +11,20 @@ from ..utils._checks import check_type as check_type
 from ..utils._checks import check_value as check_value
 from ..utils._checks import ensure_int as ensure_int
 from ..utils._docs import fill_doc as fill_doc
-from ..utils._fixes import find_events as find_events
-from ..utils._time import high_precision_sleep as high_precision_sleep
+from ..utils._time import SleepStrategy as SleepStrategy
+from ..utils._time import get_sleep_strategy as get_sleep_strategy
 from ..utils.logs import logger as logger
 from ..utils.logs import warn as warn
+from ._async import AsyncNotifier as AsyncNotifier
+from ._buffer import check_out_array as check_out_array
+from ._buffer import read_ring_buffer as read_ring_buffer
+from ._buffer import read_ring_buffer_windows as read_ring_buffer_windows
+from ._buffer import write_ring_buffer as write_ring_buffer
+from ._events import EventQueue as EventQueue
+from ._events import StimChannelDetector as StimChannelDetector
+from ._picks import PicksCache as PicksCache
 from .base import BaseStream as BaseStream
+from .scheduler import AcquisitionScheduler as AcquisitionScheduler
 
 class EpochsStream:
     """Stream object representing a single real-time stream of epochs.
@@ -192,6 +203,7 @@ class EpochsStream:
     _picks_init: Incomplete
     _times: Incomplete
     _lock: Incomplete
+    _notifier: Incomplete
 
     def __init__(
         self,
@@ -229,16 +241,104 @@ class EpochsStream:
         connected with an acquisition delay different from ``0``. In this case, the
         acquisition is done automatically in a background thread.
         """
+
+    def add_callback(self, callback: Callable) -> EpochsStream:
+        """Add a callback called on the new epochs.
+
+        Parameters
+        ----------
+        callback : Callable
+            A callable function called every time new epochs are added to the buffer,
+            with the new epochs only. The callback receives the processed epochs, i.e.
+            after rejection, baseline correction and detrending, thus the callback
+            signature should be:
+
+            .. literalinclude:: /_examples/epochs_callback.py
+                :language: python
+
+            With ``data`` the array of new epochs of shape
+            ``(n_epochs, n_channels, n_samples)``, ``events`` the array of event codes
+            of shape ``(n_epochs,)`` and ``timestamps`` the array of shape
+            ``(n_epochs,)`` of the timestamps of the events on the attached
+            ``Stream``. The value returned by the callback is ignored.
+
+        Returns
+        -------
+        epochs : instance of :class:`~mne_lsl.stream.EpochsStream`
+            The epochs instance modified in-place.
+
+        Notes
+        -----
+        Callback(s) are called in the same thread as the acquisition, in the order they
+        were added, after the new epochs are added to the buffer. Thus, they should be
+        fast and non-blocking. If the callback takes too long, the acquisition will be
+        delayed. The array ``data`` is not a view on the buffer, and it is shared
+        between the callbacks.
+
+        Callback(s) are removed when the :class:`~mne_lsl.stream.EpochsStream` is
+        disconnected.
+        """
+    _n_new_epochs: int
+
+    @fill_doc
+    async def aiter(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> AsyncIterator[ScalarArray]:
+        """Iterate asynchronously over the new epochs.
+
+        The iterator awaits the new epochs without polling: the acquisition thread
+        wakes up the event loop running the iterator every time new epochs are added
+        to the buffer.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Yields
+        ------
+        data : array of shape (n_epochs, n_channels, n_samples)
+            New epochs acquired since the previous iteration, within the limit of the
+            buffer size.
+
+        Notes
+        -----
+        As :meth:`~mne_lsl.stream.EpochsStream.get_data`, the iterator resets the
+        number of new epochs stored in the property ``n_new_epochs``, thus a single
+        consumer should retrieve the new epochs. The iteration stops when the
+        :class:`~mne_lsl.stream.EpochsStream` is disconnected.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            async for data in epochs.aiter(picks="eeg"):
+                await websocket.send(data.tobytes())
+        """
     _acquisition_delay: Incomplete
+    _scheduler: Incomplete
     _picks: Incomplete
     _info: Incomplete
     _tmin_shift: Incomplete
     _ch_idx_by_type: Incomplete
     _buffer: Incomplete
     _buffer_events: Incomplete
+    _n_epochs_acquired: int
+    _n_samples_acquired: int
+    _n_events_acquired: int
+    _event_detector: Incomplete
+    _event_queue: Incomplete
     _executor: Incomplete
 
-    def connect(self, acquisition_delay: float | None = 0.001) -> EpochsStream:
+    @fill_doc
+    def connect(
+        self,
+        acquisition_delay: float | None = 0.001,
+        *,
+        scheduler: AcquisitionScheduler | None = None,
+    ) -> EpochsStream:
         """Start acquisition of epochs from the connected Stream.
 
         Parameters
@@ -254,7 +354,13 @@ class EpochsStream:
 
                 For a new epoch to be added to the buffer, the epoch must be fully
                 acquired, i.e. the last sample of the epoch must be received. Thus, an
-                epoch is acquired ``tmax`` seconds after the event onset.
+                epoch is added to the buffer by the first acquisition following the
+                reception of its last sample, between ``tmax`` and
+                ``tmax + acquisition_delay`` seconds after the event onset.
+        scheduler : AcquisitionScheduler | None
+            If provided, the acquisition runs on the shared worker threads of the
+            :class:`~mne_lsl.stream.AcquisitionScheduler` instead of a dedicated background
+            thread. Ignored if the acquisition is manual.
 
         Returns
         -------
@@ -270,7 +376,6 @@ class EpochsStream:
         epochs : instance of :class:`~mne_lsl.stream.EpochsStream`
             The epochs instance modified in-place.
         """
-    _n_new_epochs: int
 
     @fill_doc
     def get_data(
@@ -278,6 +383,7 @@ class EpochsStream:
         n_epochs: int | None = None,
         picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
         exclude: str | list[str] | tuple[str, ...] = "bads",
+        out: ScalarArray | None = None,
     ) -> ScalarArray:
         """Retrieve the latest epochs from the buffer.
 
@@ -298,25 +404,54 @@ class EpochsStream:
         exclude : str | list of str | tuple of str
             Set of channels to exclude, only used when picking based on types (e.g.,
             ``exclude="bads"`` when ``picks="meg"``) or when picking is set to ``None``.
+        out : array of shape (n_epochs, n_channels, n_samples) | None
+            If provided, the data is written in this pre-allocated array instead of a
+            new array. The array must have the same dtype as the stream.
 
         Returns
         -------
         data : array of shape (n_epochs, n_channels, n_samples)
-            Data in the buffer.
+            Data in the buffer. If ``out`` is provided, ``out`` is returned.
 
         Notes
         -----
         The number of newly available epochs stored in the property ``n_new_epochs``
         is reset at every function call, even if all channels were not selected with the
         argument ``picks``.
+
+        Retrieving the data in a pre-allocated array avoids allocating a new array at
+        every call. The copy is faster if the selected channels are contiguous in the
+        buffer, e.g. all the channels of a given type.
+        """
+    _sleep_strategy: Incomplete
+
+    def set_sleep_strategy(
+        self, method: str | None = "hybrid", spin: float = 0.0002
+    ) -> EpochsStream:
+        """Set the strategy used to wait between 2 acquisitions.
+
+        Parameters
+        ----------
+        method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'`` | None
+            The waiting method, see :func:`mne_lsl.set_sleep_strategy`. If ``None``,
+            the default strategy set with :func:`mne_lsl.set_sleep_strategy` is used.
+        spin : float
+            Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+            ``'deadline'`` wait. ``0`` disables the busy-wait.
+
+        Returns
+        -------
+        epochs : instance of :class:`~mne_lsl.stream.EpochsStream`
+            The epochs instance modified in-place.
         """
-    _last_ts: Incomplete
 
     def _acquire(self) -> None:
         """Update function looking for new epochs."""
 
     def _check_connected(self, name: str) -> None:
         """Check that the epochs stream is connected before calling 'name'."""
+    _callbacks: Incomplete
+    _picks_cache: Incomplete
 
     def _reset_variables(self) -> None:
         """Reset variables defined after connection."""
@@ -324,6 +459,13 @@ class EpochsStream:
     def _submit_acquisition_job(self) -> None:
         """Submit a new acquisition job, if applicable."""
 
+    @property
+    def callbacks(self) -> list[Callable]:
+        """List of callbacks called on the new epochs.
+
+        :type: :class:`list` of :class:`~collections.abc.Callable`
+        """
+
     @property
     def connected(self) -> bool:
         """Connection status of the :class:`~mne_lsl.stream.EpochsStream`.
@@ -392,33 +534,6 @@ def _check_reject_tmin_tmax(
 def _ensure_detrend_str(detrend: int | str | None) -> str | None:
     """Ensure detrend is an integer."""
 
-def _find_events_in_stim_channels(
-    data: ScalarArray,
-    event_channels: list[str],
-    sfreq: float,
-    *,
-    output: str = "onset",
-    consecutive: bool | str = "increasing",
-    min_duration: float = 0,
-    shortest_event: int = 2,
-    mask: int | None = None,
-    uint_cast: bool = False,
-    mask_type: str = "and",
-    initial_event: bool = False,
-) -> NDArray[np.int64]:
-    """Find events in stim channels."""
-
-def _prune_events(
-    events: NDArray[np.int64],
-    event_id: dict[str, int] | None,
-    buffer_size: int,
-    ts: NDArray[np.float64],
-    last_ts: float | None,
-    ts_events: NDArray[np.float64] | None,
-    tmin_shift: float,
-) -> NDArray[np.int64]:
-    """Prune events based on criteria and buffer size."""
-
 def _process_data(
     data: ScalarArray,
     baseline: tuple[float | None, float | None] | None,
@@ -429,10 +544,8 @@ def _process_data(
     detrend_type: str | None,
     times: NDArray[np.float64],
     ch_idx_by_type: dict[str, list[int]],
-) -> ScalarArray:
-    """Apply the requested processing to the new epochs."""
+) -> tuple[ScalarArray, NDArray[np.int64]]:
+    """Apply the requested processing to the new epochs.
 
-def _remove_empty_elements(
-    data: ScalarArray, ts: NDArray[np.float64]
-) -> tuple[ScalarArray, NDArray[np.float64]]:
-    """Remove empty elements from the data and ts array."""
+    Returns the processed epochs and the indices of the epochs kept after rejection.
+    """
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..utils._docs import fill_doc
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from .._typing import ScalarArray, ScalarIntArray
+    from .base import BaseStream
+
+
+class StreamReader:
+    """Reader retrieving the new samples of a stream with its own read position.
+
+    A reader is created with :meth:`~mne_lsl.stream.BaseStream.create_reader` and
+    should not be instantiated directly. Multiple readers attached to the same stream
+    share the acquisition thread and the buffer of the stream, but each reader
+    retrieves the new samples independently of the other readers and of the calls to
+    :meth:`~mne_lsl.stream.BaseStream.get_data` and
+    :meth:`~mne_lsl.stream.BaseStream.get_new_data`.
+
+    Parameters
+    ----------
+    stream : ``Stream``
+        The connected stream to read from.
+    name : str
+        Name of the reader, unique among the readers attached to the stream.
+    """
+
+    def __init__(self, stream: BaseStream, name: str) -> None:
+        self._stream = stream
+        self._name = name
+        self._n_overrun = 0
+        self._n_samples_read = stream._n_samples_acquired
+
+    def __repr__(self) -> str:
+        """Representation of the instance."""
+        return f"<StreamReader '{self._name}' attached to {self._stream}>"
+
+    def close(self) -> None:
+        """Detach the reader from the stream.
+
+        Once closed, the reader can not retrieve samples anymore and its name can be
+        reused by a new reader.
+        """
+        self._check_attached("close()")
+        with self._stream._lock:
+            self._stream._readers.remove(self)
+
+    @fill_doc
+    def get_new_data(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> tuple[ScalarArray, NDArray[np.float64], bool]:
+        """Retrieve the samples added to the buffer since the last call of this reader.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        %(exclude)s
+
+        Returns
+        -------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the last call.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        overrun : bool
+            True if more samples than the buffer can hold were acquired since the last
+            call, in which case the oldest samples were overwritten before being
+            retrieved and only the last ``n_buffer`` samples are returned. The number
+            of samples lost is accumulated in the property ``n_overrun``.
+
+        Notes
+        -----
+        The first call returns the samples acquired since the creation of the reader.
+        """
+        self._check_attached("get_new_data()")
+        picks = self._stream._picks_cache.get(
+            self._stream._info, picks, exclude, none="all"
+        )
+        with self._stream._lock:
+            data, ts, n_lost = self._stream._read_new_samples(
+                self._n_samples_read, picks
+            )
+            self._n_samples_read = self._stream._n_samples_acquired
+        self._n_overrun += n_lost
+        return data.T, ts, n_lost != 0
+
+    def _check_attached(self, name: str) -> None:
+        """Check that the reader is attached to the connected stream."""
+        if self not in getattr(self._stream, "_readers", ()):
+            raise RuntimeError(
+                f"The StreamReader '{self._name}' is not attached to a connected "
+                "Stream. Readers are detached when they are closed or when the stream "
+                "is disconnected, please create a new reader with "
+                f"stream.create_reader() to use {type(self).__name__}.{name}."
+            )
+
+    # ----------------------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name of the reader.
+
+        :type: :class:`str`
+        """
+        return self._name
+
+    @property
+    def n_new_samples(self) -> int:
+        """Number of new samples acquired since the last call of this reader.
+
+        The number of new samples can exceed the buffer size if the reader did not
+        retrieve the new samples often enough.
+
+        :type: :class:`int`
+        """
+        self._check_attached("n_new_samples")
+        return self._stream._n_samples_acquired - self._n_samples_read
+
+    @property
+    def n_overrun(self) -> int:
+        """Number of samples overwritten in the buffer before being retrieved.
+
+        :type: :class:`int`
+        """
+        return self._n_overrun
+
+    @property
+    def stream(self) -> BaseStream:
+        """Stream to which the reader is attached.
+
+        :type: ``Stream``
+        """
+        return self._stream
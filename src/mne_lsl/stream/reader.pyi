@@ -0,0 +1,116 @@
+import numpy as np
+from _typeshed import Incomplete
+from numpy.typing import NDArray as NDArray
+
+from .._typing import ScalarArray as ScalarArray
+from .._typing import ScalarIntArray as ScalarIntArray
+from ..utils._docs import fill_doc as fill_doc
+from .base import BaseStream as BaseStream
+
+class StreamReader:
+    """Reader retrieving the new samples of a stream with its own read position.
+
+    A reader is created with :meth:`~mne_lsl.stream.BaseStream.create_reader` and
+    should not be instantiated directly. Multiple readers attached to the same stream
+    share the acquisition thread and the buffer of the stream, but each reader
+    retrieves the new samples independently of the other readers and of the calls to
+    :meth:`~mne_lsl.stream.BaseStream.get_data` and
+    :meth:`~mne_lsl.stream.BaseStream.get_new_data`.
+
+    Parameters
+    ----------
+    stream : ``Stream``
+        The connected stream to read from.
+    name : str
+        Name of the reader, unique among the readers attached to the stream.
+    """
+
+    _stream: Incomplete
+    _name: Incomplete
+    _n_overrun: int
+    _n_samples_read: Incomplete
+
+    def __init__(self, stream: BaseStream, name: str) -> None: ...
+    def __repr__(self) -> str:
+        """Representation of the instance."""
+
+    def close(self) -> None:
+        """Detach the reader from the stream.
+
+        Once closed, the reader can not retrieve samples anymore and its name can be
+        reused by a new reader.
+        """
+
+    @fill_doc
+    def get_new_data(
+        self,
+        picks: str | list[str] | int | list[int] | ScalarIntArray | None = None,
+        exclude: str | list[str] | tuple[str, ...] = "bads",
+    ) -> tuple[ScalarArray, NDArray[np.float64], bool]:
+        """Retrieve the samples added to the buffer since the last call of this reader.
+
+        Parameters
+        ----------
+        picks : str | array-like | slice | None
+            Channels to include. Slices and lists of integers will be interpreted as
+            channel indices. In lists, channel *type* strings (e.g., ``['meg',
+            'eeg']``) will pick channels of those types, channel *name* strings (e.g.,
+            ``['MEG0111', 'MEG2623']`` will pick the given channels. Can also be the
+            string values ``'all'`` to pick all channels, or ``'data'`` to pick
+            :term:`data channels`. None (default) will pick all channels. Note that
+            channels in ``info['bads']`` *will be included* if their names or indices
+            are explicitly provided.
+        exclude : str | list of str | tuple of str
+            Set of channels to exclude, only used when picking based on types (e.g.,
+            ``exclude="bads"`` when ``picks="meg"``) or when picking is set to ``None``.
+
+        Returns
+        -------
+        data : array of shape (n_channels, n_samples)
+            New samples acquired since the last call.
+        timestamps : array of shape (n_samples,)
+            Timestamps of the new samples.
+        overrun : bool
+            True if more samples than the buffer can hold were acquired since the last
+            call, in which case the oldest samples were overwritten before being
+            retrieved and only the last ``n_buffer`` samples are returned. The number
+            of samples lost is accumulated in the property ``n_overrun``.
+
+        Notes
+        -----
+        The first call returns the samples acquired since the creation of the reader.
+        """
+
+    def _check_attached(self, name: str) -> None:
+        """Check that the reader is attached to the connected stream."""
+
+    @property
+    def name(self) -> str:
+        """Name of the reader.
+
+        :type: :class:`str`
+        """
+
+    @property
+    def n_new_samples(self) -> int:
+        """Number of new samples acquired since the last call of this reader.
+
+        The number of new samples can exceed the buffer size if the reader did not
+        retrieve the new samples often enough.
+
+        :type: :class:`int`
+        """
+
+    @property
+    def n_overrun(self) -> int:
+        """Number of samples overwritten in the buffer before being retrieved.
+
+        :type: :class:`int`
+        """
+
+    @property
+    def stream(self) -> BaseStream:
+        """Stream to which the reader is attached.
+
+        :type: ``Stream``
+        """
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Lock, Thread, local
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from ..utils._checks import ensure_int
+from ..utils.logs import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+
+class AcquisitionScheduler:
+    """Scheduler running the acquisition of several streams on a shared pool of threads.
+
+    By default, every :class:`~mne_lsl.stream.StreamLSL` and
+    :class:`~mne_lsl.stream.EpochsStream` acquires new samples in its own background
+    thread, which sleeps between 2 acquisitions. A scheduler multiplexes the
+    acquisitions of the streams connected with it on a fixed number of worker threads:
+    a single dispatcher thread wakes up at the earliest deadline among the pending
+    acquisitions and hands it over to a worker, thus the workers never sleep.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker threads running the acquisitions.
+
+    Notes
+    -----
+    The acquisitions of a given stream are never run concurrently. A stream connected
+    with ``acquisition_delay=0`` waits for new samples in a worker, up to 50 ms, thus
+    the number of workers should exceed the number of such streams.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from mne_lsl.stream import AcquisitionScheduler, EpochsStream, StreamLSL
+
+        scheduler = AcquisitionScheduler(n_workers=2)
+        stream1 = StreamLSL(2, name="stream1").connect(scheduler=scheduler)
+        stream2 = StreamLSL(2, name="stream2").connect(scheduler=scheduler)
+        epochs = EpochsStream(stream1, 10, event_channels="trg", event_id=None)
+        epochs.connect(scheduler=scheduler)
+    """
+
+    def __init__(self, n_workers: int = 2) -> None:
+        n_workers = ensure_int(n_workers, "n_workers")
+        if n_workers <= 0:
+            raise ValueError(
+                "The argument 'n_workers' must be a strictly positive integer. "
+                f"{n_workers} is invalid."
+            )
+        self._n_workers = n_workers
+        self._condition = Condition()
+        self._heap = []  # entries (deadline, sequence, executor, function)
+        self._sequence = count()  # tie-breaker between identical deadlines
+        self._local = local()  # executor of the job running in a worker
+        self._pool = None
+        self._thread = None
+        self._stopped = False
+
+    def __repr__(self) -> str:
+        """Representation of the scheduler."""
+        status = "stopped" if self._stopped else "running"
+        return f"<AcquisitionScheduler: {self._n_workers} workers ({status})>"
+
+    def shutdown(self) -> None:
+        """Stop the dispatcher and the worker threads.
+
+        The streams connected with the scheduler stop acquiring new samples and should
+        be disconnected.
+        """
+        with self._condition:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._heap.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        logger.debug("%s: shutdown.", self)
+
+    def _create_executor(self) -> _ScheduledExecutor:
+        """Create the executor scheduling the acquisitions of a stream."""
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError(
+                    "The scheduler was shutdown and can not schedule new acquisitions."
+                )
+            if self._thread is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._n_workers, thread_name_prefix="mne_lsl-worker"
+                )
+                self._thread = Thread(
+                    target=self._dispatch, name="mne_lsl-scheduler", daemon=True
+                )
+                self._thread.start()
+                logger.debug("%s: started.", self)
+        return _ScheduledExecutor(self)
+
+    def _dispatch(self) -> None:
+        """Hand over the acquisitions to the workers at their deadline."""
+        with self._condition:
+            while not self._stopped:
+                if len(self._heap) == 0:
+                    self._condition.wait()
+                    continue
+                timeout = self._heap[0][0] - perf_counter()
+                if 0 < timeout:
+                    self._condition.wait(timeout)
+                    continue
+                _, _, executor, function = heappop(self._heap)
+                future = self._pool.submit(self._run, executor, function)
+                executor._add_future(future)
+
+    def _push(
+        self, delay: float, executor: _ScheduledExecutor, function: Callable
+    ) -> None:
+        """Schedule a function in ``delay`` seconds."""
+        with self._condition:
+            if self._stopped or executor._shutdown:
+                raise RuntimeError("cannot schedule new acquisitions after shutdown")
+            entry = (perf_counter() + delay, next(self._sequence), executor, function)
+            heappush(self._heap, entry)
+            if self._heap[0] is entry:  # new earliest deadline
+                self._condition.notify()
+
+    def _remove(self, executor: _ScheduledExecutor) -> None:
+        """Shutdown an executor and remove its pending acquisitions."""
+        with self._condition:
+            executor._shutdown = True
+            self._heap = [entry for entry in self._heap if entry[2] is not executor]
+            self._heap.sort()  # a sorted list satisfies the heap invariant
+
+    def _run(self, executor: _ScheduledExecutor, function: Callable) -> None:
+        """Run a function in a worker."""
+        self._local.executor = executor
+        try:
+            function()
+        finally:
+            self._local.executor = None
+
+
+class _ScheduledExecutor:
+    """Executor scheduling the acquisitions of a stream on a shared scheduler.
+
+    The executor exposes the subset of the :class:`~concurrent.futures.Executor` API
+    used by the streams, and :meth:`schedule` to submit a function after a delay
+    without blocking a worker.
+    """
+
+    def __init__(self, scheduler: AcquisitionScheduler) -> None:
+        self._scheduler = scheduler
+        self._futures = set()
+        self._lock = Lock()
+        self._shutdown = False
+
+    def _add_future(self, future: Future) -> None:
+        """Track a future until it is done."""
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future: Future) -> None:
+        """Stop tracking a future which is done."""
+        with self._lock:
+            self._futures.discard(future)
+
+    def schedule(self, delay: float, function: Callable) -> None:
+        """Schedule a function in ``delay`` seconds."""
+        self._scheduler._push(delay, self, function)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Remove the pending functions and wait for the running one."""
+        self._scheduler._remove(self)
+        with self._lock:
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        # do not wait for the running function if it is the caller
+        if wait and getattr(self._scheduler._local, "executor", None) is not self:
+            wait_futures(futures)
+
+    def submit(self, function: Callable) -> None:
+        """Schedule a function as soon as possible."""
+        self._scheduler._push(0, self, function)
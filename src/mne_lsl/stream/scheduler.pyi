@@ -0,0 +1,107 @@
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from _typeshed import Incomplete
+
+from ..utils._checks import ensure_int as ensure_int
+from ..utils.logs import logger as logger
+
+class AcquisitionScheduler:
+    """Scheduler running the acquisition of several streams on a shared pool of threads.
+
+    By default, every :class:`~mne_lsl.stream.StreamLSL` and
+    :class:`~mne_lsl.stream.EpochsStream` acquires new samples in its own background
+    thread, which sleeps between 2 acquisitions. A scheduler multiplexes the
+    acquisitions of the streams connected with it on a fixed number of worker threads:
+    a single dispatcher thread wakes up at the earliest deadline among the pending
+    acquisitions and hands it over to a worker, thus the workers never sleep.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker threads running the acquisitions.
+
+    Notes
+    -----
+    The acquisitions of a given stream are never run concurrently. A stream connected
+    with ``acquisition_delay=0`` waits for new samples in a worker, up to 50 ms, thus
+    the number of workers should exceed the number of such streams.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from mne_lsl.stream import AcquisitionScheduler, EpochsStream, StreamLSL
+
+        scheduler = AcquisitionScheduler(n_workers=2)
+        stream1 = StreamLSL(2, name="stream1").connect(scheduler=scheduler)
+        stream2 = StreamLSL(2, name="stream2").connect(scheduler=scheduler)
+        epochs = EpochsStream(stream1, 10, event_channels="trg", event_id=None)
+        epochs.connect(scheduler=scheduler)
+    """
+
+    _n_workers: Incomplete
+    _condition: Incomplete
+    _heap: Incomplete
+    _sequence: Incomplete
+    _local: Incomplete
+    _pool: Incomplete
+    _thread: Incomplete
+    _stopped: bool
+
+    def __init__(self, n_workers: int = 2) -> None: ...
+    def __repr__(self) -> str:
+        """Representation of the scheduler."""
+
+    def shutdown(self) -> None:
+        """Stop the dispatcher and the worker threads.
+
+        The streams connected with the scheduler stop acquiring new samples and should
+        be disconnected.
+        """
+
+    def _create_executor(self) -> _ScheduledExecutor:
+        """Create the executor scheduling the acquisitions of a stream."""
+
+    def _dispatch(self) -> None:
+        """Hand over the acquisitions to the workers at their deadline."""
+
+    def _push(
+        self, delay: float, executor: _ScheduledExecutor, function: Callable
+    ) -> None:
+        """Schedule a function in ``delay`` seconds."""
+
+    def _remove(self, executor: _ScheduledExecutor) -> None:
+        """Shutdown an executor and remove its pending acquisitions."""
+
+    def _run(self, executor: _ScheduledExecutor, function: Callable) -> None:
+        """Run a function in a worker."""
+
+class _ScheduledExecutor:
+    """Executor scheduling the acquisitions of a stream on a shared scheduler.
+
+    The executor exposes the subset of the :class:`~concurrent.futures.Executor` API
+    used by the streams, and :meth:`schedule` to submit a function after a delay
+    without blocking a worker.
+    """
+
+    _scheduler: Incomplete
+    _futures: Incomplete
+    _lock: Incomplete
+    _shutdown: bool
+
+    def __init__(self, scheduler: AcquisitionScheduler) -> None: ...
+    def _add_future(self, future: Future) -> None:
+        """Track a future until it is done."""
+
+    def _discard_future(self, future: Future) -> None:
+        """Stop tracking a future which is done."""
+
+    def schedule(self, delay: float, function: Callable) -> None:
+        """Schedule a function in ``delay`` seconds."""
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Remove the pending functions and wait for the running one."""
+
+    def submit(self, function: Callable) -> None:
+        """Schedule a function as soon as possible."""
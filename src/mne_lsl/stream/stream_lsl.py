@@ -5,10 +5,8 @@ from math import ceil
 from typing import TYPE_CHECKING
 
 import numpy as np
-from mne._fiff.constants import FIFF
-from scipy.signal import sosfilt
 
-from ..lsl import StreamInlet, resolve_streams
+from ..lsl import StreamInlet, local_clock, resolve_streams
 from ..lsl.constants import fmt2numpy
 from ..utils._checks import check_type
 from ..utils._docs import copy_doc, fill_doc
@@ -18,8 +16,19 @@ from .base import BaseStream
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from numpy.typing import NDArray
+
     from mne_lsl.lsl.stream_info import _BaseStreamInfo
 
+    from .._typing import ScalarArray
+    from .scheduler import AcquisitionScheduler
+
+# interval in seconds between 2 updates of the time correction estimate
+_TIME_CORRECTION_INTERVAL: float = 5.0
+# maximum time in seconds an acquisition waits for new samples, which bounds the time
+# needed to interrupt the acquisition when the source does not push new samples
+_WAIT_TIMEOUT: float = 0.05
+
 
 @fill_doc
 class StreamLSL(BaseStream):
@@ -93,12 +102,14 @@ class StreamLSL(BaseStream):
         super().acquire()
         self._acquire()
 
+    @fill_doc
     def connect(
         self,
         acquisition_delay: float | None = 0.001,
         *,
         processing_flags: str | Sequence[str] | None = None,
         timeout: float | None = 2,
+        scheduler: AcquisitionScheduler | None = None,
     ) -> StreamLSL:
         """Connect to the LSL stream and initiate data collection in the buffer.
 
@@ -106,9 +117,13 @@ class StreamLSL(BaseStream):
         ----------
         acquisition_delay : float | None
             Delay in seconds between 2 acquisition during which chunks of data are
-            pulled from the :class:`~mne_lsl.lsl.StreamInlet`. If ``None``, the
-            automatic acquisition in a background thread is disabled and the user must
-            manually call :meth:`~mne_lsl.stream.StreamLSL.acquire` to pull new samples.
+            pulled from the :class:`~mne_lsl.lsl.StreamInlet`. If ``0``, the
+            acquisition in a background thread blocks in the
+            :class:`~mne_lsl.lsl.StreamInlet` until new samples arrive and pulls them
+            immediately, which reduces both the CPU usage and the latency compared to a
+            pull at a regular interval. If ``None``, the automatic acquisition in a
+            background thread is disabled and the user must manually call
+            :meth:`~mne_lsl.stream.StreamLSL.acquire` to pull new samples.
         processing_flags : list of str | ``'all'`` | None
             Set the post-processing options. By default, post-processing is disabled.
             Any combination of the processing flags is valid. The available flags are:
@@ -127,6 +142,7 @@ class StreamLSL(BaseStream):
             :func:`~mne_lsl.lsl.resolve_streams`, the opening of the inlet with
             :meth:`~mne_lsl.lsl.StreamInlet.open_stream` and the estimation of the
             time correction with :meth:`~mne_lsl.lsl.StreamInlet.time_correction`.
+        %(scheduler)s
 
         Returns
         -------
@@ -141,7 +157,7 @@ class StreamLSL(BaseStream):
         stream identifiers is specified, resolution will stop as soon as one stream
         matching the identifier is found.
         """
-        super().connect(acquisition_delay)
+        super().connect(acquisition_delay, scheduler=scheduler)
         # The threadsafe processing flag should not be needed for this class. If it is
         # provided, then it means the user is retrieving and doing something with the
         # inlet in a different thread. This use-case is not supported, and users which
@@ -190,6 +206,12 @@ class StreamLSL(BaseStream):
         # initiate time-correction
         tc = self._inlet.time_correction(timeout=timeout)
         logger.info("The estimated timestamp offset is %.2f ms.", tc * 1000)
+        self._time_correction = self._time_correction_connect = tc
+        self._time_correction_update = local_clock()
+        # with 'clocksync', the timestamps pulled are already in the local clock domain
+        self._clocksync = processing_flags is not None and (
+            processing_flags == "all" or "clocksync" in processing_flags
+        )
         # create buffer of shape (n_samples, n_channels) and (n_samples,)
         if self._inlet.sfreq == 0:
             # in this case, 'self._bufsize' should be an integer
@@ -237,86 +259,158 @@ class StreamLSL(BaseStream):
 
     def _acquire(self) -> None:
         """Update function pulling new samples in the buffer at a regular interval."""
-        if not getattr(self, "_inlet", None):  # pragma: no cover
-            logger.debug("Stream disconnected while '_acquire' is called.")
-            return  # stream disconnected
-        try:
-            # pull data
+        # the acquisition lock pauses the acquisition while the stream is modified
+        with self._acquisition_lock:
+            if not getattr(self, "_inlet", None):  # pragma: no cover
+                logger.debug("Stream disconnected while '_acquire' is called.")
+                return  # stream disconnected
+            try:
+                self._acquire_new_samples()
+            except Exception as error:  # pragma: no cover
+                logger.exception(error)
+                self._reset_variables()  # disconnects from the stream
+                if os.getenv("MNE_LSL_RAISE_STREAM_ERRORS", "false").lower() == "true":
+                    raise error
+                return
+        self._submit_acquisition_job()
+
+    def _acquire_new_samples(self) -> None:
+        """Pull the new samples, process them and write them in the buffer."""
+        stats = self._stats  # None if the statistics are disabled
+        if stats is not None:
+            start = tic = stats.start()
+        # pull data, the buffer holds decimated samples
+        n_samples = self._timestamps.size * (
+            1 if self._decimator is None else self._decimator.factor
+        )
+        if self._acquisition_delay == 0:
+            data, timestamps = self._pull_chunk_on_arrival(n_samples)
+        else:
             data, timestamps = self._inlet.pull_chunk(
-                timeout=0.0, max_samples=self.n_buffer
+                timeout=0.0, max_samples=n_samples
             )
-            if timestamps.size == 0:
-                self._submit_acquisition_job()
-                return  # interrupt early
-            # process acquisition window
-            n_channels = self._inlet.n_channels
-            assert data.ndim == 2 and data.shape[-1] == n_channels, (  # noqa: PT018
-                f"Data shape {data.shape} (n_samples, n_channels) for "
-                f"{n_channels} channels."
+        if stats is not None:
+            tic = stats.lap("pull", tic)
+            stats.add("n_samples", timestamps.size)
+        if timestamps.size == 0:
+            return  # interrupt early
+        # process acquisition window
+        n_channels = self._inlet.n_channels
+        assert data.ndim == 2 and data.shape[-1] == n_channels, (  # noqa: PT018
+            f"Data shape {data.shape} (n_samples, n_channels) for "
+            f"{n_channels} channels."
+        )
+        # select the last n_samples samples from data and timestamps in case more
+        # samples than the buffer can hold were retrieved.
+        # select channels retained in the buffer.
+        if n_samples < timestamps.size:  # pragma: no cover
+            self._n_truncated += timestamps.size - n_samples
+        data = data[-n_samples:, self._picks_inlet]
+        timestamps = timestamps[-n_samples:]
+        if self._stype == "annotations" and np.count_nonzero(data) == 0:
+            return  # interrupt early
+        if self._spatial_operator is not None:
+            # added channels, reference, projectors and spatial filters folded in
+            # a single operator of shape (n_channels_inlet, n_channels)
+            data = data @ self._spatial_operator
+        elif len(self._added_channels) != 0:
+            refs = np.zeros(
+                (timestamps.size, len(self._added_channels)), dtype=self.dtype
             )
-            # select the last self._timestamps.size samples from data and timestamps in
-            # case more samples than the buffer can hold were retrieved.
-            # select channels retained in the buffer.
-            data = data[-self._timestamps.size :, self._picks_inlet]
-            timestamps = timestamps[-self._timestamps.size :]
-            if self._stype == "annotations" and np.count_nonzero(data) == 0:
-                self._submit_acquisition_job()
+            data = np.hstack((data, refs), dtype=self.dtype)
+        if stats is not None:
+            tic = stats.lap("spatial", tic)
+
+        # apply the anti-aliasing filter and decimate
+        if self._decimator is not None:
+            data, timestamps = self._decimator(data, timestamps)
+            if stats is not None:
+                tic = stats.lap("decimate", tic)
+            if timestamps.size == 0:
                 return  # interrupt early
-            if len(self._added_channels) != 0:
-                refs = np.zeros(
-                    (timestamps.size, len(self._added_channels)), dtype=self.dtype
-                )
-                data = np.hstack((data, refs), dtype=self.dtype)
-
-            if self._info["custom_ref_applied"] == FIFF.FIFFV_MNE_CUSTOM_REF_ON:
-                data_ref = data[:, self._ref_channels].mean(axis=1, keepdims=True)
-                data[:, self._ref_from] -= data_ref
-
-            # apply filters on (n_times, n_channels) data
-            for filt in self._filters:
-                if filt["zi"] is None:
-                    # initial conditions are set to a step response steady-state set
-                    # on the mean on the acquisition window (e.g. DC offset for EEGs)
-                    filt["zi"] = filt["zi_unit"] * np.mean(
-                        data[:, filt["picks"]], axis=0
-                    )
-                data_filtered, filt["zi"] = sosfilt(
-                    filt["sos"], data[:, filt["picks"]], zi=filt["zi"], axis=0
-                )
-                data[:, filt["picks"]] = data_filtered  # operate in-place
-
-            # apply callbacks
-            for callback in self._callbacks:
-                data, timestamps = callback(data, timestamps, self._info)
-
-            # roll and update buffers
-            with self._lock:
-                self._buffer = np.roll(self._buffer, -timestamps.size, axis=0)
-                self._timestamps = np.roll(self._timestamps, -timestamps.size, axis=0)
-                self._buffer[-timestamps.size :, :] = data
-                self._timestamps[-timestamps.size :] = timestamps
-                # update the number of new samples available
-                self._n_new_samples += timestamps.size
-            if self._timestamps.size < self._n_new_samples:
-                logger.info(
-                    "The number of new samples exceeds the buffer size. Consider using "
-                    "a larger buffer by creating a Stream with a larger 'bufsize' "
-                    "argument or consider retrieving new samples more often with "
-                    "Stream.get_data()."
-                )
-        except Exception as error:  # pragma: no cover
-            logger.exception(error)
-            self._reset_variables()  # disconnects from the stream
-            if os.getenv("MNE_LSL_RAISE_STREAM_ERRORS", "false").lower() == "true":
-                raise error
-        else:
-            self._submit_acquisition_job()
+
+        # apply filters on (n_times, n_channels) data, one fused cascade of
+        # second-order sections per group of channels sharing the same filters
+        for chain in self._filter_chains:
+            chain(data)
+        if stats is not None:
+            tic = stats.lap("filters", tic)
+
+        # apply callbacks
+        for callback in self._callbacks:
+            data, timestamps = callback(data, timestamps, self._info)
+        if stats is not None:
+            tic = stats.lap("callbacks", tic)
+
+        # write in-place in the circular buffers
+        self._write_buffer(data, timestamps)
+        now = local_clock()
+        if stats is not None:
+            stats.lap("write", tic)
+            stats.lap("total", start)
+        self._update_latency(now, timestamps[-1])
+        if stats is not None:
+            stats.add("latency", self._latency)
+
+    def _pull_chunk_on_arrival(
+        self, n_samples: int
+    ) -> tuple[ScalarArray, NDArray[np.float64]]:
+        """Pull a chunk of samples, waiting for at least one sample to be available.
+
+        Parameters
+        ----------
+        n_samples : int
+            Maximum number of samples to pull.
+
+        Returns
+        -------
+        data : array of shape (n_samples, n_channels)
+            The samples pulled, empty if no sample arrived before the timeout.
+        timestamps : array of shape (n_samples,)
+            The timestamps of the samples pulled.
+        """
+        # pull_chunk with a timeout blocks until 'max_samples' are available, while
+        # pull_sample with a timeout returns as soon as one sample is available.
+        sample, timestamp = self._inlet.pull_sample(timeout=_WAIT_TIMEOUT)
+        if timestamp is None:
+            return sample.reshape(0, self._inlet.n_channels), np.empty(0)
+        data, timestamps = self._inlet.pull_chunk(
+            timeout=0.0, max_samples=max(n_samples - 1, 1)
+        )
+        data = np.vstack((sample, data))
+        timestamps = np.concatenate(((timestamp,), timestamps))
+        return data, timestamps
 
     def _reset_variables(self) -> None:
         """Reset variables define after connection."""
         super()._reset_variables()
+        self._clocksync = None
         self._sinfo = None
         self._inlet = None
+        self._time_correction_update = None
+
+    def _update_latency(self, now: float, timestamp: float) -> None:
+        """Update the latency of the most recent sample written in the buffer.
+
+        Parameters
+        ----------
+        now : float
+            Time at which the sample was written in the buffer, in the local clock.
+        timestamp : float
+            Timestamp of the sample, in the clock of the source unless the
+            ``'clocksync'`` processing flag is set.
+        """
+        if _TIME_CORRECTION_INTERVAL <= now - self._time_correction_update:
+            # the estimate is periodically updated in the background by liblsl, thus
+            # the retrieval of the last estimate does not block.
+            try:
+                self._time_correction = self._inlet.time_correction(timeout=0.0)
+            except TimeoutError:  # pragma: no cover
+                pass
+            self._time_correction_update = now
+        if not self._clocksync:
+            timestamp += self._time_correction
+        self._latency = now - timestamp
 
     # ----------------------------------------------------------------------------------
     @property
@@ -1,10 +1,14 @@
 from collections.abc import Sequence
 
+import numpy as np
 from _typeshed import Incomplete
+from numpy.typing import NDArray as NDArray
 
 from mne_lsl.lsl.stream_info import _BaseStreamInfo as _BaseStreamInfo
 
+from .._typing import ScalarArray as ScalarArray
 from ..lsl import StreamInlet as StreamInlet
+from ..lsl import local_clock as local_clock
 from ..lsl import resolve_streams as resolve_streams
 from ..lsl.constants import fmt2numpy as fmt2numpy
 from ..utils._checks import check_type as check_type
@@ -12,6 +16,10 @@ from ..utils._docs import copy_doc as copy_doc
 from ..utils._docs import fill_doc as fill_doc
 from ..utils.logs import logger as logger
 from .base import BaseStream as BaseStream
+from .scheduler import AcquisitionScheduler as AcquisitionScheduler
+
+_TIME_CORRECTION_INTERVAL: float
+_WAIT_TIMEOUT: float
 
 class StreamLSL(BaseStream):
     """Stream object representing a single LSL stream.
@@ -69,17 +77,22 @@ class StreamLSL(BaseStream):
     _inlet: Incomplete
     _sinfo: Incomplete
     _info: Incomplete
+    _time_correction: Incomplete
+    _time_correction_update: Incomplete
+    _clocksync: Incomplete
     _bufsize: Incomplete
     _buffer: Incomplete
     _timestamps: Incomplete
     _picks_inlet: Incomplete
 
+    @fill_doc
     def connect(
         self,
         acquisition_delay: float | None = 0.001,
         *,
         processing_flags: str | Sequence[str] | None = None,
         timeout: float | None = 2,
+        scheduler: AcquisitionScheduler | None = None,
     ) -> StreamLSL:
         """Connect to the LSL stream and initiate data collection in the buffer.
 
@@ -87,9 +100,13 @@ class StreamLSL(BaseStream):
         ----------
         acquisition_delay : float | None
             Delay in seconds between 2 acquisition during which chunks of data are
-            pulled from the :class:`~mne_lsl.lsl.StreamInlet`. If ``None``, the
-            automatic acquisition in a background thread is disabled and the user must
-            manually call :meth:`~mne_lsl.stream.StreamLSL.acquire` to pull new samples.
+            pulled from the :class:`~mne_lsl.lsl.StreamInlet`. If ``0``, the
+            acquisition in a background thread blocks in the
+            :class:`~mne_lsl.lsl.StreamInlet` until new samples arrive and pulls them
+            immediately, which reduces both the CPU usage and the latency compared to a
+            pull at a regular interval. If ``None``, the automatic acquisition in a
+            background thread is disabled and the user must manually call
+            :meth:`~mne_lsl.stream.StreamLSL.acquire` to pull new samples.
         processing_flags : list of str | ``'all'`` | None
             Set the post-processing options. By default, post-processing is disabled.
             Any combination of the processing flags is valid. The available flags are:
@@ -108,6 +125,10 @@ class StreamLSL(BaseStream):
             :func:`~mne_lsl.lsl.resolve_streams`, the opening of the inlet with
             :meth:`~mne_lsl.lsl.StreamInlet.open_stream` and the estimation of the
             time correction with :meth:`~mne_lsl.lsl.StreamInlet.time_correction`.
+        scheduler : AcquisitionScheduler | None
+            If provided, the acquisition runs on the shared worker threads of the
+            :class:`~mne_lsl.stream.AcquisitionScheduler` instead of a dedicated background
+            thread. Ignored if the acquisition is manual.
 
         Returns
         -------
@@ -135,8 +156,42 @@ class StreamLSL(BaseStream):
     def _acquire(self) -> None:
         """Update function pulling new samples in the buffer at a regular interval."""
 
+    def _acquire_new_samples(self) -> None:
+        """Pull the new samples, process them and write them in the buffer."""
+
+    def _pull_chunk_on_arrival(
+        self, n_samples: int
+    ) -> tuple[ScalarArray, NDArray[np.float64]]:
+        """Pull a chunk of samples, waiting for at least one sample to be available.
+
+        Parameters
+        ----------
+        n_samples : int
+            Maximum number of samples to pull.
+
+        Returns
+        -------
+        data : array of shape (n_samples, n_channels)
+            The samples pulled, empty if no sample arrived before the timeout.
+        timestamps : array of shape (n_samples,)
+            The timestamps of the samples pulled.
+        """
+
     def _reset_variables(self) -> None:
         """Reset variables define after connection."""
+    _latency: Incomplete
+
+    def _update_latency(self, now: float, timestamp: float) -> None:
+        """Update the latency of the most recent sample written in the buffer.
+
+        Parameters
+        ----------
+        now : float
+            Time at which the sample was written in the buffer, in the local clock.
+        timestamp : float
+            Timestamp of the sample, in the clock of the source unless the
+            ``'clocksync'`` processing flag is set.
+        """
 
     @property
     def connected(self) -> bool:
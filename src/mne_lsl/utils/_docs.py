@@ -94,6 +94,12 @@ fname : path-like | Raw
 # -- Q ---------------------------------------------------------------------------------
 # -- R ---------------------------------------------------------------------------------
 # -- S ---------------------------------------------------------------------------------
+docdict["scheduler"] = """
+scheduler : AcquisitionScheduler | None
+    If provided, the acquisition runs on the shared worker threads of the
+    :class:`~mne_lsl.stream.AcquisitionScheduler` instead of a dedicated background
+    thread. Ignored if the acquisition is manual."""
+
 docdict["stream_bufsize"] = """
 bufsize : float | int
     Size of the buffer keeping track of the data received from the stream. If
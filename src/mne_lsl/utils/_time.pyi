@@ -1,6 +1,130 @@
+from _typeshed import Incomplete
+
+from ._checks import check_type as check_type
+from ._checks import check_value as check_value
+
+_SLEEP_METHODS: tuple[str, ...]
+
+class SleepStrategy:
+    """Strategy used to wait between 2 iterations of a background loop.
+
+    Parameters
+    ----------
+    method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'``
+        The waiting method:
+
+        * ``'sleep'``: sleep for the entire duration, which yields the CPU but wakes up
+          with the jitter of the OS scheduler.
+        * ``'hybrid'``: sleep, then busy-wait on :func:`time.perf_counter` during the
+          last ``spin`` seconds, which trades CPU usage for a precise wake-up.
+        * ``'deadline'``: as ``'hybrid'``, but the successive waits of a thread target
+          absolute deadlines spaced by the requested duration, thus the duration of the
+          work done between 2 waits does not accumulate as a drift of the loop period.
+    spin : float
+        Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+        ``'deadline'`` wait. ``0`` disables the busy-wait.
+    """
+
+    _method: Incomplete
+    _spin: Incomplete
+    _local: Incomplete
+
+    def __init__(self, method: str = "hybrid", spin: float = 0.0002) -> None: ...
+    def __call__(self, duration: float) -> float:
+        """Wait for ``duration`` seconds.
+
+        Parameters
+        ----------
+        duration : float
+            Duration to wait in seconds. With the method ``'deadline'``, the duration
+            is counted from the previous deadline of the calling thread, unless the
+            previous deadline was missed by more than ``duration``.
+
+        Returns
+        -------
+        lateness : float
+            Delay in seconds between the deadline and the wake-up.
+        """
+
+    def __repr__(self) -> str:
+        """Representation of the sleep strategy."""
+
+    def wait(self, deadline: float) -> float:
+        """Wait until an absolute deadline.
+
+        Parameters
+        ----------
+        deadline : float
+            Deadline on the clock :func:`time.perf_counter`.
+
+        Returns
+        -------
+        lateness : float
+            Delay in seconds between the deadline and the wake-up.
+        """
+
+    @property
+    def method(self) -> str:
+        """Waiting method.
+
+        :type: :class:`str`
+        """
+
+    @property
+    def spin(self) -> float:
+        """Duration of the busy-wait in seconds.
+
+        :type: :class:`float`
+        """
+
+_SLEEP_STRATEGY: SleepStrategy
+
+def get_sleep_strategy() -> SleepStrategy:
+    """Get the sleep strategy used by default by the background loops.
+
+    Returns
+    -------
+    strategy : SleepStrategy
+        The default sleep strategy.
+    """
+
+def set_sleep_strategy(method: str = "hybrid", spin: float = 0.0002) -> None:
+    """Set the sleep strategy used by default by the background loops.
+
+    The background loops of the streams and of the players wait between 2 iterations,
+    e.g. between 2 acquisitions of a :class:`~mne_lsl.stream.StreamLSL`. The strategy
+    sets the trade-off between CPU usage and precision of the wake-up.
+
+    Parameters
+    ----------
+    method : ``'hybrid'`` | ``'sleep'`` | ``'deadline'``
+        The waiting method:
+
+        * ``'sleep'``: sleep for the entire duration, which yields the CPU but wakes up
+          with the jitter of the OS scheduler.
+        * ``'hybrid'``: sleep, then busy-wait during the last ``spin`` seconds, which
+          trades CPU usage for a precise wake-up.
+        * ``'deadline'``: as ``'hybrid'``, but the successive waits of a loop target
+          absolute deadlines spaced by the loop period, thus the duration of an
+          iteration does not accumulate as a drift of the loop period.
+    spin : float
+        Duration in seconds of the busy-wait at the end of a ``'hybrid'`` or
+        ``'deadline'`` wait. ``0`` disables the busy-wait.
+
+    Notes
+    -----
+    The strategy can be set for a single stream with
+    :meth:`mne_lsl.stream.StreamLSL.set_sleep_strategy`. When the statistics of the
+    acquisition of a stream are enabled with
+    :meth:`mne_lsl.stream.StreamLSL.enable_stats`, the wake-up jitter is reported in
+    :attr:`mne_lsl.stream.StreamLSL.stats`.
+    """
+
 def high_precision_sleep(duration: float) -> None:
     """High precision sleep function.
 
+    The sleep uses the default sleep strategy, without absolute deadlines.
+
     duration : float
         Duration to sleep in seconds.
     """
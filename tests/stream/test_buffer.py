@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream._buffer import (
+    check_out_array,
+    read_ring_buffer,
+    read_ring_buffer_windows,
+    write_ring_buffer,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+@pytest.mark.parametrize("n_samples", [1, 3, 7, 10])
+def test_ring_buffer(n_samples: int) -> None:
+    """Test writing and reading from a circular buffer."""
+    buffer = np.zeros((10, 2))
+    data = np.arange(100).reshape(-1, 2)
+    n_acquired = 0
+    for start in range(0, data.shape[0], n_samples):
+        chunk = data[start : start + n_samples]
+        write_ring_buffer(buffer, chunk, n_acquired)
+        n_acquired += chunk.shape[0]
+        # the buffer content matches the latest samples written
+        expected = data[max(n_acquired - 10, 0) : n_acquired]
+        assert_array_equal(
+            read_ring_buffer(buffer, n_acquired, expected.shape[0]), expected
+        )
+        assert_array_equal(
+            read_ring_buffer(buffer, n_acquired, expected.shape[0], np.array([1])),
+            expected[:, [1]],
+        )
+    # reading more samples than the buffer size returns the entire buffer
+    assert_array_equal(read_ring_buffer(buffer, n_acquired, 100), data[-10:])
+    assert read_ring_buffer(buffer, n_acquired, 0).shape == (0, 2)
+    # reading past samples
+    assert_array_equal(read_ring_buffer(buffer, n_acquired - 2, 5), data[-7:-2])
+
+
+@pytest.mark.parametrize("picks", [None, np.array([0]), np.arange(3), np.array([2, 0])])
+def test_ring_buffer_copy(picks: NDArray[np.int64] | None) -> None:
+    """Test that the samples read are not a view on the circular buffer."""
+    buffer = np.zeros((10, 3))
+    write_ring_buffer(buffer, np.ones((4, 3)), 0)
+    data = read_ring_buffer(buffer, 4, 4, picks)
+    assert not np.shares_memory(data, buffer)
+    write_ring_buffer(buffer, np.full((10, 3), 9), 4)
+    n_picks = 3 if picks is None else picks.size
+    assert_array_equal(data, np.ones((4, n_picks)))
+
+
+@pytest.mark.parametrize(
+    "picks", [None, np.array([2]), np.array([1, 2, 3]), np.array([4, 0, 1, 3])]
+)
+def test_ring_buffer_out(picks: NDArray[np.int64] | None) -> None:
+    """Test reading from a circular buffer in a pre-allocated array."""
+    buffer = np.zeros((10, 5))
+    data = np.arange(60).reshape(-1, 5)
+    write_ring_buffer(buffer, data[:7], 0)
+    write_ring_buffer(buffer, data[7:], 7)  # wraps around the buffer end
+    n_picks = 5 if picks is None else picks.size
+    for n_samples in (3, 10):
+        expected = read_ring_buffer(buffer, 12, n_samples, picks)
+        out = np.empty((n_picks, n_samples))  # layout (n_channels, n_samples)
+        data_out = read_ring_buffer(buffer, 12, n_samples, picks, out.T)
+        assert np.shares_memory(data_out, out)
+        assert_array_equal(out, expected.T)
+
+
+@pytest.mark.parametrize(
+    "picks", [None, np.array([2]), np.array([1, 2, 3]), np.array([4, 0, 1, 3])]
+)
+@pytest.mark.parametrize("stops", [[12], [5, 12], [3, 4, 8, 10, 12]])
+def test_ring_buffer_windows(picks: NDArray[np.int64] | None, stops: list[int]) -> None:
+    """Test reading several windows from a circular buffer."""
+    buffer = np.zeros((10, 5))
+    data = np.arange(60).reshape(-1, 5)
+    write_ring_buffer(buffer, data[:7], 0)
+    write_ring_buffer(buffer, data[7:], 7)  # wraps around the buffer end
+    stops = np.array(stops)
+    windows = read_ring_buffer_windows(buffer, stops, 3, picks)
+    n_picks = 5 if picks is None else picks.size
+    assert windows.shape == (stops.size, 3, n_picks)
+    assert not np.shares_memory(windows, buffer)
+    for window, stop in zip(windows, stops, strict=True):
+        assert_array_equal(window, read_ring_buffer(buffer, stop, 3, picks))
+
+
+def test_check_out_array() -> None:
+    """Test validation of pre-allocated arrays."""
+    check_out_array(np.empty((2, 3)), (2, 3), np.float64, "out")
+    with pytest.raises(TypeError, match="must be an instance of"):
+        check_out_array([1, 2, 3], (3,), np.float64, "out")
+    with pytest.raises(ValueError, match="must be an array of shape"):
+        check_out_array(np.empty((3, 2)), (2, 3), np.float64, "out")
+    with pytest.raises(ValueError, match="must be an array of dtype"):
+        check_out_array(np.empty((2, 3), dtype=np.float32), (2, 3), np.float64, "out")
+    out = np.empty((2, 3))
+    out.flags.writeable = False
+    with pytest.raises(ValueError, match="must be a writeable array"):
+        check_out_array(out, (2, 3), np.float64, "out")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import multiprocessing as mp
+import threading
 import time
 import uuid
 from typing import TYPE_CHECKING
@@ -14,17 +16,14 @@ from numpy.testing import assert_allclose, assert_array_equal
 
 from mne_lsl.datasets import testing
 from mne_lsl.lsl import StreamInfo, StreamOutlet
-from mne_lsl.stream import EpochsStream, StreamLSL
+from mne_lsl.stream import AcquisitionScheduler, EpochsStream, StreamLSL
 from mne_lsl.stream.epochs import (
     _check_baseline,
     _check_reject_flat,
     _check_reject_tmin_tmax,
     _ensure_detrend_str,
     _ensure_event_id,
-    _find_events_in_stim_channels,
     _process_data,
-    _prune_events,
-    _remove_empty_elements,
 )
 
 if TYPE_CHECKING:
@@ -147,106 +146,6 @@ def test_ensure_detrend_str() -> None:
         _ensure_detrend_str(5.5)
 
 
-@pytest.fixture
-def stim_channels_events() -> NDArray[np.int64]:
-    """An event array that will be added to a set of stimulation channels."""
-    return np.array(
-        [
-            [5, 0, 3],
-            [10, 0, 1],
-            [25, 0, 1],
-            [30, 0, 2],
-            [50, 0, 1],
-            [70, 0, 1],
-            [85, 0, 2],
-        ],
-        dtype=np.int64,
-    )
-
-
-@pytest.fixture
-def stim_channels(stim_channels_events: NDArray[np.int64]) -> NDArray[np.float64]:
-    """A set of stimulation channels of shape (n_channels, n_samples)."""
-    channels = np.zeros((2, 100))
-    for k, ev in enumerate(stim_channels_events):
-        idx = 0 if k not in (0, 2) else 1
-        channels[idx, ev[0] : ev[0] + 10] = ev[2]
-    return channels
-
-
-def test_find_events_in_stim_channels(
-    stim_channels_events: NDArray[np.int64],
-    stim_channels: NDArray[np.float64],
-) -> None:
-    """Test finding events in stimulation channels."""
-    events = _find_events_in_stim_channels(stim_channels, ["a", "b"], 100)
-    assert_allclose(events, stim_channels_events)
-    events = _find_events_in_stim_channels(
-        stim_channels, ["a", "b"], 100, min_duration=0.2
-    )
-    assert events.size == 0
-    with pytest.warns(RuntimeWarning, match="You have .* events shorter"):
-        events = _find_events_in_stim_channels(
-            stim_channels, ["a", "b"], 100, shortest_event=25
-        )
-
-
-@pytest.fixture
-def events() -> NDArray[np.int64]:
-    """Return a simple event array.
-
-    An event is present every 10 samples, cycling between the values (1, 2, 3).
-    """
-    n_events = 10
-    events = np.zeros((n_events, 3), dtype=np.int64)
-    for k in range(events.shape[0]):
-        events[k, :] = [10 * (k + 1), 0, k % 3 + 1]
-    return events
-
-
-def test_prune_events(events: NDArray[np.int64]) -> None:
-    """Test pruning events."""
-    ts = np.arange(10000, 11000, 1.8)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, 0)
-    assert_allclose(events_, events)
-    # test pruning events outside of the event_id dictionary
-    events_ = _prune_events(events, dict(a=1, c=3), 10, ts, None, None, 0)
-    assert sorted(np.unique(events_[:, 2])) == [1, 3]
-    # test pruning events that can't fit in the buffer
-    ts = np.arange(5)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, 0)
-    assert events_.size == 0
-    ts = np.arange(10000, 11000, 1.8)  # ts.size == 556
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 500, ts, None, None, 0)
-    assert events_[-1, 0] + 500 <= ts.size
-    assert events_[-1, 0] == 50  # events @ 60, 70, 80, ... should be dropped
-    # test fitting in the buffer with tmin
-    ts = np.arange(15)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -7)
-    assert events_.shape[0] == 1
-    assert events_[0, 0] == 10  # event @ 10 should be kept
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -12)
-    assert events_.shape[0] == 0
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -16)
-    assert events_.shape[0] == 1
-    assert events_[0, 0] == 20  # event @ 20 should be kept
-    # test pruning events that have already been moved to the buffer
-    ts = np.arange(10000, 11000, 1.8)  # ts.size == 556
-    events_ = _prune_events(
-        events, dict(a=1, b=2, c=3), 10, ts, ts[events[3, 0]], None, 0
-    )
-    assert_allclose(events_, events[4:, :])
-    # test pruning events from an event stream, which converts the index to index in ts
-    ts = np.arange(1000)
-    ts_events = np.arange(500) * 2 + 0.5  # mock a different sampling frequency
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, ts_events, 0)
-    assert_allclose(events_[:, 2], events[:, 2])
-    # with the half sampling rate + 0.5 set above, we should be selecting:
-    # from: 10, 20, 30, 40, ... corresponding to 20.5, 40.5, 60.5, ...
-    # to: 21, 41, 61, ... corresponding to 20, 40, 60, ...
-    assert_allclose(events_[:, 0], np.arange(20, 20 * (events_[:, 0].size + 1), 20) + 1)
-
-
 @pytest.fixture
 def raw_with_stim_channel() -> BaseRaw:
     """Create a raw object with a stimulation channel.
@@ -360,6 +259,7 @@ def test_epochs_without_event_stream_tmin_tmax(mock_lsl_stream: DummyPlayer) ->
     epochs = EpochsStream(
         stream, 10, event_channels="trg", event_id=dict(a=1), tmin=-0.05, tmax=0.15
     ).connect(acquisition_delay=0.1)
+    epochs.set_sleep_strategy("deadline")
     while epochs.n_new_epochs == 0:
         time.sleep(0.1)
     n = epochs.n_new_epochs
@@ -382,6 +282,179 @@ def test_epochs_without_event_stream_tmin_tmax(mock_lsl_stream: DummyPlayer) ->
     stream.disconnect()
 
 
+def test_epochs_callback(mock_lsl_stream: DummyPlayer) -> None:
+    """Test the callbacks called on the new epochs."""
+    stream = StreamLSL(
+        2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0.1)
+    epochs = EpochsStream(
+        stream,
+        10,
+        event_channels="trg",
+        event_id=dict(a=1),
+        tmin=0,
+        tmax=0.05,
+        baseline=None,
+    )
+    with pytest.raises(RuntimeError, match="EpochsStream is not connected"):
+        epochs.add_callback(lambda data, events, timestamps: None)
+    epochs.connect(acquisition_delay=None)  # manual acquisition
+    with pytest.raises(TypeError, match="must be an instance of"):
+        epochs.add_callback(101)
+    received = list()
+
+    def callback(
+        data: NDArray[np.float64],
+        events: NDArray[np.int64],
+        timestamps: NDArray[np.float64],
+    ) -> None:
+        received.append((data.copy(), events.copy(), timestamps.copy()))
+
+    epochs.add_callback(callback)
+    assert epochs.callbacks == [callback]
+    start = time.time()
+    while len(received) == 0 and time.time() - start < 10:
+        time.sleep(0.05)
+        epochs.acquire()
+    assert len(received) != 0
+    data, events, timestamps = received[0]
+    assert data.shape[1:] == (len(epochs.info["ch_names"]), epochs.times.size)
+    assert data.shape[0] == events.size == timestamps.size
+    assert_array_equal(events, 1)
+    assert_allclose(data[:, 1:-1, :], np.ones(data[:, 1:-1, :].shape) * 101)
+    _, stream_ts = stream.get_data()
+    assert np.all(timestamps <= stream_ts[-1])
+    # the callback receives the same epochs as the buffer
+    assert_allclose(epochs.get_data(n_epochs=data.shape[0]), data)
+    assert_array_equal(epochs.events[-events.size :], events)
+    epochs.disconnect()
+    assert not epochs.connected
+    epochs.connect(acquisition_delay=0.1)
+    assert epochs.callbacks == []
+    epochs.disconnect()
+    stream.disconnect()
+
+
+def test_epochs_buffer_wrap(mock_lsl_stream: DummyPlayer) -> None:
+    """Test that the epochs are retrieved in order once the buffer is full."""
+    stream = StreamLSL(
+        0.5, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0.1)
+    epochs = EpochsStream(
+        stream,
+        3,
+        event_channels="trg",
+        event_id=dict(a=1),
+        tmin=0,
+        tmax=0.05,
+        baseline=None,
+    ).connect(acquisition_delay=None)  # manual acquisition
+    received = list()
+    epochs.add_callback(lambda data, events, ts: received.append(data.copy()))
+    start = time.time()
+    while sum(data.shape[0] for data in received) < 5 and time.time() - start < 10:
+        time.sleep(0.05)
+        epochs.acquire()
+    expected = np.concatenate(received)[-3:]
+    assert 5 <= epochs.n_new_epochs
+    assert_allclose(epochs.get_data(), expected)
+    assert epochs.n_new_epochs == 0
+    assert_allclose(epochs.get_data(n_epochs=2), expected[1:])
+    out = np.empty_like(expected, dtype=stream.dtype)
+    assert epochs.get_data(out=out) is out
+    assert_allclose(out, expected)
+    assert_array_equal(epochs.events, 1)
+    epochs.disconnect()
+    stream.disconnect()
+
+
+def test_epochs_aiter(mock_lsl_stream: DummyPlayer) -> None:
+    """Test the asynchronous iteration over the new epochs."""
+    stream = StreamLSL(
+        2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0.1)
+    epochs = EpochsStream(
+        stream,
+        10,
+        event_channels="trg",
+        event_id=dict(a=1),
+        tmin=0,
+        tmax=0.05,
+        baseline=None,
+    )
+    with pytest.raises(RuntimeError, match="EpochsStream is not connected"):
+        asyncio.run(anext(epochs.aiter()))
+    epochs.connect(acquisition_delay=0.1)
+
+    async def consume() -> NDArray:
+        async for data in epochs.aiter():
+            return data
+
+    data = asyncio.run(asyncio.wait_for(consume(), timeout=10))
+    assert data.shape[1:] == (len(epochs.info["ch_names"]), epochs.times.size)
+    assert 1 <= data.shape[0]
+    assert_allclose(data[-1, 1:-1, :], np.ones(data[-1, 1:-1, :].shape) * 101)
+
+    # the iteration stops on disconnection
+    async def consume_until_disconnection() -> int:
+        n_epochs = 0
+        async for data in epochs.aiter():
+            n_epochs += data.shape[0]
+        return n_epochs
+
+    timer = threading.Timer(1.5, epochs.disconnect)
+    timer.start()
+    asyncio.run(asyncio.wait_for(consume_until_disconnection(), timeout=10))
+    timer.join()
+    assert not epochs.connected
+    stream.disconnect()
+
+
+def test_epochs_scheduler(mock_lsl_stream: DummyPlayer) -> None:
+    """Test the acquisition of streams and epochs on a shared scheduler."""
+    scheduler = AcquisitionScheduler(n_workers=2)
+    streams = [
+        StreamLSL(
+            0.5, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+        ).connect(acquisition_delay=0.01, scheduler=scheduler)
+        for _ in range(3)
+    ]
+    epochs = EpochsStream(
+        streams[0],
+        10,
+        event_channels="trg",
+        event_id=dict(a=1),
+        tmin=0,
+        tmax=0.05,
+        baseline=None,
+    ).connect(acquisition_delay=0.1, scheduler=scheduler)
+    while epochs.n_new_epochs == 0:
+        time.sleep(0.1)
+    data = epochs.get_data()
+    assert_allclose(data[-1, 1:-1, :], np.ones(data[-1, 1:-1, :].shape) * 101)
+    # the acquisition is paused and resumed on the scheduler
+    streams[1].filter(1, 40, picks="eeg")
+    for stream in streams:
+        stream.get_data()
+    time.sleep(0.2)
+    for stream in streams:
+        assert 0 < stream.n_new_samples
+    workers = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("mne_lsl-worker")
+    ]
+    assert len(workers) <= 2
+    epochs.disconnect()
+    for stream in streams:
+        stream.disconnect()
+    scheduler.shutdown()
+    with pytest.raises(TypeError, match="must be an instance of"):
+        StreamLSL(
+            0.5, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+        ).connect(scheduler=2)
+
+
 def test_epochs_without_event_stream_manual_acquisition(
     mock_lsl_stream: DummyPlayer,
 ) -> None:
@@ -426,6 +499,43 @@ def test_epochs_without_event_stream_manual_acquisition(
     stream.disconnect()
 
 
+def test_epochs_get_data_out(mock_lsl_stream: DummyPlayer) -> None:
+    """Test retrieving epochs in a pre-allocated array."""
+    stream = StreamLSL(
+        0.5, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0.1)
+    epochs = EpochsStream(
+        stream,
+        10,
+        event_channels="trg",
+        event_id=dict(a=1),
+        tmin=-0.05,
+        tmax=0.15,
+        baseline=None,
+    ).connect(acquisition_delay=None)
+    while epochs.n_new_epochs == 0:
+        epochs.acquire()
+        time.sleep(0.1)
+    for picks in (None, [1, 2, 3], [3, 0, 2]):
+        data = epochs.get_data(n_epochs=3, picks=picks)
+        out = np.empty_like(data)
+        data_out = epochs.get_data(n_epochs=3, picks=picks, out=out)
+        assert data_out is out
+        assert_array_equal(out, data)
+    # compare with the known content of the epochs, from non-contiguous channels
+    out = np.empty((1, 2, epochs.times.size), dtype=stream.dtype)
+    epochs.get_data(n_epochs=1, picks=[2, 0], out=out)
+    assert_allclose(out[0, 0, :50], np.zeros(50))
+    assert_allclose(out[0, 0, 50:150], np.full(100, 101))
+    assert_allclose(out[0, 0, 150:], np.zeros(50))
+    assert_allclose(np.diff(out[0, 1, :]), 1)  # index of the sample in the raw
+    assert out[0, 1, 50] in (100, 500, 700)  # index of the event in the raw
+    with pytest.raises(ValueError, match="must be an array of shape"):
+        epochs.get_data(n_epochs=2, out=out)
+    epochs.disconnect()
+    stream.disconnect()
+
+
 @pytest.fixture
 def data_ones() -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """Data array used for baseline correction test."""
@@ -438,7 +548,7 @@ def test_process_data_no_baseline(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ) -> None:
     """Test processing data without baseline correction."""
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0],
         baseline=None,
         reject=None,
@@ -456,7 +566,7 @@ def test_process_data_baseline_all_segment(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ) -> None:
     """Test processing data with baseline correction on the entire segment."""
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0].copy(),
         baseline=(None, None),
         reject=None,
@@ -475,7 +585,7 @@ def test_process_data_baseline_start_segment(
 ) -> None:
     """Test processing data with baseline correction on the start segment."""
     data_ones[0][:, 10:, :] = 101
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0].copy(),
         baseline=(None, 10),
         reject=None,
@@ -495,7 +605,7 @@ def test_process_data_baseline_end_segment(
 ) -> None:
     """Test processing data with baseline correction on the end segment."""
     data_ones[0][:, :90, :] = 101
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0].copy(),
         baseline=(90, None),
         reject=None,
@@ -514,7 +624,7 @@ def test_process_data_detrend_constant(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ) -> None:
     """Test constant (DC) detrending."""
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0],
         baseline=None,
         reject=None,
@@ -527,7 +637,7 @@ def test_process_data_detrend_constant(
     )
     assert_allclose(data, data_ones[0])
 
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0],
         baseline=None,
         reject=None,
@@ -558,7 +668,7 @@ def test_process_data_detrend_linear(
     data_detrend_linear: tuple[NDArray[np.float64], NDArray[np.float64]],
 ) -> None:
     """Test linear detrending."""
-    data = _process_data(
+    data, _ = _process_data(
         data_detrend_linear[0],
         baseline=None,
         reject=None,
@@ -571,7 +681,7 @@ def test_process_data_detrend_linear(
     )
     assert_allclose(data, data_detrend_linear[0])
 
-    data = _process_data(
+    data, _ = _process_data(
         data_detrend_linear[0],
         baseline=None,
         reject=None,
@@ -589,7 +699,7 @@ def test_process_data_flat(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ) -> None:
     """Test rejection of epochs due to flatness."""
-    data = _process_data(
+    data, _ = _process_data(
         data_ones[0],
         baseline=None,
         reject=None,
@@ -618,7 +728,7 @@ def test_process_data_reject(
 ) -> None:
     """Test rejection of epochs due to PTP."""
     assert data_reject[0].shape[0] == 2
-    data = _process_data(
+    data, sel = _process_data(
         data_reject[0].copy(),
         baseline=None,
         reject=dict(eeg=50),
@@ -630,8 +740,9 @@ def test_process_data_reject(
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 1
+    assert_array_equal(sel, [0])  # the second epoch exceeds the PTP threshold
 
-    data = _process_data(
+    data, _ = _process_data(
         data_reject[0].copy(),
         baseline=None,
         reject=dict(eeg=500),
@@ -644,7 +755,7 @@ def test_process_data_reject(
     )
     assert data.shape[0] == 2
 
-    data = _process_data(
+    data, _ = _process_data(
         data_reject[0].copy(),
         baseline=None,
         reject=dict(eeg=1e-3),
@@ -673,7 +784,7 @@ def test_process_data_reject_tmin_tmax(
 ) -> None:
     """Test rejection of epochs due to PTP during segment."""
     assert data_reject_tmin_tmax[0].shape[0] == 2
-    data = _process_data(
+    data, _ = _process_data(
         data_reject_tmin_tmax[0].copy(),
         baseline=None,
         reject=dict(eeg=50),
@@ -687,7 +798,7 @@ def test_process_data_reject_tmin_tmax(
     assert data.shape[0] == 2
 
     assert data_reject_tmin_tmax[0].shape[0] == 2
-    data = _process_data(
+    data, _ = _process_data(
         data_reject_tmin_tmax[0].copy(),
         baseline=None,
         reject=dict(eeg=50),
@@ -796,23 +907,6 @@ def test_ensure_event_id_with_event_stream(
     event_stream.disconnect()
 
 
-def test_remove_empty_elements() -> None:
-    """Test _remove_empty_elements."""
-    data = np.ones(10).reshape(1, -1)
-    ts = np.zeros(10)
-    ts[5:] = np.arange(5)
-    data, ts = _remove_empty_elements(data, ts)
-    assert data.size == ts.size
-    assert ts.size == 4
-
-    data = np.ones(20).reshape(2, -1)
-    ts = np.zeros(10)
-    ts[5:] = np.arange(5)
-    data, ts = _remove_empty_elements(data, ts)
-    assert data.shape[1] == ts.size
-    assert ts.size == 4
-
-
 @pytest.fixture
 def raw_with_annotations_and_first_samp() -> BaseRaw:
     """Raw with annotations and first_samp set."""
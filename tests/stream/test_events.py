@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from mne.event import _find_events, _find_unique_events
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream._events import EventQueue, StimChannelDetector
+
+
+@pytest.fixture
+def stim_channels() -> np.ndarray:
+    """A set of stimulation channels of shape (n_channels, n_samples)."""
+    rng = np.random.default_rng(101)
+    channels = np.zeros((2, 1000))
+    for k, onset in enumerate(range(10, 990, 20)):
+        channels[k % 2, onset : onset + rng.integers(2, 15)] = rng.integers(1, 4)
+    channels[0, 500:505] = 1  # steps to a higher value
+    channels[0, 505:510] = 3
+    return channels
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+def test_stim_channel_detector(stim_channels: np.ndarray, chunk_size: int) -> None:
+    """Test that the incremental detection matches the detection on all samples."""
+    expected = np.concatenate(
+        [_find_events(ch[np.newaxis, :], first_samp=0) for ch in stim_channels]
+    )
+    expected = _find_unique_events(expected)
+    expected = expected[np.argsort(expected[:, 0], kind="stable")]
+    detector = StimChannelDetector(["a", "b"])
+    events = [
+        detector.detect(stim_channels[:, start : start + chunk_size], start)
+        for start in range(0, stim_channels.shape[1], chunk_size)
+    ]
+    events = np.concatenate(events)
+    assert_array_equal(events, expected)
+    assert events.dtype == np.int64
+    # no new samples
+    assert detector.detect(stim_channels[:, :0], 1000).shape == (0, 3)
+
+
+def test_stim_channel_detector_initial_value() -> None:
+    """Test that a non-zero initial value is not an onset."""
+    detector = StimChannelDetector(["a"])
+    assert detector.detect(np.ones((1, 5)), 0).shape == (0, 3)
+    # the last value is kept between calls, thus the event continues
+    assert detector.detect(np.ones((1, 5)), 5).shape == (0, 3)
+    events = detector.detect(np.array([[1, 2, 2, 0, 0]]), 10)
+    assert_array_equal(events, [[11, 1, 2]])
+    events = detector.detect(np.array([[2, 2]]), 15)  # onset on the first sample
+    assert_array_equal(events, [[15, 0, 2]])
+
+
+def test_stim_channel_detector_short_events() -> None:
+    """Test the warning on spurious short events."""
+    detector = StimChannelDetector(["a"], shortest_event=3)
+    with pytest.warns(RuntimeWarning, match="You have 1 events shorter"):
+        detector.detect(np.array([[0, 1, 0, 2, 0]]), 0)
+    # the interval with the last onset of the previous call is checked
+    with pytest.warns(RuntimeWarning, match="You have 1 events shorter"):
+        detector.detect(np.array([[1, 0]]), 5)
+
+
+def test_event_queue() -> None:
+    """Test the queue of events waiting for their epoch to be acquired."""
+    queue = EventQueue(n_samples=10, tmin_shift=0)
+    assert len(queue) == 0
+    queue.put(np.array([[30, 0, 2], [10, 0, 1]]))
+    assert len(queue) == 2
+    events, stops = queue.pop(25)  # the epoch of the second event is not acquired
+    assert_array_equal(events, [[10, 0, 1]])
+    assert_array_equal(stops, [20])
+    events, stops = queue.pop(39)
+    assert events.shape == (0, 3)
+    events, stops = queue.pop(40)  # the epoch is complete on its last sample
+    assert_array_equal(events, [[30, 0, 2]])
+    assert_array_equal(stops, [40])
+    assert len(queue) == 0
+
+
+def test_event_queue_tmin() -> None:
+    """Test the events which epoch starts before the event."""
+    queue = EventQueue(n_samples=10, tmin_shift=-7)
+    queue.put(np.array([[5, 0, 1], [10, 0, 1]]))
+    events, stops = queue.pop(100)
+    # the epoch of the first event starts before the first sample of the stream
+    assert_array_equal(events, [[10, 0, 1]])
+    assert_array_equal(stops, [13])
+
+
+def test_event_queue_timestamps() -> None:
+    """Test positioning events received by timestamp on the samples of the stream."""
+    queue = EventQueue(n_samples=10, tmin_shift=0)
+    queue.put_timestamps(np.array([3.5, 20.5, 40.5, 100.5]), np.array([1, 2, 3, 4]))
+    assert len(queue) == queue.n_unlocated == 4
+    # stream samples 10 to 59 with a timestamp equal to their position
+    ts = np.arange(10, 60, dtype=np.float64)
+    queue.locate(ts, 10)
+    # the event older than the stream is dropped and the event after the last sample
+    # waits for new samples
+    assert queue.n_unlocated == 1
+    events, stops = queue.pop(60)
+    assert_array_equal(events, [[21, 0, 2], [41, 0, 3]])
+    assert_array_equal(stops, [31, 51])
+    queue.locate(np.arange(60, 110, dtype=np.float64), 60)
+    assert queue.n_unlocated == 0
+    events, _ = queue.pop(120)
+    assert_array_equal(events, [[101, 0, 4]])
+    queue.locate(ts, 10)  # no-op without events to position
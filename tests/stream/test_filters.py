@@ -7,8 +7,20 @@ import numpy as np
 import pytest
 from mne.filter import create_filter as create_filter_mne
 from numpy.testing import assert_allclose
+from scipy.signal import convolve, sosfilt
 
-from mne_lsl.stream._filters import StreamFilter, create_filter, ensure_sos_iir_params
+from mne_lsl.stream import _filters
+from mne_lsl.stream._filters import (
+    Decimator,
+    FilterChain,
+    StreamFilter,
+    clear_filter_cache,
+    combine_filters,
+    compile_filters,
+    create_filter,
+    create_fir_filter,
+    ensure_sos_iir_params,
+)
 
 if TYPE_CHECKING:
     from typing import Any
@@ -145,6 +157,40 @@ def test_create_filter(
     assert_allclose(filter1["sos"], filter2["sos"])
 
 
+def test_create_filter_cache(
+    iir_params: dict[str, Any], sfreq: float, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the cache of filter designs."""
+    clear_filter_cache()
+    filter1 = create_filter(sfreq, 1, 40, deepcopy(iir_params))
+    filter2 = create_filter(sfreq, 1, 40, deepcopy(iir_params))
+    assert filter1 is not filter2
+    assert_allclose(filter1["sos"], filter2["sos"])
+    assert_allclose(filter1["zi_unit"], filter2["zi_unit"])
+    # filters created from a cached design are independent
+    assert not np.shares_memory(filter1["sos"], filter2["sos"])
+    filter1["zi"] = filter1["zi_unit"]
+    assert filter2["zi"] is None
+    assert len(_filters._FILTER_CACHE) == 1
+    design = next(iter(_filters._FILTER_CACHE.values()))
+    # different parameters
+    create_filter(sfreq, 1, 40, dict(order=2, ftype="butter", output="sos"))
+    create_filter(sfreq, 1, 30, deepcopy(iir_params))
+    assert len(_filters._FILTER_CACHE) == 3
+    # least recently used design is evicted first
+    monkeypatch.setattr(_filters, "_FILTER_CACHE_MAXSIZE", 3)
+    create_filter(sfreq, 1, 40, deepcopy(iir_params))
+    create_filter(sfreq, 1, 20, deepcopy(iir_params))
+    assert len(_filters._FILTER_CACHE) == 3
+    h_freqs = [key[1][2][1] for key in _filters._FILTER_CACHE]
+    assert h_freqs == [30, 40, 20]
+    assert any(elt is design for elt in _filters._FILTER_CACHE.values())
+    # unhashable parameters are not cached
+    clear_filter_cache()
+    create_filter(sfreq, 1, 40, dict(iir_params, unused=object()))
+    assert len(_filters._FILTER_CACHE) == 0
+
+
 def test_ensure_sos_iir_params() -> None:
     """Test validation of IIR params."""
     assert isinstance(ensure_sos_iir_params(None), dict)
@@ -163,3 +209,205 @@ def test_ensure_sos_iir_params() -> None:
             dict(order=8, ftype="bessel", a=[1, 2], b=[1, 2])
         )
     assert iir_params == iir_params5
+
+
+@pytest.fixture
+def overlapping_filters(iir_params: dict[str, Any], sfreq: float) -> list[StreamFilter]:
+    """Create a list of filters applied on overlapping channels."""
+    freqs = ((1, 40), (None, 100), (52, 48))
+    picks = (np.arange(0, 6), np.arange(3, 9), np.array([8, 0]))
+    filters = list()
+    for (lfq, hfq), picks_ in zip(freqs, picks, strict=True):
+        filt = create_filter(
+            sfreq=sfreq, l_freq=lfq, h_freq=hfq, iir_params=deepcopy(iir_params)
+        )
+        filt.update(picks=picks_)
+        filters.append(StreamFilter(filt))
+    return filters
+
+
+def test_compile_filters(overlapping_filters: list[StreamFilter]) -> None:
+    """Test grouping of channels by identical filter cascade."""
+    chains = compile_filters(overlapping_filters)
+    assert all(isinstance(chain, FilterChain) for chain in chains)
+    groups = {
+        tuple(chain.picks): [
+            next(k for k, f in enumerate(overlapping_filters) if f is filt)
+            for filt in chain.filters
+        ]
+        for chain in chains
+    }
+    assert groups == {
+        (0,): [0, 2],
+        (1, 2): [0],
+        (3, 4, 5): [0, 1],
+        (6, 7): [1],
+        (8,): [1, 2],
+    }
+    assert compile_filters([]) == []
+
+
+def test_filter_chain(overlapping_filters: list[StreamFilter]) -> None:
+    """Test that fused cascades match filters applied sequentially."""
+    rng = np.random.default_rng(0)
+    for filt in overlapping_filters:
+        filt["zi"] = rng.standard_normal(
+            filt["zi_unit"].shape[:-1] + (filt["picks"].size,)
+        )
+    filters = deepcopy(overlapping_filters)
+    chains = compile_filters(overlapping_filters)
+    data = rng.standard_normal((2, 100, 10))
+    data_fused = data.copy()
+    for chunk, chunk_fused in zip(data, data_fused, strict=True):
+        for filt in filters:
+            chunk[:, filt["picks"]], filt["zi"] = sosfilt(
+                filt["sos"], chunk[:, filt["picks"]], zi=filt["zi"], axis=0
+            )
+        for chain in chains:
+            chain(chunk_fused)
+    assert_allclose(data_fused, data)
+    for chain in chains:
+        chain.store_initial_conditions()
+    for filt, filt_fused in zip(filters, overlapping_filters, strict=True):
+        assert_allclose(filt_fused["zi"], filt["zi"])
+
+
+def test_filter_chain_initial_conditions(
+    iir_params: dict[str, Any], sfreq: float
+) -> None:
+    """Test the step response steady-state propagated through the cascade."""
+    filters = list()
+    for lfq, hfq in ((None, 40), (1, None), (None, 100)):
+        filt = create_filter(
+            sfreq=sfreq, l_freq=lfq, h_freq=hfq, iir_params=deepcopy(iir_params)
+        )
+        filt.update(picks=np.arange(3))
+        filters.append(StreamFilter(filt))
+    # low-pass filters preserve the DC offset
+    data = np.full((100, 3), 5.0)
+    (chain,) = compile_filters([filters[0], filters[2]])
+    chain(data)
+    assert_allclose(data, 5.0)
+    # a high-pass filter removes the DC offset without transient, including for the
+    # filters applied after it
+    data = np.full((100, 3), 5.0)
+    (chain,) = compile_filters(filters)
+    chain(data)
+    assert_allclose(data, 0, atol=1e-8)
+    assert all(filt["zi"] is None for filt in filters)
+    chain.store_initial_conditions()
+    assert all(filt["zi"].shape[-1] == 3 for filt in filters)
+
+
+def test_combine_filters(iir_params: dict[str, Any], sfreq: float) -> None:
+    """Test combination of notch filters in a single filter."""
+    filters = [
+        create_filter(
+            sfreq=sfreq, l_freq=fq + 1, h_freq=fq - 1, iir_params=deepcopy(iir_params)
+        )
+        for fq in (50, 100, 150)
+    ]
+    filt = combine_filters(filters)
+    assert filt["l_freq"] == (51, 101, 151)
+    assert filt["h_freq"] == (49, 99, 149)
+    assert filt["zi"] is None
+    assert filt["sos"].shape[0] == sum(elt["sos"].shape[0] for elt in filters)
+    assert filt["zi_unit"].shape == (filt["sos"].shape[0], 2, 1)
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((1000, 2))
+    expected = data
+    for elt in filters:
+        expected = sosfilt(elt["sos"], expected, axis=0)
+    assert_allclose(sosfilt(filt["sos"], data, axis=0), expected)
+    filt = StreamFilter(filt)
+    assert "notch filter @ 50.0, 100.0, 150.0 Hz" in repr(filt)
+    assert filt == deepcopy(filt)
+
+
+def test_create_fir_filter(sfreq: float) -> None:
+    """Test create_fir_filter conformity with MNE."""
+    filt = create_fir_filter(sfreq=sfreq, l_freq=None, h_freq=40)
+    h = create_filter_mne(
+        data=None,
+        sfreq=sfreq,
+        l_freq=None,
+        h_freq=40,
+        method="fir",
+        phase="zero",
+        verbose="CRITICAL",
+    )
+    assert_allclose(filt["h"], h)
+    assert filt["zi_unit"].shape == (h.size - 1, 1)
+    assert filt["zi"] is None
+    filt.update(picks=np.arange(3))
+    filt = StreamFilter(filt)
+    assert repr(filt) == f"<FIR causal filter @ (None, 40) Hz ({h.size} taps)>"
+
+
+@pytest.mark.parametrize("n_times", [1, 50, 2000])
+def test_filter_chain_fir(
+    iir_params: dict[str, Any], sfreq: float, n_times: int
+) -> None:
+    """Test that cascades including FIR filters match filters applied sequentially."""
+    filters = [
+        create_filter(sfreq, 1, None, deepcopy(iir_params)),
+        create_fir_filter(sfreq, None, 40),
+        create_fir_filter(sfreq, None, 100),
+        create_filter(sfreq, None, 100, deepcopy(iir_params)),
+    ]
+    picks = (np.arange(0, 4), np.arange(2, 6), np.arange(6), np.array([5, 0]))
+    rng = np.random.default_rng(0)
+    for filt, picks_ in zip(filters, picks, strict=True):
+        filt["picks"] = picks_
+        filt["zi"] = rng.standard_normal(filt["zi_unit"].shape[:-1] + (picks_.size,))
+    filters = [StreamFilter(filt) for filt in filters]
+    filters_ref = deepcopy(filters)
+    chains = compile_filters(filters)
+    data = rng.standard_normal((3, n_times, 6))
+    data_fused = data.copy()
+    for chunk, chunk_fused in zip(data, data_fused, strict=True):
+        for filt in filters_ref:
+            x = chunk[:, filt["picks"]]
+            if "h" in filt:  # state are the last n_taps - 1 input samples
+                ext = np.vstack((filt["zi"], x))
+                x_filtered = convolve(ext, filt["h"][:, np.newaxis], mode="valid")
+                filt["zi"] = ext[ext.shape[0] - filt["h"].size + 1 :]
+            else:
+                x_filtered, filt["zi"] = sosfilt(filt["sos"], x, zi=filt["zi"], axis=0)
+            chunk[:, filt["picks"]] = x_filtered
+        for chain in chains:
+            chain(chunk_fused)
+    assert_allclose(data_fused, data, atol=1e-10)
+    for chain in chains:
+        chain.store_initial_conditions()
+    for filt, filt_fused in zip(filters_ref, filters, strict=True):
+        assert_allclose(filt_fused["zi"], filt["zi"], atol=1e-10)
+
+
+def test_filter_chain_fir_initial_conditions(sfreq: float) -> None:
+    """Test the steady-state initial conditions of FIR filters."""
+    filt = create_fir_filter(sfreq, None, 40)
+    filt.update(picks=np.arange(2))
+    (chain,) = compile_filters([StreamFilter(filt)])
+    data = np.full((100, 2), 5.0)
+    chain(data)
+    assert_allclose(data, 5.0 * np.sum(filt["h"]))
+
+
+@pytest.mark.parametrize("factor", [2, 5])
+def test_decimator(factor: int) -> None:
+    """Test that decimation by chunks matches decimation of the entire signal."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((1000, 3))
+    timestamps = np.arange(1000, dtype=np.float64)
+    decimator = Decimator(factor)
+    assert decimator.factor == factor
+    chunks = [decimator(data[:1], timestamps[:1])]  # initial conditions
+    for start, stop in ((1, 4), (4, 130), (130, 131), (131, 1000)):
+        chunks.append(decimator(data[start:stop], timestamps[start:stop]))
+    data_decimated = np.vstack([chunk[0] for chunk in chunks])
+    ts_decimated = np.hstack([chunk[1] for chunk in chunks])
+    assert_allclose(ts_decimated, timestamps[::factor])
+    zi = decimator._zi_unit * data[0]
+    expected = sosfilt(decimator._sos, data, zi=zi, axis=0)[0][::factor]
+    assert_allclose(data_decimated, expected)
@@ -14,7 +14,7 @@ from mne.utils import check_version
 from mne_lsl.datasets import testing
 from mne_lsl.lsl import StreamInfo, StreamOutlet
 from mne_lsl.stream import StreamLSL
-from mne_lsl.stream._hpi import CH_NAMES, check_hpi_ch_names
+from mne_lsl.stream._hpi import CH_NAMES, HeadPositions, check_hpi_ch_names
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -165,6 +165,9 @@ def test_stream_with_hpi(
         dtype=np.float32,
     )
     assert stream.info["dev_head_t"] == Transform("meg", "head", trans)
+    # the history of the head positions is queryable by time
+    assert stream.get_dev_head_t() == Transform("meg", "head", trans)
+    assert stream.get_dev_head_t(0) is None
 
     # clean-up
     stream.disconnect()
@@ -176,3 +179,47 @@ def test_check_hpi_ch_names() -> None:
     """Test the channel name validation."""
     with pytest.raises(RuntimeError, match="Expected HPI channel names"):
         check_hpi_ch_names(["foo"], "megin")
+
+
+def _rotation_z(angle: float, translation: tuple[float, float, float]) -> np.ndarray:
+    """Create a transformation rotating around the z-axis by 'angle' degrees."""
+    angle = np.deg2rad(angle)
+    trans = np.eye(4)
+    trans[:2, :2] = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    trans[:3, 3] = translation
+    return trans
+
+
+def test_head_positions() -> None:
+    """Test the history and the slot of the head positions."""
+    positions = HeadPositions(maxlen=4)
+    assert positions.latest is None
+    assert positions.get() is None
+    trans = np.array([_rotation_z(k, (0, 0, 0.01 * k)) for k in range(6)])
+    positions.add(np.arange(2.0), trans[:2])
+    assert positions.latest[0] == 1
+    assert positions.latest[1] == Transform("meg", "head", trans[1])
+    positions.add(np.arange(2.0, 6.0), trans[2:])
+    # the history retains the last 4 positions
+    assert positions.get() == Transform("meg", "head", trans[5])
+    assert positions.get(3.5) == Transform("meg", "head", trans[3])
+    assert positions.get(2) == Transform("meg", "head", trans[2])
+    assert positions.get(1.9) is None
+    assert positions.latest[0] == 5
+
+
+def test_head_positions_thresholds() -> None:
+    """Test the replacement of the slot with rate limiting and change thresholds."""
+    positions = HeadPositions(min_interval=1)
+    for k in range(5):
+        positions.add(np.array([k * 0.4]), _rotation_z(0, (0, 0, k))[np.newaxis])
+    assert positions.latest[0] == pytest.approx(1.2)  # updated at 0, then at 1.2
+    assert positions.get() == Transform("meg", "head", _rotation_z(0, (0, 0, 4)))
+    positions = HeadPositions(min_translation=0.005, min_rotation=2)
+    positions.add(np.array([0.0]), _rotation_z(0, (0, 0, 0))[np.newaxis])
+    positions.add(np.array([1.0]), _rotation_z(1, (0, 0, 0.001))[np.newaxis])
+    assert positions.latest[0] == 0  # below both thresholds
+    positions.add(np.array([2.0]), _rotation_z(3, (0, 0, 0.001))[np.newaxis])
+    assert positions.latest[0] == 2  # rotation above the threshold
+    positions.add(np.array([3.0]), _rotation_z(3, (0, 0, 0.01))[np.newaxis])
+    assert positions.latest[0] == 3  # translation above the threshold
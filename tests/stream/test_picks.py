@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from mne import create_info
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream._picks import PicksCache
+
+
+@pytest.fixture
+def info():
+    """Measurement info with channels of different types."""
+    return create_info(
+        ["Fz", "Cz", "Pz", "EOG", "TRIGGER"], 1000, ["eeg"] * 3 + ["eog", "stim"]
+    )
+
+
+def test_picks_cache(info) -> None:
+    """Test caching of the resolved channel selections."""
+    cache = PicksCache()
+    picks = cache.get(info, "eeg", "bads")
+    assert_array_equal(picks, [0, 1, 2])
+    assert not picks.flags.writeable
+    assert len(cache) == 1
+    assert cache.get(info, "eeg", "bads") is picks
+    # different arguments are cached separately
+    assert_array_equal(cache.get(info, ["eeg"], "bads"), [0, 1, 2])
+    assert_array_equal(cache.get(info, None, "bads", none="all"), np.arange(5))
+    assert_array_equal(cache.get(info, np.array([3, 0]), ()), [3, 0])
+    assert_array_equal(cache.get(info, ["Pz", "EOG"], ()), [2, 3])
+    assert_array_equal(cache.get(info, 4, ()), [4])
+    assert len(cache) == 6
+    # bad channels are part of the key
+    info["bads"] = ["Cz"]
+    assert_array_equal(cache.get(info, "eeg", "bads"), [0, 2])
+    assert_array_equal(cache.get(info, "eeg", ()), [0, 1, 2])
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_picks_cache_maxsize(info) -> None:
+    """Test that the cache is bounded."""
+    cache = PicksCache(maxsize=2)
+    for k in range(5):
+        assert_array_equal(cache.get(info, k, ()), [k])
+    assert len(cache) == 2
+
+
+def test_picks_cache_unhashable(info) -> None:
+    """Test that selections which can not be hashed are not cached."""
+    cache = PicksCache()
+    assert_array_equal(cache.get(info, slice(1, 3), ()), [1, 2])
+    assert len(cache) == 0
+
+
+def test_picks_cache_invalid(info) -> None:
+    """Test that invalid selections raise and are not cached."""
+    cache = PicksCache()
+    with pytest.raises(ValueError, match="could not be interpreted"):
+        cache.get(info, "101", ())
+    assert len(cache) == 0
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from mne_lsl.stream import AcquisitionScheduler
+
+
+def test_scheduler_deadlines() -> None:
+    """Test that the scheduled functions run in the order of their deadlines."""
+    scheduler = AcquisitionScheduler(n_workers=1)
+    assert "running" in repr(scheduler)
+    executors = [scheduler._create_executor() for _ in range(3)]
+    calls = []
+    for k, (executor, delay) in enumerate(
+        zip(executors, (0.1, 0.05, 0.15), strict=True)
+    ):
+        executor.schedule(delay, lambda k=k: calls.append((k, time.perf_counter())))
+    start = time.perf_counter()
+    time.sleep(0.3)
+    assert [k for k, _ in calls] == [1, 0, 2]
+    for (_, tic), delay in zip(calls, (0.05, 0.1, 0.15), strict=True):
+        assert delay - 0.04 <= tic - start
+    scheduler.shutdown()
+    assert "stopped" in repr(scheduler)
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        executors[0].submit(lambda: None)
+    with pytest.raises(RuntimeError, match="was shutdown"):
+        scheduler._create_executor()
+    scheduler.shutdown()  # no-op
+
+
+def test_scheduler_shutdown_executor() -> None:
+    """Test shutting down the executor of a single stream."""
+    scheduler = AcquisitionScheduler(n_workers=2)
+    executor = scheduler._create_executor()
+    other = scheduler._create_executor()
+    running = threading.Event()
+    n_calls = [0, 0]
+
+    def job() -> None:
+        running.set()
+        time.sleep(0.1)
+        n_calls[0] += 1
+        try:
+            executor.schedule(0.01, job)
+        except RuntimeError:
+            pass  # shutdown
+
+    def other_job() -> None:
+        n_calls[1] += 1
+        other.schedule(0.01, other_job)
+
+    executor.submit(job)
+    other.submit(other_job)
+    running.wait()
+    executor.shutdown(wait=True, cancel_futures=True)
+    # the running job completed and did not re-schedule itself
+    n_job = n_calls[0]
+    assert 1 <= n_job
+    n_other = n_calls[1]
+    time.sleep(0.2)
+    assert n_calls[0] == n_job
+    assert n_other < n_calls[1]  # the other executor is unaffected
+    # a worker never waits for itself
+    executor = scheduler._create_executor()
+    done = threading.Event()
+
+    def self_shutdown() -> None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        done.set()
+
+    executor.submit(self_shutdown)
+    assert done.wait(1)
+    scheduler.shutdown()
+
+
+def test_scheduler_invalid() -> None:
+    """Test invalid arguments."""
+    with pytest.raises(TypeError, match="must be an integer"):
+        AcquisitionScheduler(n_workers=1.5)
+    with pytest.raises(ValueError, match="must be a strictly positive integer"):
+        AcquisitionScheduler(n_workers=0)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from mne_lsl.stream._stats import AcquisitionStats
+
+
+def test_acquisition_stats() -> None:
+    """Test the rolling statistics of an acquisition loop."""
+    stats = AcquisitionStats(window=10)
+    assert stats.summary() == dict()
+    for k in range(15):
+        stats.add("metric", k)
+    summary = stats.summary()
+    assert list(summary) == ["metric"]
+    assert summary["metric"]["n"] == 15
+    assert summary["metric"]["max"] == 14  # values 5 to 14 are retained
+    assert summary["metric"]["p50"] == pytest.approx(np.median(np.arange(5, 15)))
+    assert summary["metric"]["p99"] == pytest.approx(
+        np.percentile(np.arange(5, 15), 99)
+    )
+    # partially filled window
+    stats.add("other", 2.0)
+    assert stats.summary()["other"] == dict(n=1, p50=2.0, p99=2.0, max=2.0)
+
+
+def test_acquisition_stats_timing() -> None:
+    """Test the timing of the stages of an acquisition loop."""
+    stats = AcquisitionStats(window=10)
+    start = stats.start()
+    time.sleep(0.01)
+    tic = stats.lap("stage", start)
+    assert start < tic
+    assert "period" not in stats.summary()  # a single start
+    stats.start()
+    summary = stats.summary()
+    assert 0.01 <= summary["stage"]["max"]
+    assert 0.01 <= summary["period"]["max"]
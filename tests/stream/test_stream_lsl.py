@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import multiprocessing as mp
 import os
 import re
+import threading
 import time
 import uuid
+from contextlib import aclosing
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
 from matplotlib import pyplot as plt
-from mne import Info, create_info, pick_info, pick_types
+from mne import Info, Projection, create_info, pick_info, pick_types
 from mne._fiff.constants import FIFF
 from mne._fiff.pick import _picks_to_idx
 from mne.channels import DigMontage
@@ -25,6 +28,7 @@ from scipy.signal import find_peaks
 
 from mne_lsl.lsl import StreamInfo, StreamOutlet
 from mne_lsl.stream import StreamLSL as Stream
+from mne_lsl.stream import StreamReader
 from mne_lsl.utils._tests import match_stream_and_raw_data
 from mne_lsl.utils.logs import _use_log_level
 
@@ -183,7 +187,7 @@ def test_stream_invalid() -> None:
         Stream(1, stype=101)
     with pytest.raises(TypeError, match="must be an instance of str"):
         Stream(1, source_id=101)
-    with pytest.raises(ValueError, match="must be a strictly positive number"):
+    with pytest.raises(ValueError, match="must be a positive number"):
         Stream(bufsize=2).connect(acquisition_delay=-1)
 
 
@@ -530,6 +534,147 @@ def test_stream_get_data_picks(
     stream.disconnect()
 
 
+def test_stream_get_data_picks_cache(mock_lsl_stream: DummyPlayer) -> None:
+    """Test that the cached channel selections follow the changes of channels."""
+    stream = Stream(
+        bufsize=2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=None)
+    _sleep_until_new_data(1e-6, mock_lsl_stream)
+    stream.acquire()
+    n_eeg = len(stream.get_channel_types(picks="eeg"))
+    data, _ = stream.get_data(picks="eeg")
+    assert data.shape[0] == n_eeg
+    assert 0 < len(stream._picks_cache)
+    stream.set_channel_types({"F7": "misc"}, on_unit_change="ignore")
+    data, _ = stream.get_data(picks="eeg")
+    assert data.shape[0] == n_eeg - 1
+    stream.rename_channels({"F2": "F2-renamed"})
+    data, _ = stream.get_data(picks=["F2-renamed", "F4"])
+    assert data.shape[0] == 2
+    stream.add_reference_channels("CPz")
+    data, _ = stream.get_data(picks="eeg")
+    assert data.shape[0] == n_eeg
+    stream.drop_channels("CPz")
+    data, _ = stream.get_data(picks="eeg")
+    assert data.shape[0] == n_eeg - 1
+    stream.info["bads"] = ["F4"]
+    data, _ = stream.get_data(picks="eeg")
+    assert data.shape[0] == n_eeg - 2
+    stream.disconnect()
+
+
+def test_stream_get_data_out(mock_lsl_stream: DummyPlayer) -> None:
+    """Test retrieving data in pre-allocated arrays."""
+    stream = Stream(
+        bufsize=2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=None)
+    _sleep_until_new_data(1e-6, mock_lsl_stream)
+    stream.acquire()
+    for picks in (None, "eeg", ["F7", "vEOG", "F2"]):
+        data, ts = stream.get_data(winsize=0.05, picks=picks)
+        out = np.empty_like(data)
+        out_ts = np.empty_like(ts)
+        data_out, ts_out = stream.get_data(
+            winsize=0.05, picks=picks, out=out, out_ts=out_ts
+        )
+        assert data_out is out
+        assert ts_out is out_ts
+        assert_allclose(out, data)
+        assert_allclose(out_ts, ts)
+    # entire buffer, only data in a pre-allocated array
+    data, ts = stream.get_data()
+    out = np.empty((len(stream.ch_names), stream.n_buffer), dtype=stream.dtype)
+    data_out, ts_out = stream.get_data(out=out)
+    assert data_out is out
+    assert_allclose(out, data)
+    assert_allclose(ts_out, ts)
+    with pytest.raises(ValueError, match="must be an array of shape"):
+        stream.get_data(winsize=0.1, out=out)
+    with pytest.raises(ValueError, match="must be an array of dtype"):
+        stream.get_data(out_ts=np.empty(stream.n_buffer, dtype=np.float32))
+    # the arrays returned are not views on the buffer written in-place
+    data_copy = data.copy()
+    data_picks, _ = stream.get_data(winsize=0.05, picks="Samples")
+    data_picks_copy = data_picks.copy()
+    _sleep_until_new_data(1e-6, mock_lsl_stream)
+    stream.acquire()
+    assert 0 < stream.n_new_samples
+    assert_allclose(data, data_copy)
+    assert_allclose(data_picks, data_picks_copy)
+    stream.disconnect()
+
+
+def test_stream_acquisition_on_arrival(
+    mock_lsl_stream: DummyPlayer, raw: BaseRaw
+) -> None:
+    """Test the acquisition of new samples as soon as they arrive."""
+    stream = Stream(
+        bufsize=2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0)
+    with pytest.raises(RuntimeError, match="should not be called"):
+        stream.acquire()
+    time.sleep(0.5)
+    assert 0 < stream.n_new_samples
+    data, _ = stream.get_data(winsize=0.2)
+    match_stream_and_raw_data(data, raw)
+    # the acquisition is interrupted and resumed while no sample is pulled
+    stream.filter(1, 40, picks="eeg")
+    stream.get_data()
+    time.sleep(0.5)
+    assert 0 < stream.n_new_samples
+    assert stream.metrics["n_overrun"] == 0
+    start = time.perf_counter()
+    stream.disconnect()
+    assert time.perf_counter() - start < 1
+
+
+def test_stream_interrupt_acquisition(mock_lsl_stream: DummyPlayer) -> None:
+    """Test pausing the acquisition without tearing down the acquisition thread."""
+    stream = Stream(
+        bufsize=2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=0.01)
+    executor = stream._executor
+    time.sleep(0.2)
+    with stream._interrupt_acquisition():
+        n_samples_acquired = stream._n_samples_acquired
+        time.sleep(0.2)
+        assert stream._n_samples_acquired == n_samples_acquired
+    time.sleep(0.2)
+    assert n_samples_acquired < stream._n_samples_acquired
+    stream.pick("eeg")
+    stream.filter(1, 40)
+    assert stream._executor is executor
+    n_samples_acquired = stream._n_samples_acquired
+    time.sleep(0.2)
+    assert n_samples_acquired < stream._n_samples_acquired
+    stream.disconnect()
+
+
+def test_stream_get_data_out_wrap(mock_lsl_stream: DummyPlayer, raw: BaseRaw) -> None:
+    """Test retrieving data in pre-allocated arrays from a window wrapping around."""
+    stream = Stream(
+        bufsize=0.5, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    ).connect(acquisition_delay=None)
+    picks = [stream.ch_names[k] for k in (0, 3, 4, 10, 7)]
+    assert picks[0] == "Samples"
+    raw_ = raw.copy().pick(picks)
+    out = np.empty((len(picks), stream.n_buffer), dtype=stream.dtype)
+    out_ts = np.empty(stream.n_buffer)
+    n_checks = 0
+    for _ in range(10):
+        _sleep_until_new_data(1e-6, mock_lsl_stream)
+        stream.acquire()
+        n_acquired = stream._n_samples_acquired
+        if n_acquired < stream.n_buffer or n_acquired % stream.n_buffer == 0:
+            continue  # the buffer is not filled or the window does not wrap around
+        stream.get_data(picks=picks, out=out, out_ts=out_ts)
+        match_stream_and_raw_data(out, raw_)
+        assert_allclose(1 / np.diff(out_ts), stream.info["sfreq"])
+        n_checks += 1
+    assert 0 < n_checks
+    stream.disconnect()
+
+
 @pytest.mark.slow
 def test_stream_n_new_samples(
     mock_lsl_stream: DummyPlayer, caplog: pytest.LogCaptureFixture
@@ -545,17 +690,218 @@ def test_stream_n_new_samples(
     _, _ = stream.get_data()
     # between the above call and this one, samples could come in... but likely not many
     assert stream.n_new_samples <= mock_lsl_stream.chunk_size
+    n_overrun = stream.metrics["n_overrun"]
+    assert 0 < n_overrun  # the buffer overran during the first sleep
     with _use_log_level("INFO"):
         caplog.set_level(20)  # INFO
         caplog.clear()
         time.sleep(1.6)
-        assert "new samples exceeds the buffer size" in caplog.text
+        # the overrun is logged once, then counted
+        assert "new samples exceeds the buffer size" not in caplog.text
+    assert n_overrun < stream.metrics["n_overrun"]
     _, _ = stream.get_data(winsize=0.1)
     # between the above call and this one, samples could come in... but likely not many
     assert stream.n_new_samples <= mock_lsl_stream.chunk_size
     stream.disconnect()
 
 
+@pytest.mark.slow
+def test_stream_get_new_data(mock_lsl_stream: DummyPlayer, raw: BaseRaw) -> None:
+    """Test retrieving each new sample once."""
+    stream = Stream(
+        bufsize=0.4, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    )
+    with pytest.raises(RuntimeError, match="Stream is not connected"):
+        stream.get_new_data()
+    stream.connect(acquisition_delay=0.01)
+    time.sleep(2)  # give a bit of time to slower CIs
+    # the buffer overran since the connection
+    data, ts, overrun = stream.get_new_data()
+    assert overrun
+    assert data.shape == (len(stream.ch_names), stream.n_buffer)
+    assert ts.size == stream.n_buffer
+    # the number of new samples is not reset, contrary to get_data()
+    assert stream.n_buffer <= stream.n_new_samples
+    # consecutive calls return consecutive samples, the first channel contains the
+    # sample index in the file played.
+    samples = [data[0, :]]
+    for _ in range(5):
+        _sleep_until_new_data(0.01, mock_lsl_stream)
+        data, ts_new, overrun = stream.get_new_data(picks="Samples")
+        assert not overrun
+        assert data.shape == (1, ts_new.size)
+        samples.append(data[0, :])
+        ts = np.concatenate((ts, ts_new))
+    samples = np.concatenate(samples)
+    assert_allclose(np.diff(samples) % raw.times.size, 1)
+    assert_allclose(1 / np.diff(ts), stream.info["sfreq"])
+    stream.disconnect()
+
+
+def test_stream_stats(mock_lsl_stream: DummyPlayer) -> None:
+    """Test the statistics of the acquisition loop."""
+    stream = Stream(
+        bufsize=2.0, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    )
+    with pytest.raises(RuntimeError, match="Please connect to the stream"):
+        stream.enable_stats()
+    stream.connect()
+    assert stream.stats is None
+    with pytest.raises(ValueError, match="must be a strictly positive integer"):
+        stream.enable_stats(window=0)
+    stream.enable_stats(window=100)
+    stream.filter(1, 40, picks="eeg")
+    time.sleep(1)
+    stats = stream.stats
+    stages = ("pull", "spatial", "filters", "callbacks", "write", "total")
+    for metric in ("period", "n_samples", *stages):
+        assert metric in stats
+        assert 0 < stats[metric]["n"]
+        assert stats[metric]["p50"] <= stats[metric]["p99"] <= stats[metric]["max"]
+    assert "decimate" not in stats
+    assert 0 < stats["n_samples"]["max"]
+    assert stats["filters"]["max"] <= stats["total"]["max"]
+    assert 0 <= stats["wakeup"]["p50"]
+    # the wake-up delay is also recorded with a per-stream sleep strategy
+    stream.set_sleep_strategy("deadline", spin=0)
+    n_wakeup = stream.stats["wakeup"]["n"]
+    time.sleep(0.2)
+    assert n_wakeup < stream.stats["wakeup"]["n"]
+    with pytest.raises(ValueError, match="Invalid value for the 'method' parameter"):
+        stream.set_sleep_strategy("spin")
+    stream.set_sleep_strategy(None)
+    assert stream._sleep_strategy is None
+    stream.disable_stats()
+    assert stream.stats is None
+    stream.disconnect()
+
+
+def test_stream_metrics(mock_lsl_stream: DummyPlayer) -> None:
+    """Test the end-to-end metrics of the acquisition."""
+    stream = Stream(
+        bufsize=0.1, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    )
+    with pytest.raises(RuntimeError, match="Please connect to the stream"):
+        _ = stream.metrics
+    stream.connect(acquisition_delay=0.01)
+    stream.enable_stats()
+    time.sleep(0.5)
+    metrics = stream.metrics
+    assert 0 < metrics["n_overrun"]
+    assert metrics["n_truncated"] == 0
+    assert metrics["clock_drift"] == 0
+    assert metrics["latency"] is not None
+    # the player timestamps the chunks pushed ahead of time, thus the latency measured
+    # on the mock stream can be negative
+    assert abs(metrics["latency"]) < 1
+    assert 0 < stream.stats["latency"]["n"]
+    stream.disconnect()
+    with pytest.raises(RuntimeError, match="Please connect to the stream"):
+        _ = stream.metrics
+
+
+@pytest.mark.slow
+def test_stream_readers(mock_lsl_stream: DummyPlayer, raw: BaseRaw) -> None:
+    """Test independent readers attached to a stream."""
+    stream = Stream(
+        bufsize=0.4, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    )
+    with pytest.raises(RuntimeError, match="Stream is not connected"):
+        stream.create_reader()
+    stream.connect(acquisition_delay=0.01)
+    reader1 = stream.create_reader()
+    reader2 = stream.create_reader("decoder")
+    assert reader1.name == "reader-0"
+    assert reader2.name == "decoder"
+    assert reader1.stream is stream
+    with pytest.raises(ValueError, match="already attached"):
+        stream.create_reader("decoder")
+    with pytest.raises(TypeError, match="must be an instance of"):
+        stream.create_reader(101)
+    # a reader reading often does not lose samples while a slow reader overruns and
+    # the reads do not affect each other or the stream.
+    time.sleep(0.5)  # give a bit of time to slower CIs
+    reader1.get_new_data()
+    n_overrun = reader1.n_overrun
+    samples = list()
+    for _ in range(5):
+        _sleep_until_new_data(0.01, mock_lsl_stream)
+        data, _, overrun = reader1.get_new_data(picks="Samples")
+        assert not overrun
+        samples.append(data[0, :])
+    samples = np.concatenate(samples)
+    assert_allclose(np.diff(samples) % raw.times.size, 1)
+    assert reader1.n_overrun == n_overrun
+    assert 0 < stream.n_new_samples
+    time.sleep(1)
+    assert stream.n_buffer < reader2.n_new_samples
+    data, ts, overrun = reader2.get_new_data()
+    assert overrun
+    assert 0 < reader2.n_overrun
+    assert data.shape == (len(stream.ch_names), stream.n_buffer)
+    assert_allclose(1 / np.diff(ts), stream.info["sfreq"])
+    data, _, overrun = reader1.get_new_data()
+    assert overrun
+    # closing a reader detaches it from the stream and frees its name
+    reader2.close()
+    assert reader2 not in stream._readers
+    with pytest.raises(RuntimeError, match="not attached to a connected Stream"):
+        reader2.get_new_data()
+    with pytest.raises(RuntimeError, match="not attached to a connected Stream"):
+        reader2.close()
+    reader3 = stream.create_reader("decoder")
+    assert isinstance(reader3, StreamReader)
+    stream.disconnect()
+    with pytest.raises(RuntimeError, match="not attached to a connected Stream"):
+        reader1.get_new_data()
+
+
+def test_stream_aiter_chunks(mock_lsl_stream: DummyPlayer, raw: BaseRaw) -> None:
+    """Test the asynchronous iteration over the new samples."""
+    stream = Stream(
+        bufsize=2, name=mock_lsl_stream.name, source_id=mock_lsl_stream.source_id
+    )
+    with pytest.raises(RuntimeError, match="Stream is not connected"):
+        asyncio.run(anext(stream.aiter_chunks()))
+    stream.connect(acquisition_delay=0.01)
+    with pytest.raises(ValueError, match="could not be interpreted"):
+        asyncio.run(anext(stream.aiter_chunks(picks="101")))
+
+    async def consume(n_chunks: int) -> list[tuple[NDArray, NDArray]]:
+        chunks = list()
+        async with aclosing(stream.aiter_chunks(picks="Samples")) as iterator:
+            async for data, ts in iterator:
+                chunks.append((data, ts))
+                if len(chunks) == n_chunks:
+                    break
+        return chunks
+
+    async def consume_concurrently() -> list[list[tuple[NDArray, NDArray]]]:
+        return await asyncio.gather(consume(5), consume(8))
+
+    # each iterator retrieves every new sample once, independently of the others
+    for chunks in asyncio.run(asyncio.wait_for(consume_concurrently(), timeout=5)):
+        samples = np.concatenate([data[0, :] for data, _ in chunks])
+        assert_allclose(np.diff(samples) % raw.times.size, 1)
+        ts = np.concatenate([ts for _, ts in chunks])
+        assert np.all(0 < np.diff(ts))
+    assert len(stream._readers) == 0  # closed with the iterators
+
+    # the iteration stops on disconnection
+    async def consume_until_disconnection() -> int:
+        n_chunks = 0
+        async for _ in stream.aiter_chunks():
+            n_chunks += 1
+        return n_chunks
+
+    timer = threading.Timer(0.3, stream.disconnect)
+    timer.start()
+    n_chunks = asyncio.run(asyncio.wait_for(consume_until_disconnection(), timeout=5))
+    timer.join()
+    assert 0 < n_chunks
+    assert not stream.connected
+
+
 def test_stream_invalid_interrupt(mock_lsl_stream: DummyPlayer) -> None:
     """Test invalid acquisition interruption."""
     stream = Stream(
@@ -714,6 +1060,74 @@ def test_stream_rereference_average(mock_lsl_stream_int: DummyPlayer) -> None:
     stream.disconnect()
 
 
+def test_stream_spatial_filter(
+    mock_lsl_stream_int: DummyPlayer, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test spatial filters and projectors folded in a single operator."""
+    stream = Stream(
+        bufsize=0.4,
+        name=mock_lsl_stream_int.name,
+        source_id=mock_lsl_stream_int.source_id,
+    ).connect()
+    time.sleep(2)  # give a bit of time to slower CIs
+    with pytest.raises(TypeError, match="must be an instance of"):
+        stream.apply_spatial_filter(np.eye(5).tolist())
+    with pytest.raises(ValueError, match="must be an array of shape"):
+        stream.apply_spatial_filter(np.eye(4))
+    with pytest.raises(ValueError, match="only finite values"):
+        stream.apply_spatial_filter(np.full((5, 5), np.nan))
+    assert stream._spatial_operator is None
+    # bipolar derivation 1-0 replacing the channel 1 and gain on channel 2
+    matrix = np.eye(5)
+    matrix[1, 0] = -1
+    matrix[2, 2] = 2
+    stream.apply_spatial_filter(matrix)
+    data_ref = np.array([0, 1, 4, 3, 4]).reshape(-1, 1)
+    data, _ = stream.get_data()
+    assert_allclose(data, np.broadcast_to(data_ref, data.shape))
+    _sleep_until_new_data(stream._acquisition_delay, mock_lsl_stream_int)
+    data, _ = stream.get_data()
+    assert_allclose(data, np.broadcast_to(data_ref, data.shape))
+    with pytest.raises(RuntimeError, match="before applying a spatial filter"):
+        stream.drop_channels("4")
+    # projectors
+    caplog.set_level(logging.INFO)
+    caplog.clear()
+    with _use_log_level("INFO"):
+        stream.apply_proj()
+    assert "no inactive projectors" in caplog.text
+    proj = Projection(
+        data=dict(
+            nrow=1,
+            ncol=5,
+            row_names=None,
+            col_names=stream.ch_names,
+            data=np.ones((1, 5)) / np.sqrt(5),
+        ),
+        active=False,
+        desc="mean",
+    )
+    with stream.info._unlock():
+        stream.info["projs"].append(proj)
+    stream.apply_proj()
+    assert stream.info["projs"][0]["active"]
+    data_ref = data_ref - data_ref.mean()
+    data, _ = stream.get_data()
+    assert_allclose(data, np.broadcast_to(data_ref, data.shape), atol=1e-5)
+    _sleep_until_new_data(stream._acquisition_delay, mock_lsl_stream_int)
+    data, _ = stream.get_data()
+    assert_allclose(data, np.broadcast_to(data_ref, data.shape), atol=1e-5)
+    # added channels are folded in the operator
+    stream.add_reference_channels("5")
+    assert stream._spatial_operator.shape == (5, 6)
+    _sleep_until_new_data(stream._acquisition_delay, mock_lsl_stream_int)
+    data, _ = stream.get_data()
+    data_ref = np.vstack((data_ref, [[0]]))
+    assert_allclose(data, np.broadcast_to(data_ref, data.shape), atol=1e-5)
+    stream.disconnect()
+    assert stream._spatial_operator is None
+
+
 @pytest.mark.slow
 def test_stream_callback(mock_lsl_stream_int: DummyPlayer) -> None:
     """Test adding a callback function to a stream."""
@@ -1186,6 +1600,68 @@ def test_stream_notch_filter(
     stream.disconnect()
 
 
+def test_stream_filter_fir(
+    mock_lsl_stream_sinusoids: DummyPlayer, raw_sinusoids: BaseRaw
+) -> None:
+    """Test stream FIR filters."""
+    freqs = fftfreq(raw_sinusoids.times.size, 1 / raw_sinusoids.info["sfreq"])
+    idx = np.where(0 <= freqs)[0]
+    fft_orig = np.abs(fft(raw_sinusoids.get_data(), axis=-1)[:, idx])
+    peaks, _ = find_peaks(fft_orig[0, :], height=100)  # 10 Hz and 30 Hz
+    heights = fft_orig[0, peaks]
+    stream = Stream(
+        bufsize=2.0,
+        name=mock_lsl_stream_sinusoids.name,
+        source_id=mock_lsl_stream_sinusoids.source_id,
+    ).connect()
+    with pytest.raises(ValueError, match="Invalid value for the 'method' parameter"):
+        stream.filter(None, 20, picks="10-30", method="101")
+    stream.filter(None, 20, picks="10-30", method="fir")
+    assert len(stream.filters) == 1
+    assert "FIR causal filter" in repr(stream.filters[0])
+    time.sleep(2.5)
+    fft_ = np.abs(fft(stream.get_data()[0], axis=-1)[:, idx])
+    assert_allclose(fft_[0, peaks][0], heights[0], rtol=0.05)  # 10 Hz retained
+    assert fft_[0, peaks][1] < 0.1 * heights[1]  # 30 Hz removed
+    stream.disconnect()
+
+
+def test_stream_notch_filter_multiple_freqs(
+    mock_lsl_stream_sinusoids: DummyPlayer, raw_sinusoids: BaseRaw
+) -> None:
+    """Test stream notch filter on multiple frequencies."""
+    freqs = fftfreq(raw_sinusoids.times.size, 1 / raw_sinusoids.info["sfreq"])
+    idx = np.where(0 <= freqs)[0]
+    fft_orig = np.abs(fft(raw_sinusoids.get_data(), axis=-1)[:, idx])
+    heights_orig = dict()
+    for k in range(fft_orig.shape[0]):
+        peaks, _ = find_peaks(fft_orig[k, :], height=100)  # peak height is 1000
+        heights_orig[k] = dict(idx=peaks, heights=fft_orig[k, peaks])
+    stream = Stream(
+        bufsize=2.0,
+        name=mock_lsl_stream_sinusoids.name,
+        source_id=mock_lsl_stream_sinusoids.source_id,
+    ).connect()
+    stream.notch_filter([30, 50], picks="all", notch_widths=[0.15, 0.25])
+    assert len(stream.filters) == 1
+    assert "notch filter @ 30.0, 50.0 Hz" in repr(stream.filters[0])
+    time.sleep(2.5)
+    fft_ = np.abs(fft(stream.get_data()[0], axis=-1)[:, idx])
+    # 10 Hz retained, 30 Hz removed
+    assert_allclose(
+        fft_[0, heights_orig[0]["idx"]][0], heights_orig[0]["heights"][0], rtol=0.05
+    )
+    assert fft_[0, heights_orig[0]["idx"]][1] < 0.1 * heights_orig[0]["heights"][1]
+    # 30 Hz removed, 50 Hz removed
+    assert np.all(fft_[1, heights_orig[1]["idx"]] < 0.1 * heights_orig[1]["heights"])
+    # 30 Hz removed, 100 Hz retained
+    assert fft_[2, heights_orig[2]["idx"]][0] < 0.1 * heights_orig[2]["heights"][0]
+    assert_allclose(
+        fft_[2, heights_orig[2]["idx"]][1], heights_orig[2]["heights"][1], rtol=0.05
+    )
+    stream.disconnect()
+
+
 def test_stream_notch_filter_invalid(mock_lsl_stream_sinusoids: DummyPlayer) -> None:
     """Test invalid notch filter."""
     stream = Stream(
@@ -1208,6 +1684,55 @@ def test_stream_notch_filter_invalid(mock_lsl_stream_sinusoids: DummyPlayer) ->
         stream.notch_filter(101, trans_bandwidth="101")
     with pytest.raises(ValueError, match="ransition bandwidth must be a positive"):
         stream.notch_filter(101, trans_bandwidth=-101)
+    with pytest.raises(TypeError, match="must be an instance of"):
+        stream.notch_filter([50, "101"])
+    with pytest.raises(ValueError, match="frequency must be a positive number"):
+        stream.notch_filter([50, -101])
+    with pytest.raises(ValueError, match="non-empty 1D array-like"):
+        stream.notch_filter([])
+    with pytest.raises(ValueError, match="one width per frequency"):
+        stream.notch_filter([50, 100, 150], notch_widths=[1, 2])
+    stream.disconnect()
+
+
+def test_stream_decimate(
+    mock_lsl_stream_sinusoids: DummyPlayer, raw_sinusoids: BaseRaw
+) -> None:
+    """Test stream decimation."""
+    stream = Stream(
+        bufsize=2.0,
+        name=mock_lsl_stream_sinusoids.name,
+        source_id=mock_lsl_stream_sinusoids.source_id,
+    ).connect()
+    with pytest.raises(TypeError, match="must be an integer"):
+        stream.decimate(2.5)
+    with pytest.raises(ValueError, match="must be a strictly positive integer"):
+        stream.decimate(0)
+    with pytest.raises(ValueError, match="integer factor is supported"):
+        stream.resample(300)
+    stream.decimate(1)
+    assert stream.info["sfreq"] == raw_sinusoids.info["sfreq"]
+    stream.resample(125)  # decimation by 8, from 1 kHz to 125 Hz
+    assert stream.info["sfreq"] == 125
+    assert stream.info["lowpass"] == 62.5
+    assert stream.n_buffer == 250
+    time.sleep(2.5)
+    data, ts = stream.get_data()
+    assert data.shape == (3, 250)
+    assert_allclose(np.median(np.diff(ts)), 1 / 125, atol=1e-4)
+    freqs = fftfreq(ts.size, 1 / 125)
+    fft_ = np.abs(fft(data, axis=-1))
+    idx = {fq: np.argmin(np.abs(freqs - fq)) for fq in (10, 25, 30, 50)}
+    height = ts.size / 2  # height of the peak of a sinusoid of amplitude 1
+    # 10, 30 and 50 Hz retained, 100 Hz (aliased on 25 Hz) removed
+    assert_allclose(fft_[0, [idx[10], idx[30]]], height, rtol=0.1)
+    assert_allclose(fft_[1, [idx[30], idx[50]]], height, rtol=0.1)
+    assert_allclose(fft_[2, idx[30]], height, rtol=0.1)
+    assert fft_[2, idx[25]] < 0.05 * height
+    # invalid after filters
+    stream.filter(None, 20, picks="10-30")
+    with pytest.raises(RuntimeError, match="must be done before adding filters"):
+        stream.decimate(2)
     stream.disconnect()
 
 
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import time
 
-from mne_lsl.utils._time import high_precision_sleep
+import pytest
+
+from mne_lsl import set_sleep_strategy
+from mne_lsl.utils._time import SleepStrategy, get_sleep_strategy, high_precision_sleep
 
 
 def test_high_precision_sleep() -> None:
@@ -14,3 +17,59 @@ def test_high_precision_sleep() -> None:
     # test value which should return right away
     high_precision_sleep(0)
     high_precision_sleep(-1)
+
+
+@pytest.mark.parametrize("method", ["deadline", "hybrid", "sleep"])
+def test_sleep_strategy(method: str) -> None:
+    """Test the sleep strategies."""
+    strategy = SleepStrategy(method, spin=0.001)
+    assert strategy.method == method
+    assert strategy.spin == (0 if method == "sleep" else 0.001)
+    assert method in repr(strategy)
+    start = time.perf_counter()
+    lateness = strategy(0.05)
+    assert 0.05 <= time.perf_counter() - start
+    assert 0 <= lateness
+    assert strategy(0) == 0
+    assert strategy(-1) == 0
+
+
+def test_sleep_strategy_deadline() -> None:
+    """Test that the deadlines of a periodic loop do not drift."""
+    strategy = SleepStrategy("deadline")
+    start = time.perf_counter()
+    for _ in range(10):
+        time.sleep(0.005)  # work done between 2 waits
+        strategy(0.02)
+    # with relative waits, the loop would last at least 10 * (0.005 + 0.02) seconds
+    assert time.perf_counter() - start < 0.24
+    # the schedule is reset after a missed deadline
+    time.sleep(0.1)
+    start = time.perf_counter()
+    strategy(0.02)
+    assert 0.02 <= time.perf_counter() - start
+
+
+def test_sleep_strategy_invalid() -> None:
+    """Test invalid sleep strategies."""
+    with pytest.raises(ValueError, match="Invalid value for the 'method' parameter"):
+        SleepStrategy("spin")
+    with pytest.raises(TypeError, match="must be an instance of"):
+        SleepStrategy(spin="0.001")
+    with pytest.raises(ValueError, match="must be a positive number"):
+        SleepStrategy(spin=-1)
+
+
+def test_set_sleep_strategy() -> None:
+    """Test setting the default sleep strategy."""
+    default = get_sleep_strategy()
+    assert default.method == "hybrid"
+    try:
+        set_sleep_strategy("sleep")
+        assert get_sleep_strategy().method == "sleep"
+        start = time.perf_counter()
+        high_precision_sleep(0.05)
+        assert 0.05 <= time.perf_counter() - start
+    finally:
+        set_sleep_strategy(default.method, default.spin)
+    assert get_sleep_strategy().method == "hybrid"